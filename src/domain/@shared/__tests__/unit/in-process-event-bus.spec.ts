@@ -0,0 +1,165 @@
+import { UniqueEntityId } from "../../entities/unique-entity-id.entity";
+import { DomainEvent } from "../../events/domain-event";
+import { DomainEvents } from "../../events/domain-events";
+import { InMemoryEventHandlerMetrics } from "../../events/event-handler-metrics";
+import { InProcessEventBus } from "../../events/in-process-event-bus";
+
+class TestEvent implements DomainEvent {
+    public ocurredAt = new Date();
+
+    constructor(private id: string) {}
+
+    getAggregateId(): UniqueEntityId {
+        return new UniqueEntityId(this.id);
+    }
+}
+
+const deferred = () => {
+    let resolve!: () => void;
+    const promise = new Promise<void>((res) => (resolve = res));
+    return { promise, resolve };
+};
+
+describe("InProcessEventBus", () => {
+    it("should handle events in the background without blocking publishers", async () => {
+        const gate = deferred();
+        const dispatch = jest.fn().mockImplementation(() => gate.promise);
+        const bus = new InProcessEventBus(dispatch);
+
+        await bus.publish(new TestEvent("a"));
+
+        expect(dispatch).toHaveBeenCalledTimes(1);
+        expect(bus.size).toBe(1);
+
+        gate.resolve();
+        await bus.drain();
+
+        expect(bus.size).toBe(0);
+    });
+
+    it("should not handle more events at once than its concurrency", async () => {
+        const gate = deferred();
+        let active = 0;
+        let maxActive = 0;
+        const bus = new InProcessEventBus(
+            async () => {
+                active++;
+                maxActive = Math.max(maxActive, active);
+                await gate.promise;
+                active--;
+            },
+            { concurrency: 2 },
+        );
+
+        for (const id of ["a", "b", "c", "d", "e"]) {
+            await bus.publish(new TestEvent(id));
+        }
+
+        expect(maxActive).toBe(2);
+
+        gate.resolve();
+        await bus.drain();
+
+        expect(maxActive).toBe(2);
+    });
+
+    it("should hold publishers back while the queue is full", async () => {
+        const gate = deferred();
+        const bus = new InProcessEventBus(() => gate.promise, { concurrency: 1, maxQueueSize: 1 });
+
+        await bus.publish(new TestEvent("running"));
+        await bus.publish(new TestEvent("queued"));
+
+        let accepted = false;
+        const publishing = bus.publish(new TestEvent("waiting")).then(() => (accepted = true));
+
+        await new Promise((resolve) => setImmediate(resolve));
+        expect(accepted).toBe(false);
+
+        gate.resolve();
+        await publishing;
+        await bus.drain();
+
+        expect(accepted).toBe(true);
+    });
+
+    it("should report handler failures without stopping the queue", async () => {
+        const onError = jest.fn();
+        const dispatch = jest.fn().mockRejectedValueOnce(new Error("boom")).mockResolvedValue(undefined);
+        const bus = new InProcessEventBus(dispatch, { onError });
+
+        await bus.publish(new TestEvent("a"));
+        await bus.publish(new TestEvent("b"));
+        await bus.drain();
+
+        expect(dispatch).toHaveBeenCalledTimes(2);
+        expect(onError).toHaveBeenCalledWith(expect.any(TestEvent), expect.any(Error));
+    });
+
+    it("should queue events published inside a transaction once it commits", async () => {
+        const callbacks: (() => void | Promise<void>)[] = [];
+        const dispatch = jest.fn().mockResolvedValue(undefined);
+        const bus = new InProcessEventBus(dispatch, {
+            transactionProvider: {
+                run: jest.fn(),
+                afterCommit: jest.fn().mockImplementation(async (callback) => {
+                    callbacks.push(callback);
+                }),
+            },
+        });
+
+        await bus.publish(new TestEvent("a"));
+
+        expect(dispatch).not.toHaveBeenCalled();
+
+        await Promise.all(callbacks.map((callback) => callback()));
+        await bus.drain();
+
+        expect(dispatch).toHaveBeenCalledTimes(1);
+    });
+});
+
+describe("DomainEvents.handle", () => {
+    let metrics: InMemoryEventHandlerMetrics;
+
+    beforeEach(() => {
+        DomainEvents.clearHandlers();
+        metrics = new InMemoryEventHandlerMetrics();
+        DomainEvents.useMetrics(metrics);
+    });
+
+    it("should await every handler and record its latency", async () => {
+        const finished: string[] = [];
+
+        DomainEvents.register(async function first() {
+            await new Promise((resolve) => setTimeout(resolve, 5));
+            finished.push("first");
+        }, TestEvent.name);
+        DomainEvents.register(function second() {
+            finished.push("second");
+        }, TestEvent.name);
+
+        await DomainEvents.handle(new TestEvent("a"));
+
+        expect(finished.sort()).toEqual(["first", "second"]);
+
+        const stats = metrics.snapshot();
+        expect(stats["TestEvent:first"]).toEqual(expect.objectContaining({ count: 1, failures: 0 }));
+        expect(stats["TestEvent:first"].maxMs).toBeGreaterThan(0);
+        expect(stats["TestEvent:second"].count).toBe(1);
+    });
+
+    it("should run the remaining handlers and fail when one of them throws", async () => {
+        const other = jest.fn();
+
+        DomainEvents.register(function failing() {
+            throw new Error("boom");
+        }, TestEvent.name);
+        DomainEvents.register(other, TestEvent.name);
+
+        await expect(DomainEvents.handle(new TestEvent("a"))).rejects.toBeInstanceOf(AggregateError);
+
+        expect(other).toHaveBeenCalledTimes(1);
+        expect(metrics.snapshot()["TestEvent:failing"].failures).toBe(1);
+    });
+});
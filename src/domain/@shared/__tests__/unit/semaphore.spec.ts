@@ -0,0 +1,96 @@
+import { Semaphore } from "../../utils/semaphore";
+
+const deferred = () => {
+    let resolve!: () => void;
+    const promise = new Promise<void>((res) => (resolve = res));
+    return { promise, resolve };
+};
+
+const flush = () => new Promise((resolve) => setImmediate(resolve));
+
+describe("Semaphore", () => {
+    it("should not hand out more permits than its limit", async () => {
+        const semaphore = new Semaphore(2);
+
+        await semaphore.acquire();
+        await semaphore.acquire();
+
+        let acquired = false;
+        semaphore.acquire().then(() => (acquired = true));
+        await flush();
+
+        expect(acquired).toBe(false);
+        expect(semaphore.pending).toBe(1);
+    });
+
+    it("should hand released permits to waiters in FIFO order", async () => {
+        const semaphore = new Semaphore(1);
+        const release = await semaphore.acquire();
+        const order: number[] = [];
+
+        const waiters = [1, 2, 3].map((n) =>
+            semaphore.acquire().then((releaseNext) => {
+                order.push(n);
+                releaseNext();
+            }),
+        );
+
+        release();
+        await Promise.all(waiters);
+
+        expect(order).toEqual([1, 2, 3]);
+        expect(semaphore.pending).toBe(0);
+    });
+
+    it("should ignore a release called more than once", async () => {
+        const semaphore = new Semaphore(1);
+        const release = await semaphore.acquire();
+
+        release();
+        release();
+
+        await semaphore.acquire();
+
+        let acquired = false;
+        semaphore.acquire().then(() => (acquired = true));
+        await flush();
+
+        expect(acquired).toBe(false);
+    });
+
+    it("should limit the tasks run at the same time", async () => {
+        const semaphore = new Semaphore(2);
+        const gate = deferred();
+        let running = 0;
+        let maxRunning = 0;
+
+        const tasks = Array.from({ length: 5 }, () =>
+            semaphore.run(async () => {
+                running++;
+                maxRunning = Math.max(maxRunning, running);
+                await gate.promise;
+                running--;
+            }),
+        );
+
+        await flush();
+        expect(running).toBe(2);
+
+        gate.resolve();
+        await Promise.all(tasks);
+
+        expect(maxRunning).toBe(2);
+    });
+
+    it("should release the permit when the task throws", async () => {
+        const semaphore = new Semaphore(1);
+
+        await expect(
+            semaphore.run(async () => {
+                throw new Error("Task failed");
+            }),
+        ).rejects.toThrow("Task failed");
+
+        await expect(semaphore.run(async () => "next")).resolves.toBe("next");
+    });
+});
@@ -0,0 +1,6 @@
+export class HashingUnavailableError extends Error {
+    constructor() {
+        super("Password hashing is saturated, try again shortly");
+        this.name = "HashingUnavailableError";
+    }
+}
@@ -0,0 +1,6 @@
+export class InvalidCursorError extends Error {
+    constructor() {
+        super("Invalid pagination cursor");
+        this.name = "InvalidCursorError";
+    }
+}
@@ -1,45 +1,86 @@
 import { AggregateRoot } from "../entities/aggregate-root.entity";
 import { UniqueEntityId } from "../entities/unique-entity-id.entity";
 import { DomainEvent } from "./domain-event";
+import { EventBus } from "./event-bus";
+import { EventHandlerMetrics, InMemoryEventHandlerMetrics } from "./event-handler-metrics";
+import { InProcessEventBus } from "./in-process-event-bus";
 
-type DomainEventCallback = (event: any) => void;
+type DomainEventCallback = (event: any) => void | Promise<void>;
 
 export class DomainEvents {
     private static handlersMap: Record<string, DomainEventCallback[]> = {};
-    private static markedAggregates: AggregateRoot<any>[] = [];
+    private static markedAggregates = new Map<string, AggregateRoot<any>>();
+    private static bus: EventBus = new InProcessEventBus((event) => DomainEvents.handle(event));
+    private static metrics: EventHandlerMetrics = new InMemoryEventHandlerMetrics();
 
     public static markAggregateForDispatch(aggregate: AggregateRoot<any>) {
-        const aggregateFound = !!this.findMarkedAggregateByID(aggregate.id);
+        const key = aggregate.id.toString();
 
-        if (!aggregateFound) {
-            this.markedAggregates.push(aggregate);
+        if (!this.markedAggregates.has(key)) {
+            this.markedAggregates.set(key, aggregate);
         }
     }
 
-    private static dispatchAggregateEvents(aggregate: AggregateRoot<any>) {
-        aggregate.domainEvents.forEach((event: DomainEvent) => this.dispatch(event));
-    }
+    /**
+     * Publish the pending events of an aggregate through the configured bus.
+     * Resolves once the bus has accepted them; handlers run according to the bus.
+     */
+    public static async dispatchEventsForAggregate(id: UniqueEntityId) {
+        const key = id.toString();
+        const aggregate = this.markedAggregates.get(key);
 
-    private static removeAggregateFromMarkedDispatchList(aggregate: AggregateRoot<any>) {
-        const index = this.markedAggregates.findIndex((a) => a.equals(aggregate));
+        if (aggregate) {
+            const events = aggregate.domainEvents;
 
-        this.markedAggregates.splice(index, 1);
-    }
+            aggregate.clearEvents();
+            this.markedAggregates.delete(key);
 
-    private static findMarkedAggregateByID(id: UniqueEntityId): AggregateRoot<any> | undefined {
-        return this.markedAggregates.find((aggregate) => aggregate.id.equals(id));
+            for (const event of events) {
+                await this.bus.publish(event);
+            }
+        }
     }
 
-    public static dispatchEventsForAggregate(id: UniqueEntityId) {
-        const aggregate = this.findMarkedAggregateByID(id);
-
-        if (aggregate) {
-            this.dispatchAggregateEvents(aggregate);
-            aggregate.clearEvents();
-            this.removeAggregateFromMarkedDispatchList(aggregate);
+    /**
+     * Run every handler registered for the event and wait for all of them.
+     * Fails with an AggregateError when any handler fails, so durable buses can retry
+     * (handlers must therefore be idempotent).
+     */
+    public static async handle(event: DomainEvent): Promise<void> {
+        const eventName = event.constructor.name;
+        const handlers = this.handlersMap[eventName] ?? [];
+        const errors: unknown[] = [];
+
+        await Promise.all(
+            handlers.map(async (handler) => {
+                const startedAt = performance.now();
+                let failed = false;
+
+                try {
+                    await handler(event);
+                } catch (error) {
+                    failed = true;
+                    errors.push(error);
+                } finally {
+                    this.metrics.record({
+                        eventName,
+                        handlerName: handler.name || "anonymous",
+                        durationMs: performance.now() - startedAt,
+                        failed,
+                    });
+                }
+            }),
+        );
+
+        if (errors.length > 0) {
+            throw new AggregateError(errors, `${errors.length} handler(s) failed for ${eventName}`);
         }
     }
 
+    public static hasHandlers(eventClassName: string): boolean {
+        return (this.handlersMap[eventClassName]?.length ?? 0) > 0;
+    }
+
     public static register(callback: DomainEventCallback, eventClassName: string) {
         const wasEventRegisteredBefore = eventClassName in this.handlersMap;
 
@@ -50,25 +91,19 @@ export class DomainEvents {
         this.handlersMap[eventClassName].push(callback);
     }
 
-    public static clearHandlers() {
-        this.handlersMap = {};
+    public static useBus(bus: EventBus) {
+        this.bus = bus;
     }
 
-    public static clearMarkedAggregates() {
-        this.markedAggregates = [];
+    public static useMetrics(metrics: EventHandlerMetrics) {
+        this.metrics = metrics;
     }
 
-    private static dispatch(event: DomainEvent) {
-        const eventClassName: string = event.constructor.name;
-
-        const isEventRegistered = eventClassName in this.handlersMap;
-
-        if (isEventRegistered) {
-            const handlers = this.handlersMap[eventClassName];
+    public static clearHandlers() {
+        this.handlersMap = {};
+    }
 
-            for (const handler of handlers) {
-                handler(event);
-            }
-        }
+    public static clearMarkedAggregates() {
+        this.markedAggregates.clear();
     }
 }
@@ -0,0 +1,11 @@
+import { DomainEvent } from "./domain-event";
+
+export type DomainEventDispatcher = (event: DomainEvent) => Promise<void>;
+
+export interface EventBus {
+    /**
+     * Hand an event over for delivery to its handlers. Resolves once the event has been
+     * accepted (queued or persisted), not when the handlers have run.
+     */
+    publish(event: DomainEvent): Promise<void>;
+}
@@ -0,0 +1,47 @@
+export interface EventHandlerSample {
+    eventName: string;
+    handlerName: string;
+    durationMs: number;
+    failed: boolean;
+}
+
+export interface EventHandlerStats {
+    count: number;
+    failures: number;
+    totalMs: number;
+    maxMs: number;
+}
+
+export interface EventHandlerMetrics {
+    record(sample: EventHandlerSample): void;
+}
+
+/**
+ * Aggregates handler latency per "EventName:handlerName" in memory
+ */
+export class InMemoryEventHandlerMetrics implements EventHandlerMetrics {
+    private stats = new Map<string, EventHandlerStats>();
+
+    record(sample: EventHandlerSample): void {
+        const key = `${sample.eventName}:${sample.handlerName}`;
+        const stats = this.stats.get(key) ?? { count: 0, failures: 0, totalMs: 0, maxMs: 0 };
+
+        stats.count++;
+        stats.totalMs += sample.durationMs;
+        stats.maxMs = Math.max(stats.maxMs, sample.durationMs);
+
+        if (sample.failed) {
+            stats.failures++;
+        }
+
+        this.stats.set(key, stats);
+    }
+
+    snapshot(): Record<string, EventHandlerStats> {
+        return Object.fromEntries([...this.stats].map(([key, stats]) => [key, { ...stats }]));
+    }
+
+    reset() {
+        this.stats.clear();
+    }
+}
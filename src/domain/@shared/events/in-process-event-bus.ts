@@ -0,0 +1,93 @@
+import { ITransactionProvider } from "../providers/transaction.provider";
+import { DomainEvent } from "./domain-event";
+import { DomainEventDispatcher, EventBus } from "./event-bus";
+
+export interface InProcessEventBusOptions {
+    /** Events handled at the same time (default: 4) */
+    concurrency?: number;
+    /** Events waiting for a free slot before publishers are held back (default: 1000) */
+    maxQueueSize?: number;
+    onError?: (event: DomainEvent, error: unknown) => void;
+    /** Events published inside a transaction are delivered once it commits, and dropped on rollback */
+    transactionProvider?: ITransactionProvider;
+}
+
+/**
+ * Delivers events in the background through a bounded queue.
+ * Publishing returns as soon as the event is queued; when the queue is full,
+ * publishers wait for room instead of growing it without limit.
+ * With a transaction provider, events are only queued once the surrounding transaction has
+ * committed, so handlers never act on changes that are rolled back.
+ */
+export class InProcessEventBus implements EventBus {
+    private readonly concurrency: number;
+    private readonly maxQueueSize: number;
+    private readonly onError: (event: DomainEvent, error: unknown) => void;
+    private readonly transactionProvider?: ITransactionProvider;
+
+    private queue: DomainEvent[] = [];
+    private running = 0;
+    private spaceWaiters: (() => void)[] = [];
+    private idleWaiters: (() => void)[] = [];
+
+    constructor(
+        private dispatch: DomainEventDispatcher,
+        options: InProcessEventBusOptions = {},
+    ) {
+        this.concurrency = options.concurrency ?? 4;
+        this.maxQueueSize = options.maxQueueSize ?? 1000;
+        this.onError =
+            options.onError ??
+            ((event, error) => console.error(`Failed to handle ${event.constructor.name}:`, error));
+        this.transactionProvider = options.transactionProvider;
+    }
+
+    get size() {
+        return this.queue.length + this.running;
+    }
+
+    async publish(event: DomainEvent): Promise<void> {
+        if (this.transactionProvider) {
+            return this.transactionProvider.afterCommit(() => this.enqueue(event));
+        }
+
+        return this.enqueue(event);
+    }
+
+    /**
+     * Resolves once every queued event has been handled (used on shutdown and in tests)
+     */
+    async drain(): Promise<void> {
+        if (this.size === 0) return;
+
+        await new Promise<void>((resolve) => this.idleWaiters.push(resolve));
+    }
+
+    private async enqueue(event: DomainEvent): Promise<void> {
+        while (this.queue.length >= this.maxQueueSize) {
+            await new Promise<void>((resolve) => this.spaceWaiters.push(resolve));
+        }
+
+        this.queue.push(event);
+        this.pump();
+    }
+
+    private pump() {
+        while (this.running < this.concurrency && this.queue.length > 0) {
+            const event = this.queue.shift() as DomainEvent;
+            this.spaceWaiters.shift()?.();
+            this.running++;
+
+            this.dispatch(event)
+                .catch((error) => this.onError(event, error))
+                .finally(() => {
+                    this.running--;
+                    this.pump();
+
+                    if (this.size === 0) {
+                        this.idleWaiters.splice(0).forEach((resolve) => resolve());
+                    }
+                });
+        }
+    }
+}
@@ -0,0 +1,13 @@
+export interface ITransactionProvider {
+    /**
+     * Run the work atomically: repository writes and events published inside it
+     * are committed together or not at all. Nested calls join the outer transaction.
+     */
+    run<T>(work: () => Promise<T>): Promise<T>;
+
+    /**
+     * Run the callback once the current transaction commits, outside of its context; it is dropped
+     * if the transaction rolls back. Outside of a transaction the callback runs right away.
+     */
+    afterCommit(callback: () => void | Promise<void>): Promise<void>;
+}
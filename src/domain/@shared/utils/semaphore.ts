@@ -0,0 +1,53 @@
+/**
+ * Counting semaphore bounding how many async tasks run at the same time.
+ * Callers beyond the limit wait in FIFO order.
+ */
+export class Semaphore {
+    private active = 0;
+    private waiting: (() => void)[] = [];
+
+    constructor(private readonly permits: number) {}
+
+    get pending() {
+        return this.waiting.length;
+    }
+
+    async acquire(): Promise<() => void> {
+        if (this.active < this.permits) {
+            this.active++;
+            return this.createRelease();
+        }
+
+        // The permit is handed over directly by the releasing task
+        await new Promise<void>((resolve) => this.waiting.push(resolve));
+
+        return this.createRelease();
+    }
+
+    async run<T>(task: () => Promise<T>): Promise<T> {
+        const release = await this.acquire();
+
+        try {
+            return await task();
+        } finally {
+            release();
+        }
+    }
+
+    private createRelease() {
+        let released = false;
+
+        return () => {
+            if (released) return;
+            released = true;
+
+            const next = this.waiting.shift();
+
+            if (next) {
+                next();
+            } else {
+                this.active--;
+            }
+        };
+    }
+}
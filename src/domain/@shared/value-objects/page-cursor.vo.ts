@@ -0,0 +1,69 @@
+import { Entity } from "../entities/entity.entity";
+import { ValueObject } from "./value-object.vo";
+
+interface PageCursorProps {
+    createdAt: Date;
+    id: string;
+}
+
+/**
+ * Position in a listing ordered by (createdAt, id). Pages continue after the last item seen
+ * instead of skipping rows, so deep pages cost the same as the first one.
+ */
+export class PageCursor extends ValueObject<PageCursorProps> {
+    private constructor(props: PageCursorProps) {
+        super(props);
+    }
+
+    static create(props: PageCursorProps): PageCursor {
+        return new PageCursor(props);
+    }
+
+    /**
+     * Cursor pointing right after the entity
+     */
+    static fromEntity(entity: Entity<unknown>): PageCursor {
+        return new PageCursor({ createdAt: entity.createdAt, id: entity.id.toString() });
+    }
+
+    /**
+     * Parse a cursor produced by `encode()`. Null when the value is malformed.
+     */
+    static decode(value: string): PageCursor | null {
+        try {
+            const decoded: unknown = JSON.parse(Buffer.from(value, "base64url").toString("utf8"));
+
+            if (!Array.isArray(decoded) || decoded.length !== 2) return null;
+
+            const [timestamp, id] = decoded;
+            const createdAt = new Date(timestamp);
+
+            if (typeof timestamp !== "number" || typeof id !== "string" || !id || isNaN(createdAt.getTime())) {
+                return null;
+            }
+
+            return new PageCursor({ createdAt, id });
+        } catch {
+            return null;
+        }
+    }
+
+    get createdAt() {
+        return this.props.createdAt;
+    }
+
+    get id() {
+        return this.props.id;
+    }
+
+    /**
+     * Opaque string handed to clients
+     */
+    encode(): string {
+        return Buffer.from(JSON.stringify([this.createdAt.getTime(), this.id])).toString("base64url");
+    }
+
+    toString() {
+        return this.encode();
+    }
+}
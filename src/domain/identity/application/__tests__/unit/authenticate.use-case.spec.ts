@@ -43,6 +43,7 @@ const makeGoogleAuthProvider = (): jest.Mocked<IGoogleAuthProvider> => ({
 const makePasswordAuthProvider = (): jest.Mocked<IPasswordAuthProvider> => ({
     hash: jest.fn(),
     compare: jest.fn(),
+    needsRehash: jest.fn().mockReturnValue(false),
 });
 
 const makeCreateUserUseCase = (): jest.Mocked<CreateUserUseCase> =>
@@ -157,6 +158,56 @@ describe("AuthenticateUseCase", () => {
             }
         });
 
+        it("should rehash the password when the hash cost is outdated", async () => {
+            const user = makeUser({ id: "user-123", passwordHash: "old_hash" });
+            usersRepository.findByEmail.mockResolvedValue(user);
+            passwordAuthProvider.compare.mockResolvedValue(true);
+            passwordAuthProvider.needsRehash.mockReturnValue(true);
+            passwordAuthProvider.hash.mockResolvedValue("new_hash");
+
+            const result = await sut.execute({
+                method: AUTH_METHOD_VARIATIONS.PASSWORD,
+                email: "user@example.com",
+                password: "correct_password",
+            });
+
+            expect(result.isRight()).toBe(true);
+            expect(passwordAuthProvider.needsRehash).toHaveBeenCalledWith("old_hash");
+            expect(passwordAuthProvider.hash).toHaveBeenCalledWith("correct_password");
+            expect(usersRepository.update).toHaveBeenCalledWith(user);
+            expect(user.passwordHash).toBe("new_hash");
+        });
+
+        it("should not rehash when the hash cost is current", async () => {
+            usersRepository.findByEmail.mockResolvedValue(makeUser());
+            passwordAuthProvider.compare.mockResolvedValue(true);
+
+            await sut.execute({
+                method: AUTH_METHOD_VARIATIONS.PASSWORD,
+                email: "user@example.com",
+                password: "correct_password",
+            });
+
+            expect(passwordAuthProvider.hash).not.toHaveBeenCalled();
+            expect(usersRepository.update).not.toHaveBeenCalled();
+        });
+
+        it("should still authenticate when the rehash fails", async () => {
+            usersRepository.findByEmail.mockResolvedValue(makeUser());
+            passwordAuthProvider.compare.mockResolvedValue(true);
+            passwordAuthProvider.needsRehash.mockReturnValue(true);
+            passwordAuthProvider.hash.mockRejectedValue(new Error("Password hashing is saturated"));
+
+            const result = await sut.execute({
+                method: AUTH_METHOD_VARIATIONS.PASSWORD,
+                email: "user@example.com",
+                password: "correct_password",
+            });
+
+            expect(result.isRight()).toBe(true);
+            expect(usersRepository.update).not.toHaveBeenCalled();
+        });
+
         it("should return InvalidCredentialsError when user has no password hash", async () => {
             const user = makeUser({ passwordHash: undefined });
             usersRepository.findByEmail.mockResolvedValue(user);
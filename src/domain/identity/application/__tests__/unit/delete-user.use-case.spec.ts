@@ -1,4 +1,6 @@
 import { DomainEvents } from "@/domain/@shared/events/domain-events";
+import { InProcessEventBus } from "@/domain/@shared/events/in-process-event-bus";
+import { ITransactionProvider } from "@/domain/@shared/providers/transaction.provider";
 import { ROLES, User } from "../../../enterprise/entities/user.entity";
 import { Username } from "../../../enterprise/value-objects/username.vo";
 import { UserNotFoundError } from "../../../errors/user-not-found.error";
@@ -27,13 +29,56 @@ const makeUsersRepository = (): jest.Mocked<UsersRepository> => ({
     delete: jest.fn(),
 });
 
+/**
+ * Runs the work directly, deferring afterCommit callbacks until it resolves like a real transaction
+ */
+const makeTransactionProvider = (calls: string[] = []): jest.Mocked<ITransactionProvider> => {
+    let pending: (() => void | Promise<void>)[] | null = null;
+
+    return {
+        run: jest.fn().mockImplementation(async (work: () => Promise<unknown>) => {
+            calls.push("begin");
+            pending = [];
+
+            try {
+                const result = await work();
+                calls.push("commit");
+
+                for (const callback of pending.splice(0)) {
+                    await callback();
+                }
+
+                return result;
+            } catch (error) {
+                calls.push("rollback");
+                throw error;
+            } finally {
+                pending = null;
+            }
+        }),
+        afterCommit: jest.fn().mockImplementation(async (callback: () => void | Promise<void>) => {
+            if (pending) {
+                pending.push(callback);
+                return;
+            }
+
+            await callback();
+        }),
+    };
+};
+
 describe("DeleteUserUseCase", () => {
     let sut: DeleteUserUseCase;
     let usersRepository: jest.Mocked<UsersRepository>;
+    let transactionProvider: jest.Mocked<ITransactionProvider>;
+    let calls: string[];
 
     beforeEach(() => {
+        calls = [];
         usersRepository = makeUsersRepository();
-        sut = new DeleteUserUseCase(usersRepository);
+        transactionProvider = makeTransactionProvider(calls);
+        sut = new DeleteUserUseCase(usersRepository, transactionProvider);
+        DomainEvents.useBus(new InProcessEventBus((event) => DomainEvents.handle(event), { transactionProvider }));
         // Clear domain events between tests
         DomainEvents.clearHandlers();
         DomainEvents.clearMarkedAggregates();
@@ -113,4 +158,43 @@ describe("DeleteUserUseCase", () => {
             }),
         );
     });
+
+    it("should deliver the events in-process only once the delete has committed", async () => {
+        const user = makeUser({ id: "tx-user-id" });
+        usersRepository.findById.mockResolvedValue(user);
+        usersRepository.delete.mockImplementation(async () => {
+            calls.push("delete");
+            return user;
+        });
+        DomainEvents.register(() => {
+            calls.push("event");
+        }, "UserDeletedEvent");
+
+        await sut.execute({ userId: "tx-user-id" });
+
+        expect(transactionProvider.run).toHaveBeenCalledTimes(1);
+        expect(calls).toEqual(["begin", "delete", "commit", "event"]);
+    });
+
+    it("should not deliver the events when the delete is rolled back", async () => {
+        const user = makeUser({ id: "rollback-user-id" });
+        usersRepository.findById.mockResolvedValue(user);
+        usersRepository.delete.mockRejectedValue(new Error("Database unavailable"));
+
+        const eventHandler = jest.fn();
+        DomainEvents.register(eventHandler, "UserDeletedEvent");
+
+        await expect(sut.execute({ userId: "rollback-user-id" })).rejects.toThrow("Database unavailable");
+
+        expect(calls).toEqual(["begin", "rollback"]);
+        expect(eventHandler).not.toHaveBeenCalled();
+    });
+
+    it("should not publish events when the user does not exist", async () => {
+        usersRepository.findById.mockResolvedValue(null);
+
+        await sut.execute({ userId: "non-existent-id" });
+
+        expect(transactionProvider.run).not.toHaveBeenCalled();
+    });
 });
@@ -1,3 +1,5 @@
+import { InvalidCursorError } from "@/domain/@shared/errors/invalid-cursor.error";
+import { PageCursor } from "@/domain/@shared/value-objects/page-cursor.vo";
 import { ROLES, User } from "../../../enterprise/entities/user.entity";
 import { Username } from "../../../enterprise/value-objects/username.vo";
 import { UsersRepository } from "../../repositories/users.repository";
@@ -42,7 +44,7 @@ describe("GetAllUsersUseCase", () => {
         ];
         usersRepository.list.mockResolvedValue(users);
 
-        const result = await sut.execute({ page: 1, limit: 10 });
+        const result = await sut.execute({ limit: 10 });
 
         expect(result.isRight()).toBe(true);
         if (result.isRight()) {
@@ -50,34 +52,64 @@ describe("GetAllUsersUseCase", () => {
             expect(result.value.users[0].email).toBe("user1@example.com");
             expect(result.value.users[1].email).toBe("user2@example.com");
             expect(result.value.users[2].email).toBe("user3@example.com");
+            expect(result.value.nextCursor).toBeNull();
         }
     });
 
     it("should return an empty list when no users exist", async () => {
         usersRepository.list.mockResolvedValue([]);
 
-        const result = await sut.execute({ page: 1, limit: 10 });
+        const result = await sut.execute({ limit: 10 });
 
         expect(result.isRight()).toBe(true);
         if (result.isRight()) {
             expect(result.value.users).toHaveLength(0);
+            expect(result.value.nextCursor).toBeNull();
         }
     });
 
-    it("should call repository with correct pagination parameters", async () => {
+    it("should fetch one extra user to detect the next page", async () => {
         usersRepository.list.mockResolvedValue([]);
 
-        await sut.execute({ page: 2, limit: 20 });
+        await sut.execute({ limit: 20 });
 
-        expect(usersRepository.list).toHaveBeenCalledWith(2, 20);
+        expect(usersRepository.list).toHaveBeenCalledWith({ limit: 21, after: undefined });
         expect(usersRepository.list).toHaveBeenCalledTimes(1);
     });
 
-    it("should handle first page with default limit", async () => {
+    it("should return a cursor pointing after the last user of a full page", async () => {
+        const users = [
+            makeUser({ username: "user1", email: "user1@example.com", id: "user-1" }),
+            makeUser({ username: "user2", email: "user2@example.com", id: "user-2" }),
+            makeUser({ username: "user3", email: "user3@example.com", id: "user-3" }),
+        ];
+        usersRepository.list.mockResolvedValue(users);
+
+        const result = await sut.execute({ limit: 2 });
+
+        expect(result.isRight()).toBe(true);
+        if (result.isRight()) {
+            expect(result.value.users).toHaveLength(2);
+            expect(result.value.nextCursor).toBe(PageCursor.fromEntity(users[1]).encode());
+        }
+    });
+
+    it("should continue after the given cursor", async () => {
+        const cursor = PageCursor.create({ createdAt: new Date("2026-01-01T00:00:00.000Z"), id: "user-2" });
         usersRepository.list.mockResolvedValue([]);
 
-        await sut.execute({ page: 1, limit: 10 });
+        await sut.execute({ limit: 10, cursor: cursor.encode() });
 
-        expect(usersRepository.list).toHaveBeenCalledWith(1, 10);
+        expect(usersRepository.list).toHaveBeenCalledWith({ limit: 11, after: cursor });
+    });
+
+    it("should return InvalidCursorError when the cursor is malformed", async () => {
+        const result = await sut.execute({ limit: 10, cursor: "not-a-cursor" });
+
+        expect(result.isLeft()).toBe(true);
+        if (result.isLeft()) {
+            expect(result.value).toBeInstanceOf(InvalidCursorError);
+        }
+        expect(usersRepository.list).not.toHaveBeenCalled();
     });
 });
@@ -1,4 +1,9 @@
 export interface IPasswordAuthProvider {
     hash(password: string): Promise<string>;
     compare(password: string, hashedPassword: string): Promise<boolean>;
+
+    /**
+     * Whether the hash was made with outdated cost parameters and should be replaced on the next login
+     */
+    needsRehash(hashedPassword: string): boolean;
 }
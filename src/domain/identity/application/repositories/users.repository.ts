@@ -1,7 +1,18 @@
+import { PageCursor } from "@/domain/@shared/value-objects/page-cursor.vo";
 import { User } from "../../enterprise/entities/user.entity";
 
+export interface ListUsersParams {
+    limit: number;
+    /** Continue after this position (ordered by creation date, then id) */
+    after?: PageCursor;
+}
+
 export interface UsersRepository {
-    list(page: number, limit: number): Promise<User[]>;
+    /**
+     * Users ordered by (createdAt, id). Only the columns listings need are loaded: the
+     * returned users have no password hash.
+     */
+    list(params: ListUsersParams): Promise<User[]>;
     findById(id: string): Promise<User | null>;
     findByUsername(username: string): Promise<User | null>;
     findByEmail(email: string): Promise<User | null>;
@@ -87,9 +87,24 @@ export class AuthenticateUseCase {
             return Left.call(new InvalidCredentialsError());
         }
 
+        // The plain password is only known here: upgrade hashes made with an outdated cost
+        if (this.passwordAuthProvider.needsRehash(user.passwordHash)) {
+            await this.rehashPassword(user, password);
+        }
+
         return Right.call({ user });
     }
 
+    private async rehashPassword(user: User, password: string): Promise<void> {
+        try {
+            user.passwordHash = await this.passwordAuthProvider.hash(password);
+
+            await this.usersRepository.update(user);
+        } catch {
+            // The previous hash still works: the upgrade is retried on the next login
+        }
+    }
+
     private async authenticateWithGoogle(request: AuthenticateWithGoogleRequest): Promise<AuthenticateResponse> {
         const { code } = request;
 
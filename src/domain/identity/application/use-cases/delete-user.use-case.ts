@@ -1,5 +1,6 @@
 import { Either, Left, Right } from "@/domain/@shared/either";
 import { DomainEvents } from "@/domain/@shared/events/domain-events";
+import { ITransactionProvider } from "@/domain/@shared/providers/transaction.provider";
 import { User } from "../../enterprise/entities/user.entity";
 import { UserNotFoundError } from "../../errors/user-not-found.error";
 import { UsersRepository } from "../repositories/users.repository";
@@ -13,7 +14,10 @@ type DeleteUserError = UserNotFoundError;
 type DeleteUserResponse = Either<DeleteUserError, { user: User }>;
 
 export class DeleteUserUseCase {
-    constructor(private usersRepository: UsersRepository) {}
+    constructor(
+        private usersRepository: UsersRepository,
+        private transactionProvider: ITransactionProvider,
+    ) {}
 
     async execute(request: DeleteUserRequest): Promise<DeleteUserResponse> {
         const { userId } = request;
@@ -27,11 +31,13 @@ export class DeleteUserUseCase {
         // Mark user for deletion and emit UserDeletedEvent
         user.delete();
 
-        // Dispatch domain events before delete (cascade file deletion)
-        DomainEvents.dispatchEventsForAggregate(user.id);
-
-        // Delete user from repository
-        await this.usersRepository.delete(userId);
+        // Delete the user and publish its events atomically: a durable bus records them in the
+        // same transaction, the in-process bus delivers them once it commits. Either way the
+        // handlers (cascade file deletion) never run for a rolled back delete
+        await this.transactionProvider.run(async () => {
+            await this.usersRepository.delete(userId);
+            await DomainEvents.dispatchEventsForAggregate(user.id);
+        });
 
         return Right.call({ user });
     }
@@ -1,22 +1,48 @@
-import { Either, Right } from "@/domain/@shared/either";
+import { Either, Left, Right } from "@/domain/@shared/either";
+import { InvalidCursorError } from "@/domain/@shared/errors/invalid-cursor.error";
+import { PageCursor } from "@/domain/@shared/value-objects/page-cursor.vo";
 import { User } from "../../enterprise/entities/user.entity";
 import { UsersRepository } from "../repositories/users.repository";
 
 interface GetAllUsersRequest {
-    page: number;
     limit: number;
+    /** Opaque cursor returned with the previous page */
+    cursor?: string;
 }
 
-type GetAllUsersResponse = Either<never, { users: User[] }>;
+type GetAllUsersError = InvalidCursorError;
+
+/**
+ * `nextCursor` is null on the last page
+ */
+type GetAllUsersResponse = Either<GetAllUsersError, { users: User[]; nextCursor: string | null }>;
 
 export class GetAllUsersUseCase {
     constructor(private usersRepository: UsersRepository) {}
 
     async execute(request: GetAllUsersRequest): Promise<GetAllUsersResponse> {
-        const { page, limit } = request;
+        const { limit, cursor } = request;
+
+        let after: PageCursor | undefined;
+
+        if (cursor) {
+            const decoded = PageCursor.decode(cursor);
+
+            if (!decoded) {
+                return Left.call(new InvalidCursorError());
+            }
+
+            after = decoded;
+        }
 
-        const users = await this.usersRepository.list(page, limit);
+        // One extra row tells whether another page follows
+        const users = await this.usersRepository.list({ limit: limit + 1, after });
+        const hasMore = users.length > limit;
+        const page = hasMore ? users.slice(0, limit) : users;
 
-        return Right.call({ users });
+        return Right.call({
+            users: page,
+            nextCursor: hasMore ? PageCursor.fromEntity(page[page.length - 1]).encode() : null,
+        });
     }
 }
@@ -45,6 +45,7 @@ const makeFilesRepository = (): jest.Mocked<FilesRepository> => ({
     findByPath: jest.fn(),
     findByEntity: jest.fn(),
     findByEntityAndField: jest.fn(),
+    findByEntitiesAndField: jest.fn(),
     create: jest.fn(),
     update: jest.fn(),
     delete: jest.fn(),
@@ -55,10 +56,15 @@ const makeStorageProvider = (): jest.Mocked<IStorageProvider> => ({
     uploadStream: jest.fn(),
     uploadBuffer: jest.fn(),
     delete: jest.fn(),
+    deleteMany: jest.fn(),
+    deleteByPrefix: jest.fn(),
     exists: jest.fn(),
+    stat: jest.fn(),
+    createReadStream: jest.fn(),
     getSignedUrl: jest.fn(),
     getPublicUrl: jest.fn(),
     copy: jest.fn(),
+    copyMany: jest.fn(),
 });
 
 describe("DeleteFileUseCase", () => {
@@ -0,0 +1,129 @@
+import { Readable } from "stream";
+import { File } from "../../../enterprise/entities/file.entity";
+import { FilePath } from "../../../enterprise/value-objects/file-path.vo";
+import { FileMetadata } from "../../../enterprise/value-objects/file-metadata.vo";
+import { FilesRepository } from "../../repositories/files.repository";
+import { IStorageProvider } from "../../providers/storage.provider";
+import { DownloadFileUseCase } from "../../use-cases/download-file.use-case";
+import { FileNotFoundError } from "../../../errors/file-not-found.error";
+import { RangeNotSatisfiableError } from "../../../errors/range-not-satisfiable.error";
+
+const PATH = "development/2024/01/user/user-123/avatar.png";
+
+const makeFile = (): File => {
+    return File.create(
+        {
+            entityType: "user",
+            entityId: "user-123",
+            field: "avatar",
+            filename: "avatar.png",
+            path: FilePath.fromString(PATH),
+            metadata: FileMetadata.create({ mimeType: "image/png", size: 1000 }),
+        },
+        "file-123",
+    );
+};
+
+const makeFilesRepository = (): jest.Mocked<FilesRepository> => ({
+    findById: jest.fn(),
+    findByPath: jest.fn(),
+    findByEntity: jest.fn(),
+    findByEntityAndField: jest.fn(),
+    findByEntitiesAndField: jest.fn(),
+    create: jest.fn(),
+    update: jest.fn(),
+    delete: jest.fn(),
+    deleteByEntity: jest.fn(),
+});
+
+const makeStorageProvider = (): jest.Mocked<IStorageProvider> => ({
+    uploadStream: jest.fn(),
+    uploadBuffer: jest.fn(),
+    delete: jest.fn(),
+    deleteMany: jest.fn(),
+    deleteByPrefix: jest.fn(),
+    exists: jest.fn(),
+    stat: jest.fn().mockResolvedValue({ size: 1000, etag: "abc123" }),
+    createReadStream: jest.fn().mockImplementation(async () => Readable.from(Buffer.from("content"))),
+    getSignedUrl: jest.fn(),
+    getPublicUrl: jest.fn(),
+    copy: jest.fn(),
+    copyMany: jest.fn(),
+});
+
+describe("DownloadFileUseCase", () => {
+    let sut: DownloadFileUseCase;
+    let filesRepository: jest.Mocked<FilesRepository>;
+    let storageProvider: jest.Mocked<IStorageProvider>;
+
+    beforeEach(() => {
+        filesRepository = makeFilesRepository();
+        storageProvider = makeStorageProvider();
+        sut = new DownloadFileUseCase(filesRepository, storageProvider);
+
+        filesRepository.findByPath.mockResolvedValue(makeFile());
+    });
+
+    it("should stream the whole file when no range is requested", async () => {
+        const result = await sut.execute({ path: PATH });
+
+        expect(result.isRight()).toBe(true);
+        if (result.isRight()) {
+            expect(result.value.notModified).toBe(false);
+            expect(result.value.range).toBeUndefined();
+            expect(result.value.stream).toBeInstanceOf(Readable);
+            expect(result.value.info).toEqual({ size: 1000, etag: "abc123" });
+        }
+        expect(storageProvider.createReadStream).toHaveBeenCalledWith(PATH, undefined);
+    });
+
+    it("should return FileNotFoundError when the path has no file record", async () => {
+        filesRepository.findByPath.mockResolvedValue(null);
+
+        const result = await sut.execute({ path: PATH });
+
+        expect(result.isLeft()).toBe(true);
+        expect(result.value).toBeInstanceOf(FileNotFoundError);
+        expect(storageProvider.stat).not.toHaveBeenCalled();
+    });
+
+    it("should return FileNotFoundError when the content is missing from storage", async () => {
+        storageProvider.stat.mockResolvedValue(null);
+
+        const result = await sut.execute({ path: PATH });
+
+        expect(result.isLeft()).toBe(true);
+        expect(result.value).toBeInstanceOf(FileNotFoundError);
+    });
+
+    it("should not open the content when If-None-Match matches the ETag", async () => {
+        const result = await sut.execute({ path: PATH, ifNoneMatch: 'W/"other", "abc123"' });
+
+        expect(result.isRight()).toBe(true);
+        if (result.isRight()) {
+            expect(result.value.notModified).toBe(true);
+            expect(result.value.stream).toBeNull();
+        }
+        expect(storageProvider.createReadStream).not.toHaveBeenCalled();
+    });
+
+    it("should resolve open-ended and suffix ranges against the file size", async () => {
+        await sut.execute({ path: PATH, range: { start: 100 } });
+        expect(storageProvider.createReadStream).toHaveBeenLastCalledWith(PATH, { start: 100, end: 999 });
+
+        await sut.execute({ path: PATH, range: { suffixLength: 200 } });
+        expect(storageProvider.createReadStream).toHaveBeenLastCalledWith(PATH, { start: 800, end: 999 });
+
+        const result = await sut.execute({ path: PATH, range: { start: 0, end: 5000 } });
+        expect(storageProvider.createReadStream).toHaveBeenLastCalledWith(PATH, undefined);
+        expect(result.isRight() && result.value.range).toBeUndefined();
+    });
+
+    it("should return RangeNotSatisfiableError when the range starts past the end", async () => {
+        const result = await sut.execute({ path: PATH, range: { start: 1000 } });
+
+        expect(result.isLeft()).toBe(true);
+        expect(result.value).toBeInstanceOf(RangeNotSatisfiableError);
+        expect(storageProvider.createReadStream).not.toHaveBeenCalled();
+    });
+});
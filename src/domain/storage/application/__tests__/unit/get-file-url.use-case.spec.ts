@@ -3,6 +3,7 @@ import { FilePath } from "../../../enterprise/value-objects/file-path.vo";
 import { FileMetadata } from "../../../enterprise/value-objects/file-metadata.vo";
 import { FilesRepository } from "../../repositories/files.repository";
 import { IStorageProvider } from "../../providers/storage.provider";
+import { ISignedUrlCacheProvider } from "../../providers/signed-url-cache.provider";
 import { GetFileUrlUseCase } from "../../use-cases/get-file-url.use-case";
 import { FileNotFoundError } from "../../../errors/file-not-found.error";
 
@@ -47,6 +48,7 @@ const makeFilesRepository = (): jest.Mocked<FilesRepository> => ({
     findByPath: jest.fn(),
     findByEntity: jest.fn(),
     findByEntityAndField: jest.fn(),
+    findByEntitiesAndField: jest.fn(),
     create: jest.fn(),
     update: jest.fn(),
     delete: jest.fn(),
@@ -57,21 +59,34 @@ const makeStorageProvider = (): jest.Mocked<IStorageProvider> => ({
     uploadStream: jest.fn(),
     uploadBuffer: jest.fn(),
     delete: jest.fn(),
+    deleteMany: jest.fn(),
+    deleteByPrefix: jest.fn(),
     exists: jest.fn(),
+    stat: jest.fn(),
+    createReadStream: jest.fn(),
     getSignedUrl: jest.fn().mockResolvedValue("https://storage.googleapis.com/bucket/signed-url?token=xyz"),
     getPublicUrl: jest.fn().mockReturnValue("https://storage.googleapis.com/bucket/public-url"),
     copy: jest.fn(),
+    copyMany: jest.fn(),
+});
+
+const makeSignedUrlCache = (): jest.Mocked<ISignedUrlCacheProvider> => ({
+    get: jest.fn().mockResolvedValue(null),
+    set: jest.fn(),
+    invalidate: jest.fn(),
 });
 
 describe("GetFileUrlUseCase", () => {
     let sut: GetFileUrlUseCase;
     let filesRepository: jest.Mocked<FilesRepository>;
     let storageProvider: jest.Mocked<IStorageProvider>;
+    let signedUrlCache: jest.Mocked<ISignedUrlCacheProvider>;
 
     beforeEach(() => {
         filesRepository = makeFilesRepository();
         storageProvider = makeStorageProvider();
-        sut = new GetFileUrlUseCase(filesRepository, storageProvider);
+        signedUrlCache = makeSignedUrlCache();
+        sut = new GetFileUrlUseCase(filesRepository, storageProvider, signedUrlCache);
     });
 
     describe("get by fileId", () => {
@@ -101,7 +116,7 @@ describe("GetFileUrlUseCase", () => {
             if (result.isRight()) {
                 expect(result.value.url).toBe("https://storage.googleapis.com/bucket/signed-url?token=xyz");
             }
-            expect(storageProvider.getSignedUrl).toHaveBeenCalledWith(file.path.toString(), 30);
+            expect(storageProvider.getSignedUrl).toHaveBeenCalledWith(file.path.toString(), 60);
         });
 
         it("should use default expiration time of 60 minutes", async () => {
@@ -110,7 +125,7 @@ describe("GetFileUrlUseCase", () => {
 
             await sut.execute({ fileId: "file-123", signed: true });
 
-            expect(storageProvider.getSignedUrl).toHaveBeenCalledWith(file.path.toString(), 60);
+            expect(storageProvider.getSignedUrl).toHaveBeenCalledWith(file.path.toString(), 120);
         });
 
         it("should return FileNotFoundError when file does not exist", async () => {
@@ -156,7 +171,7 @@ describe("GetFileUrlUseCase", () => {
             });
 
             expect(result.isRight()).toBe(true);
-            expect(storageProvider.getSignedUrl).toHaveBeenCalledWith(file.path.toString(), 15);
+            expect(storageProvider.getSignedUrl).toHaveBeenCalledWith(file.path.toString(), 30);
         });
 
         it("should return FileNotFoundError when file does not exist by entity and field", async () => {
@@ -175,6 +190,140 @@ describe("GetFileUrlUseCase", () => {
         });
     });
 
+    describe("get many by entities and field", () => {
+        it("should resolve every entity file with a single repository query", async () => {
+            const files = [
+                makeFile({ entityId: "user-1", id: "file-1" }),
+                makeFile({ entityId: "user-2", id: "file-2" }),
+            ];
+            filesRepository.findByEntitiesAndField.mockResolvedValue(files);
+
+            const result = await sut.executeMany({
+                entityType: "user",
+                entityIds: ["user-1", "user-2", "user-3"],
+                field: "avatar",
+            });
+
+            expect(result.isRight()).toBe(true);
+            expect(result.value.files.size).toBe(2);
+            expect(result.value.files.get("user-1")?.url).toBe("https://storage.googleapis.com/bucket/public-url");
+            expect(result.value.files.has("user-3")).toBe(false);
+            expect(filesRepository.findByEntitiesAndField).toHaveBeenCalledTimes(1);
+            expect(filesRepository.findByEntitiesAndField).toHaveBeenCalledWith(
+                "user",
+                ["user-1", "user-2", "user-3"],
+                "avatar",
+            );
+            expect(filesRepository.findByEntityAndField).not.toHaveBeenCalled();
+        });
+
+        it("should deduplicate entity ids before querying", async () => {
+            filesRepository.findByEntitiesAndField.mockResolvedValue([]);
+
+            await sut.executeMany({ entityType: "user", entityIds: ["user-1", "user-1"], field: "avatar" });
+
+            expect(filesRepository.findByEntitiesAndField).toHaveBeenCalledWith("user", ["user-1"], "avatar");
+        });
+
+        it("should not query the repository when no entity ids are given", async () => {
+            const result = await sut.executeMany({ entityType: "user", entityIds: [], field: "avatar" });
+
+            expect(result.value.files.size).toBe(0);
+            expect(filesRepository.findByEntitiesAndField).not.toHaveBeenCalled();
+        });
+
+        it("should return signed URLs when signed is true", async () => {
+            const file = makeFile({ entityId: "user-1" });
+            filesRepository.findByEntitiesAndField.mockResolvedValue([file]);
+
+            const result = await sut.executeMany({
+                entityType: "user",
+                entityIds: ["user-1"],
+                field: "avatar",
+                signed: true,
+                expiresInMinutes: 15,
+            });
+
+            expect(result.value.files.get("user-1")?.url).toBe(
+                "https://storage.googleapis.com/bucket/signed-url?token=xyz",
+            );
+            expect(storageProvider.getSignedUrl).toHaveBeenCalledWith(file.path.toString(), 30);
+        });
+    });
+
+    describe("signed URL cache", () => {
+        beforeEach(() => {
+            jest.useFakeTimers({ now: new Date("2026-01-01T00:00:00.000Z") });
+        });
+
+        afterEach(() => {
+            jest.useRealTimers();
+        });
+
+        it("should reuse a cached URL that remains valid for the whole requested lifetime", async () => {
+            const file = makeFile();
+            filesRepository.findById.mockResolvedValue(file);
+            signedUrlCache.get.mockResolvedValue("https://storage.googleapis.com/bucket/cached-url");
+
+            const result = await sut.execute({ fileId: "file-123", signed: true, expiresInMinutes: 60 });
+
+            expect(result.isRight()).toBe(true);
+            if (result.isRight()) {
+                expect(result.value.url).toBe("https://storage.googleapis.com/bucket/cached-url");
+            }
+            expect(signedUrlCache.get).toHaveBeenCalledWith(
+                { path: file.path.toString(), action: "read", expiresInMinutes: 60 },
+                new Date("2026-01-01T01:00:00.000Z"),
+            );
+            expect(storageProvider.getSignedUrl).not.toHaveBeenCalled();
+        });
+
+        it("should sign for twice the requested lifetime and cache the URL with its expiration on a miss", async () => {
+            const file = makeFile();
+            filesRepository.findById.mockResolvedValue(file);
+
+            await sut.execute({ fileId: "file-123", signed: true, expiresInMinutes: 60 });
+
+            expect(storageProvider.getSignedUrl).toHaveBeenCalledWith(file.path.toString(), 120);
+            expect(signedUrlCache.set).toHaveBeenCalledWith(
+                { path: file.path.toString(), action: "read", expiresInMinutes: 60 },
+                {
+                    url: "https://storage.googleapis.com/bucket/signed-url?token=xyz",
+                    expiresAt: new Date("2026-01-01T02:00:00.000Z"),
+                },
+            );
+        });
+
+        it("should not use the cache for public URLs", async () => {
+            filesRepository.findById.mockResolvedValue(makeFile());
+
+            await sut.execute({ fileId: "file-123" });
+
+            expect(signedUrlCache.get).not.toHaveBeenCalled();
+            expect(signedUrlCache.set).not.toHaveBeenCalled();
+        });
+
+        it("should only sign the URLs missing from the cache when resolving many", async () => {
+            const cached = makeFile({ entityId: "user-1", id: "file-1", filename: "cached.png" });
+            const missing = makeFile({ entityId: "user-2", id: "file-2", filename: "missing.png" });
+            filesRepository.findByEntitiesAndField.mockResolvedValue([cached, missing]);
+            signedUrlCache.get.mockImplementation(async (key) =>
+                key.path === cached.path.toString() ? "https://storage.googleapis.com/bucket/cached-url" : null,
+            );
+
+            const result = await sut.executeMany({
+                entityType: "user",
+                entityIds: ["user-1", "user-2"],
+                field: "avatar",
+                signed: true,
+            });
+
+            expect(result.value.files.get("user-1")?.url).toBe("https://storage.googleapis.com/bucket/cached-url");
+            expect(storageProvider.getSignedUrl).toHaveBeenCalledTimes(1);
+            expect(storageProvider.getSignedUrl).toHaveBeenCalledWith(missing.path.toString(), 120);
+        });
+    });
+
     describe("priority", () => {
         it("should prioritize fileId over entity/field lookup", async () => {
             const file = makeFile();
@@ -0,0 +1,138 @@
+import { Logger } from "@nestjs/common";
+import { DomainEvents } from "@/domain/@shared/events/domain-events";
+import { PageCursor } from "@/domain/@shared/value-objects/page-cursor.vo";
+import { ROLES, User } from "@/domain/identity/enterprise/entities/user.entity";
+import { UserDeletedEvent } from "@/domain/identity/enterprise/events/user-deleted.event";
+import { Username } from "@/domain/identity/enterprise/value-objects/username.vo";
+import { File } from "../../../enterprise/entities/file.entity";
+import { FilePath } from "../../../enterprise/value-objects/file-path.vo";
+import { FileMetadata } from "../../../enterprise/value-objects/file-metadata.vo";
+import { FilesRepository } from "../../repositories/files.repository";
+import { IStorageProvider } from "../../providers/storage.provider";
+import { OnUserDeletedSubscriber } from "../../subscribers/on-user-deleted.subscriber";
+
+const makeFile = (path: string, id: string): File => {
+    return File.create(
+        {
+            entityType: "user",
+            entityId: "user-123",
+            field: "avatar",
+            filename: path.split("/").pop() as string,
+            path: FilePath.fromString(path),
+            metadata: FileMetadata.create({ mimeType: "image/png", size: 1024 }),
+        },
+        id,
+    );
+};
+
+const makeUser = (): User => {
+    return User.create(
+        {
+            username: Username.create("testuser"),
+            email: "test@example.com",
+            roles: [ROLES.USER],
+        },
+        "user-123",
+    );
+};
+
+const makeFilesRepository = (): jest.Mocked<FilesRepository> => ({
+    findById: jest.fn(),
+    findByPath: jest.fn(),
+    findByEntity: jest.fn(),
+    findByEntityAndField: jest.fn(),
+    findByEntitiesAndField: jest.fn(),
+    create: jest.fn(),
+    update: jest.fn(),
+    delete: jest.fn(),
+    deleteByEntity: jest.fn(),
+});
+
+const makeStorageProvider = (): jest.Mocked<IStorageProvider> => ({
+    uploadStream: jest.fn(),
+    uploadBuffer: jest.fn(),
+    delete: jest.fn(),
+    deleteMany: jest.fn(),
+    deleteByPrefix: jest.fn().mockResolvedValue({ succeeded: [], failed: [] }),
+    exists: jest.fn(),
+    stat: jest.fn(),
+    createReadStream: jest.fn(),
+    getSignedUrl: jest.fn(),
+    getPublicUrl: jest.fn(),
+    copy: jest.fn(),
+    copyMany: jest.fn(),
+});
+
+describe("OnUserDeletedSubscriber", () => {
+    let filesRepository: jest.Mocked<FilesRepository>;
+    let storageProvider: jest.Mocked<IStorageProvider>;
+
+    beforeEach(() => {
+        DomainEvents.clearHandlers();
+        filesRepository = makeFilesRepository();
+        storageProvider = makeStorageProvider();
+        new OnUserDeletedSubscriber(filesRepository, storageProvider);
+    });
+
+    it("should purge each folder holding the user's files once", async () => {
+        filesRepository.findByEntity.mockResolvedValue([
+            makeFile("production/2024/01/user/user-123/avatar.png", "file-1"),
+            makeFile("production/2024/01/user/user-123/cover.png", "file-2"),
+            makeFile("production/2024/03/user/user-123/avatar.png", "file-3"),
+        ]);
+
+        await DomainEvents.handle(new UserDeletedEvent(makeUser()));
+
+        expect(storageProvider.deleteByPrefix).toHaveBeenCalledTimes(2);
+        expect(storageProvider.deleteByPrefix).toHaveBeenCalledWith("production/2024/01/user/user-123/");
+        expect(storageProvider.deleteByPrefix).toHaveBeenCalledWith("production/2024/03/user/user-123/");
+        expect(storageProvider.delete).not.toHaveBeenCalled();
+        expect(filesRepository.deleteByEntity).toHaveBeenCalledWith("user", "user-123");
+    });
+
+    it("should fail and keep the records when some storage deletions fail, so the purge is retried", async () => {
+        filesRepository.findByEntity.mockResolvedValue([
+            makeFile("production/2024/01/user/user-123/avatar.png", "file-1"),
+        ]);
+        storageProvider.deleteByPrefix.mockResolvedValue({
+            succeeded: [],
+            failed: [{ path: "production/2024/01/user/user-123/avatar.png", error: "permission denied" }],
+        });
+        const loggerError = jest.spyOn(Logger.prototype, "error").mockImplementation(() => undefined);
+
+        await expect(DomainEvents.handle(new UserDeletedEvent(makeUser()))).rejects.toBeInstanceOf(AggregateError);
+
+        expect(loggerError).toHaveBeenCalledWith(expect.stringContaining("avatar.png"));
+        expect(filesRepository.deleteByEntity).not.toHaveBeenCalled();
+
+        loggerError.mockRestore();
+    });
+
+    it("should page through the user's file records", async () => {
+        const firstPage = Array.from({ length: 500 }, (_, i) =>
+            makeFile(`production/2024/01/user/user-123/file-${i}.png`, `file-${i}`),
+        );
+        filesRepository.findByEntity
+            .mockResolvedValueOnce(firstPage)
+            .mockResolvedValueOnce([makeFile("production/2024/02/user/user-123/avatar.png", "file-500")]);
+
+        await DomainEvents.handle(new UserDeletedEvent(makeUser()));
+
+        expect(filesRepository.findByEntity).toHaveBeenCalledTimes(2);
+        expect(filesRepository.findByEntity).toHaveBeenLastCalledWith("user", "user-123", {
+            limit: 500,
+            after: PageCursor.fromEntity(firstPage[499]),
+        });
+        expect(storageProvider.deleteByPrefix).toHaveBeenCalledTimes(2);
+        expect(storageProvider.deleteByPrefix).toHaveBeenCalledWith("production/2024/02/user/user-123/");
+    });
+
+    it("should not touch storage when the user has no files", async () => {
+        filesRepository.findByEntity.mockResolvedValue([]);
+
+        await DomainEvents.handle(new UserDeletedEvent(makeUser()));
+
+        expect(storageProvider.deleteByPrefix).not.toHaveBeenCalled();
+        expect(filesRepository.deleteByEntity).toHaveBeenCalledWith("user", "user-123");
+    });
+});
@@ -1,3 +1,4 @@
+import { PassThrough, Readable } from "stream";
 import { File } from "../../../enterprise/entities/file.entity";
 import { FilePath } from "../../../enterprise/value-objects/file-path.vo";
 import { FileMetadata } from "../../../enterprise/value-objects/file-metadata.vo";
@@ -50,6 +51,7 @@ const makeFilesRepository = (): jest.Mocked<FilesRepository> => ({
     findByPath: jest.fn(),
     findByEntity: jest.fn(),
     findByEntityAndField: jest.fn(),
+    findByEntitiesAndField: jest.fn(),
     create: jest.fn(),
     update: jest.fn(),
     delete: jest.fn(),
@@ -64,19 +66,35 @@ const makeStorageProvider = (): jest.Mocked<IStorageProvider> => ({
     }),
     uploadBuffer: jest.fn(),
     delete: jest.fn(),
+    deleteMany: jest.fn(),
+    deleteByPrefix: jest.fn(),
     exists: jest.fn(),
+    stat: jest.fn(),
+    createReadStream: jest.fn(),
     getSignedUrl: jest.fn(),
     getPublicUrl: jest.fn(),
     copy: jest.fn(),
+    copyMany: jest.fn(),
 });
 
 const makeFileValidatorProvider = (): jest.Mocked<IFileValidatorProvider> => ({
     validateMimeType: jest.fn(),
+    validateMimeTypeFromStream: jest.fn().mockImplementation(async (stream: Readable) => ({
+        isValid: true,
+        detectedMimeType: "image/png",
+        stream,
+    })),
     validateSize: jest.fn(),
     validateDimensions: jest.fn(),
+    validateImageDimensions: jest.fn().mockReturnValue({ isValid: true }),
     getImageDimensions: jest.fn().mockResolvedValue({ width: 200, height: 200 }),
+    analyze: jest.fn().mockResolvedValue({
+        mimeType: "image/png",
+        image: { format: "png", width: 200, height: 200 },
+    }),
     validate: jest.fn().mockResolvedValue({ isValid: true }),
     detectMimeType: jest.fn().mockResolvedValue("image/png"),
+    detectMimeTypeFromStream: jest.fn().mockImplementation(async (stream: Readable) => ({ mimeType: "image/png", stream })),
 });
 
 const makeImageProcessorProvider = (): jest.Mocked<IImageProcessorProvider> => ({
@@ -87,6 +105,11 @@ const makeImageProcessorProvider = (): jest.Mocked<IImageProcessorProvider> => (
         size: 512,
         mimeType: "image/webp",
     } as ProcessedImage),
+    resizeStream: jest.fn().mockImplementation(async () => ({
+        stream: new PassThrough(),
+        mimeType: "image/webp",
+        result: Promise.resolve({ width: 400, height: 400, size: 512, mimeType: "image/webp" }),
+    })),
     generateThumbnails: jest.fn(),
     optimize: jest.fn(),
     convert: jest.fn(),
@@ -136,7 +159,7 @@ describe("UploadFileUseCase", () => {
     });
 
     it("should replace existing file when replaceExisting is true", async () => {
-        const existingFile = makeFile();
+        const existingFile = makeFile({ filename: "old-avatar.png" });
         filesRepository.findByEntityAndField.mockResolvedValue(existingFile);
         filesRepository.create.mockImplementation(async (file) => file);
 
@@ -148,6 +171,35 @@ describe("UploadFileUseCase", () => {
         expect(filesRepository.create).toHaveBeenCalledTimes(1);
     });
 
+    it("should not delete the stored object when the replacement overwrote its path", async () => {
+        const existingFile = makeFile();
+        filesRepository.findByEntityAndField.mockResolvedValue(existingFile);
+        filesRepository.create.mockImplementation(async (file) => file);
+
+        const result = await sut.execute(defaultRequest);
+
+        expect(result.isRight()).toBe(true);
+        expect(storageProvider.uploadStream).toHaveBeenCalledWith(
+            expect.anything(),
+            expect.objectContaining({ path: existingFile.path.toString() }),
+        );
+        expect(filesRepository.delete).toHaveBeenCalledWith(existingFile.id.toString());
+        expect(storageProvider.delete).not.toHaveBeenCalled();
+    });
+
+    it("should keep the existing file when the replacement upload fails", async () => {
+        const existingFile = makeFile({ filename: "old-avatar.png" });
+        filesRepository.findByEntityAndField.mockResolvedValue(existingFile);
+        storageProvider.uploadStream.mockRejectedValue(new Error("Storage connection failed"));
+
+        const result = await sut.execute(defaultRequest);
+
+        expect(result.isLeft()).toBe(true);
+        expect(storageProvider.delete).not.toHaveBeenCalled();
+        expect(filesRepository.delete).not.toHaveBeenCalled();
+        expect(filesRepository.create).not.toHaveBeenCalled();
+    });
+
     it("should optimize image when optimizeImage option is provided", async () => {
         filesRepository.findByEntityAndField.mockResolvedValue(null);
         filesRepository.create.mockImplementation(async (file) => file);
@@ -237,7 +289,7 @@ describe("UploadFileUseCase", () => {
     });
 
     it("should return InvalidFileTypeError when MIME type cannot be detected", async () => {
-        fileValidator.detectMimeType.mockResolvedValue(null);
+        fileValidator.analyze.mockResolvedValue({ mimeType: null });
         filesRepository.findByEntityAndField.mockResolvedValue(null);
 
         const result = await sut.execute(defaultRequest);
@@ -262,15 +314,49 @@ describe("UploadFileUseCase", () => {
         expect(filesRepository.create).not.toHaveBeenCalled();
     });
 
-    it("should get image dimensions for non-optimized images", async () => {
+    it("should take image dimensions from the analysis for non-optimized images", async () => {
         filesRepository.findByEntityAndField.mockResolvedValue(null);
         filesRepository.create.mockImplementation(async (file) => file);
-        fileValidator.getImageDimensions.mockResolvedValue({ width: 800, height: 600 });
+        fileValidator.analyze.mockResolvedValue({
+            mimeType: "image/png",
+            image: { format: "png", width: 800, height: 600 },
+        });
 
         const result = await sut.execute(defaultRequest);
 
         expect(result.isRight()).toBe(true);
-        expect(fileValidator.getImageDimensions).toHaveBeenCalledWith(defaultRequest.buffer);
+        if (result.isRight()) {
+            expect(result.value.file.width).toBe(800);
+            expect(result.value.file.height).toBe(600);
+        }
+        expect(fileValidator.analyze).toHaveBeenCalledTimes(1);
+        expect(fileValidator.analyze).toHaveBeenCalledWith(defaultRequest.buffer);
+        expect(fileValidator.getImageDimensions).not.toHaveBeenCalled();
+        expect(fileValidator.detectMimeType).not.toHaveBeenCalled();
+    });
+
+    it("should reuse the validation analysis instead of inspecting the file again", async () => {
+        filesRepository.findByEntityAndField.mockResolvedValue(null);
+        filesRepository.create.mockImplementation(async (file) => file);
+        fileValidator.validate.mockResolvedValue({
+            isValid: true,
+            detectedMimeType: "image/png",
+            analysis: { mimeType: "image/png", image: { format: "png", width: 640, height: 480 } },
+        });
+
+        const result = await sut.execute({
+            ...defaultRequest,
+            validationOptions: { allowedMimeTypes: ["image/png"] },
+        });
+
+        expect(result.isRight()).toBe(true);
+        if (result.isRight()) {
+            expect(result.value.file.width).toBe(640);
+            expect(result.value.file.height).toBe(480);
+        }
+        expect(fileValidator.validate).toHaveBeenCalledTimes(1);
+        expect(fileValidator.analyze).not.toHaveBeenCalled();
+        expect(fileValidator.detectMimeType).not.toHaveBeenCalled();
     });
 
     it("should not replace existing file when replaceExisting is false", async () => {
@@ -284,4 +370,213 @@ describe("UploadFileUseCase", () => {
         expect(storageProvider.delete).not.toHaveBeenCalled();
         expect(filesRepository.delete).not.toHaveBeenCalled();
     });
+
+    describe("streaming mode", () => {
+        const consumeUpload = async (stream: Readable) => {
+            let size = 0;
+            for await (const chunk of stream) {
+                size += chunk.length;
+            }
+            return { path: "path", publicUrl: "public-url", size };
+        };
+
+        const streamRequest = (content: Buffer) => ({
+            entityType: "user",
+            entityId: "user-123",
+            field: "document",
+            filename: "document.pdf",
+            stream: Readable.from(content),
+            environment: "development",
+        });
+
+        beforeEach(() => {
+            filesRepository.findByEntityAndField.mockResolvedValue(null);
+            filesRepository.create.mockImplementation(async (file) => file);
+            storageProvider.uploadStream.mockImplementation(consumeUpload);
+            fileValidator.detectMimeTypeFromStream.mockImplementation(async (stream) => ({
+                mimeType: "application/pdf",
+                stream,
+            }));
+            fileValidator.validateMimeTypeFromStream.mockImplementation(async (stream) => ({
+                isValid: true,
+                detectedMimeType: "application/pdf",
+                stream,
+            }));
+        });
+
+        it("should stream non-image files straight to storage without buffering", async () => {
+            const content = Buffer.from("%PDF-1.7 fake document content");
+
+            const result = await sut.execute(streamRequest(content));
+
+            expect(result.isRight()).toBe(true);
+            if (result.isRight()) {
+                expect(result.value.file.mimeType).toBe("application/pdf");
+                expect(result.value.file.size).toBe(content.length);
+            }
+            expect(fileValidator.validate).not.toHaveBeenCalled();
+            expect(fileValidator.detectMimeType).not.toHaveBeenCalled();
+        });
+
+        it("should return FileTooLargeError when the stream exceeds maxSizeBytes", async () => {
+            const result = await sut.execute({
+                ...streamRequest(Buffer.alloc(2048)),
+                validationOptions: { maxSizeBytes: 1024 },
+            });
+
+            expect(result.isLeft()).toBe(true);
+            if (result.isLeft()) {
+                expect(result.value).toBeInstanceOf(FileTooLargeError);
+            }
+            expect(filesRepository.create).not.toHaveBeenCalled();
+        });
+
+        it("should keep the existing file when the replacement exceeds the size limit", async () => {
+            const existingFile = makeFile({ field: "document", filename: "old-document.pdf" });
+            filesRepository.findByEntityAndField.mockResolvedValue(existingFile);
+
+            const result = await sut.execute({
+                ...streamRequest(Buffer.alloc(2048)),
+                validationOptions: { maxSizeBytes: 1024 },
+            });
+
+            expect(result.isLeft()).toBe(true);
+            if (result.isLeft()) {
+                expect(result.value).toBeInstanceOf(FileTooLargeError);
+            }
+            expect(storageProvider.delete).not.toHaveBeenCalled();
+            expect(filesRepository.delete).not.toHaveBeenCalled();
+            expect(filesRepository.create).not.toHaveBeenCalled();
+        });
+
+        it("should return InvalidFileTypeError when the sniffed type is not allowed", async () => {
+            fileValidator.validateMimeTypeFromStream.mockImplementation(async (stream) => ({
+                isValid: false,
+                error: "File type 'application/pdf' is not allowed",
+                detectedMimeType: "application/pdf",
+                stream,
+            }));
+
+            const result = await sut.execute({
+                ...streamRequest(Buffer.from("content")),
+                validationOptions: { allowedMimeTypes: ["image/png"] },
+            });
+
+            expect(result.isLeft()).toBe(true);
+            if (result.isLeft()) {
+                expect(result.value).toBeInstanceOf(InvalidFileTypeError);
+            }
+            expect(storageProvider.uploadStream).not.toHaveBeenCalled();
+        });
+
+        it("should pipe images through the streaming resize transform when optimizing", async () => {
+            fileValidator.detectMimeTypeFromStream.mockImplementation(async (stream) => ({
+                mimeType: "image/png",
+                stream,
+            }));
+
+            const result = await sut.execute({
+                ...streamRequest(Buffer.from("fake-image-content")),
+                optimizeImage: { width: 400, height: 400, format: "webp" },
+            });
+
+            expect(result.isRight()).toBe(true);
+            if (result.isRight()) {
+                expect(result.value.file.mimeType).toBe("image/webp");
+                expect(result.value.file.width).toBe(400);
+                expect(result.value.file.height).toBe(400);
+            }
+            expect(imageProcessor.resizeStream).toHaveBeenCalledTimes(1);
+            expect(imageProcessor.resize).not.toHaveBeenCalled();
+            expect(storageProvider.uploadStream).toHaveBeenCalledWith(
+                expect.anything(),
+                expect.objectContaining({ mimeType: "image/webp" }),
+            );
+        });
+
+        it("should destroy the resize transform when the upload fails before consuming it", async () => {
+            const transform = new PassThrough();
+            imageProcessor.resizeStream.mockResolvedValue({
+                stream: transform,
+                mimeType: "image/webp",
+                result: Promise.resolve({ width: 400, height: 400, size: 512, mimeType: "image/webp" }),
+            });
+            fileValidator.detectMimeTypeFromStream.mockImplementation(async (stream) => ({
+                mimeType: "image/png",
+                stream,
+            }));
+            filesRepository.findByEntityAndField.mockRejectedValue(new Error("Database unavailable"));
+
+            await expect(
+                sut.execute({
+                    ...streamRequest(Buffer.from("fake-image-content")),
+                    optimizeImage: { width: 400, height: 400, format: "webp" },
+                }),
+            ).rejects.toThrow("Database unavailable");
+
+            expect(transform.destroyed).toBe(true);
+        });
+
+        it("should stream non-optimized images with the dimensions read from the header", async () => {
+            const content = Buffer.from("fake-image-content");
+            fileValidator.detectMimeTypeFromStream.mockImplementation(async (stream) => ({
+                mimeType: "image/png",
+                image: { format: "png", width: 640, height: 480 },
+                stream,
+            }));
+
+            const result = await sut.execute(streamRequest(content));
+
+            expect(result.isRight()).toBe(true);
+            if (result.isRight()) {
+                expect(result.value.file.mimeType).toBe("image/png");
+                expect(result.value.file.width).toBe(640);
+                expect(result.value.file.height).toBe(480);
+                expect(result.value.file.size).toBe(content.length);
+            }
+            expect(fileValidator.analyze).not.toHaveBeenCalled();
+            expect(imageProcessor.resizeStream).not.toHaveBeenCalled();
+        });
+
+        it("should check dimension constraints against the header without buffering", async () => {
+            const image = { format: "png", width: 50, height: 50 };
+            fileValidator.validateMimeTypeFromStream.mockImplementation(async (stream) => ({
+                isValid: true,
+                detectedMimeType: "image/png",
+                image,
+                stream,
+            }));
+            fileValidator.validateImageDimensions.mockReturnValue({
+                isValid: false,
+                error: "Image width (50px) is less than minimum (100px)",
+            });
+
+            const result = await sut.execute({
+                ...streamRequest(Buffer.from("fake-image-content")),
+                validationOptions: { minWidth: 100 },
+            });
+
+            expect(result.isLeft()).toBe(true);
+            if (result.isLeft()) {
+                expect(result.value).toBeInstanceOf(InvalidImageDimensionsError);
+            }
+            expect(fileValidator.validateImageDimensions).toHaveBeenCalledWith(image, { minWidth: 100 });
+            expect(fileValidator.validate).not.toHaveBeenCalled();
+            expect(storageProvider.uploadStream).not.toHaveBeenCalled();
+        });
+
+        it("should fall back to the buffer path when the image header could not be read", async () => {
+            const content = Buffer.from("fake-image-content");
+            fileValidator.detectMimeTypeFromStream.mockImplementation(async (stream) => ({
+                mimeType: "image/png",
+                stream,
+            }));
+
+            const result = await sut.execute(streamRequest(content));
+
+            expect(result.isRight()).toBe(true);
+            expect(fileValidator.analyze).toHaveBeenCalledWith(content);
+            expect(imageProcessor.resizeStream).not.toHaveBeenCalled();
+        });
+    });
 });
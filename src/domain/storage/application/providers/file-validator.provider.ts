@@ -1,7 +1,43 @@
+import { Readable } from "stream";
+
+export interface ImageAnalysis {
+    format: string;
+    width: number;
+    height: number;
+    /** EXIF orientation (1-8), when present */
+    orientation?: number;
+}
+
+/**
+ * Everything an upload needs to know about its content, computed once and reused by every step
+ */
+export interface FileAnalysis {
+    mimeType: string | null;
+    /** Present when the content is an image whose header could be read */
+    image?: ImageAnalysis;
+}
+
 export interface ValidationResult {
     isValid: boolean;
     error?: string;
     detectedMimeType?: string;
+    /** Analysis the validation was based on, so callers don't have to inspect the file again */
+    analysis?: FileAnalysis;
+}
+
+export interface StreamMimeTypeResult {
+    mimeType: string | null;
+    /** Image header read from the leading bytes; absent when it isn't an image or the header didn't fit the sample */
+    image?: ImageAnalysis;
+    /** The inspected stream, replaying the leading bytes consumed while sniffing */
+    stream: Readable;
+}
+
+export interface StreamValidationResult extends ValidationResult {
+    /** Image header read from the leading bytes; absent when it isn't an image or the header didn't fit the sample */
+    image?: ImageAnalysis;
+    /** The inspected stream, replaying the leading bytes consumed while sniffing */
+    stream: Readable;
 }
 
 export interface ValidationOptions {
@@ -24,6 +60,11 @@ export interface IFileValidatorProvider {
      */
     validateMimeType(buffer: Buffer, allowedTypes?: string[]): Promise<ValidationResult>;
 
+    /**
+     * Validate a stream's MIME type by sniffing only its leading bytes
+     */
+    validateMimeTypeFromStream(stream: Readable, allowedTypes?: string[]): Promise<StreamValidationResult>;
+
     /**
      * Validate file size
      */
@@ -34,13 +75,23 @@ export interface IFileValidatorProvider {
      */
     validateDimensions(buffer: Buffer, options: ValidationOptions): Promise<ValidationResult>;
 
+    /**
+     * Validate dimensions that are already known, e.g. read from a stream's image header
+     */
+    validateImageDimensions(dimensions: ImageDimensions | null, options: ValidationOptions): ValidationResult;
+
     /**
      * Get image dimensions from buffer
      */
     getImageDimensions(buffer: Buffer): Promise<ImageDimensions | null>;
 
     /**
-     * Complete validation (MIME + size + dimensions for images)
+     * Inspect the content once: MIME type (magic bytes) and, for images, format, dimensions and orientation
+     */
+    analyze(buffer: Buffer): Promise<FileAnalysis>;
+
+    /**
+     * Complete validation (MIME + size + dimensions for images), returning the analysis it used
      */
     validate(buffer: Buffer, options: ValidationOptions): Promise<ValidationResult>;
 
@@ -48,4 +99,10 @@ export interface IFileValidatorProvider {
      * Detect real MIME type using magic bytes
      */
     detectMimeType(buffer: Buffer): Promise<string | null>;
+
+    /**
+     * Detect real MIME type from the leading bytes of a stream without buffering it.
+     * For images, the header (format, dimensions, orientation) is read from the same bytes.
+     */
+    detectMimeTypeFromStream(stream: Readable): Promise<StreamMimeTypeResult>;
 }
@@ -1,3 +1,6 @@
+import { Duplex } from "stream";
+import { ImageAnalysis } from "./file-validator.provider";
+
 export interface ResizeOptions {
     width?: number;
     height?: number;
@@ -14,6 +17,16 @@ export interface ProcessedImage {
     mimeType: string;
 }
 
+export type ImageTransformResult = Omit<ProcessedImage, "buffer">;
+
+export interface ImageTransformStream {
+    /** Duplex stream to pipe the source image through */
+    stream: Duplex;
+    mimeType: string;
+    /** Resolves with the output properties once the stream has been fully processed */
+    result: Promise<ImageTransformResult>;
+}
+
 export interface ThumbnailConfig {
     name: string;
     width: number;
@@ -28,14 +41,20 @@ export interface IImageProcessorProvider {
     resize(buffer: Buffer, options: ResizeOptions): Promise<ProcessedImage>;
 
     /**
-     * Generate multiple thumbnails
+     * Create a streaming resize transform (input and output are never fully held in memory by the caller).
+     * Resolves once an image processing slot is available; the slot is held until the stream ends or is destroyed.
+     */
+    resizeStream(options: ResizeOptions): Promise<ImageTransformStream>;
+
+    /**
+     * Generate multiple thumbnails from a single decoded source
      */
     generateThumbnails(buffer: Buffer, configs: ThumbnailConfig[]): Promise<Map<string, ProcessedImage>>;
 
     /**
-     * Optimize image without resizing (compression only)
+     * Optimize image without resizing (compression only). Pass the upload analysis to skip re-reading the format.
      */
-    optimize(buffer: Buffer, quality?: number): Promise<ProcessedImage>;
+    optimize(buffer: Buffer, quality?: number, analysis?: ImageAnalysis): Promise<ProcessedImage>;
 
     /**
      * Convert image to a different format
@@ -0,0 +1,27 @@
+export type SignedUrlAction = "read";
+
+export interface SignedUrlCacheKey {
+    path: string;
+    action: SignedUrlAction;
+    /** Lifetime the URL was requested with */
+    expiresInMinutes: number;
+}
+
+export interface CachedSignedUrl {
+    url: string;
+    expiresAt: Date;
+}
+
+export interface ISignedUrlCacheProvider {
+    /**
+     * Cached URL for the key that stays valid at least until `validUntil`, or null
+     */
+    get(key: SignedUrlCacheKey, validUntil: Date): Promise<string | null>;
+
+    set(key: SignedUrlCacheKey, value: CachedSignedUrl): Promise<void>;
+
+    /**
+     * Drop every cached URL for the path (all actions and lifetimes)
+     */
+    invalidate(path: string): Promise<void>;
+}
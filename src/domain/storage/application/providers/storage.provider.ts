@@ -12,6 +12,34 @@ export interface UploadResult {
     size: number;
 }
 
+export interface StoredObjectInfo {
+    size: number;
+    /** Opaque validator (unquoted) that changes whenever the content changes */
+    etag: string;
+}
+
+/** Inclusive byte range */
+export interface ByteRange {
+    start: number;
+    end: number;
+}
+
+export interface CopyPair {
+    sourcePath: string;
+    destinationPath: string;
+}
+
+export interface BulkOperationFailure {
+    /** Path that failed (the source path for copies) */
+    path: string;
+    error: string;
+}
+
+export interface BulkOperationResult {
+    succeeded: string[];
+    failed: BulkOperationFailure[];
+}
+
 export interface IStorageProvider {
     /**
      * Upload a file using streams (for large files)
@@ -24,15 +52,36 @@ export interface IStorageProvider {
     uploadBuffer(buffer: Buffer, options: UploadOptions): Promise<UploadResult>;
 
     /**
-     * Delete a file from storage
+     * Delete a file from storage (missing files are ignored)
      */
     delete(path: string): Promise<void>;
 
+    /**
+     * Delete many files in parallel (bounded). Missing files count as deleted;
+     * other failures are reported per path instead of aborting the batch.
+     */
+    deleteMany(paths: string[]): Promise<BulkOperationResult>;
+
+    /**
+     * Delete every file whose path starts with the prefix (e.g. a whole entity folder)
+     */
+    deleteByPrefix(prefix: string): Promise<BulkOperationResult>;
+
     /**
      * Check if a file exists
      */
     exists(path: string): Promise<boolean>;
 
+    /**
+     * Size and ETag of a stored file, or null when it doesn't exist
+     */
+    stat(path: string): Promise<StoredObjectInfo | null>;
+
+    /**
+     * Stream a file's content, optionally only a byte range
+     */
+    createReadStream(path: string, range?: ByteRange): Promise<Readable>;
+
     /**
      * Get a signed URL for temporary access
      */
@@ -47,4 +96,9 @@ export interface IStorageProvider {
      * Copy a file to a new location (used for versioning)
      */
     copy(sourcePath: string, destinationPath: string): Promise<void>;
+
+    /**
+     * Copy many files in parallel (bounded), reporting failures per source path
+     */
+    copyMany(pairs: CopyPair[]): Promise<BulkOperationResult>;
 }
@@ -1,5 +1,13 @@
+import { PageCursor } from "@/domain/@shared/value-objects/page-cursor.vo";
 import { File } from "../../enterprise/entities/file.entity";
 
+export interface FindByEntityOptions {
+    /** Maximum number of files to return (default: all) */
+    limit?: number;
+    /** Continue after this position (newest first: ordered by creation date, then id, descending) */
+    after?: PageCursor;
+}
+
 export interface FilesRepository {
     /**
      * Find file by ID
@@ -12,15 +20,20 @@ export interface FilesRepository {
     findByPath(path: string): Promise<File | null>;
 
     /**
-     * Find files by entity (polymorphic)
+     * Find files by entity (polymorphic), newest first
      */
-    findByEntity(entityType: string, entityId: string): Promise<File[]>;
+    findByEntity(entityType: string, entityId: string, options?: FindByEntityOptions): Promise<File[]>;
 
     /**
      * Find file by entity and field (e.g., user's avatar)
      */
     findByEntityAndField(entityType: string, entityId: string, field: string): Promise<File | null>;
 
+    /**
+     * Find files of several entities for the same field in a single query (e.g., avatars of a user list)
+     */
+    findByEntitiesAndField(entityType: string, entityIds: string[], field: string): Promise<File[]>;
+
     /**
      * Create a new file record
      */
@@ -0,0 +1,30 @@
+import { Transform, TransformCallback } from "stream";
+import { FileTooLargeError } from "../../errors/file-too-large.error";
+
+/**
+ * Pass-through stream that fails with FileTooLargeError as soon as more than
+ * `maxSizeBytes` have flowed through it, so oversized uploads are rejected
+ * incrementally instead of after being fully read.
+ */
+export class SizeLimitStream extends Transform {
+    private bytesSeen = 0;
+
+    constructor(private readonly maxSizeBytes: number) {
+        super();
+    }
+
+    get size() {
+        return this.bytesSeen;
+    }
+
+    _transform(chunk: Buffer, _encoding: BufferEncoding, callback: TransformCallback): void {
+        this.bytesSeen += chunk.length;
+
+        if (this.bytesSeen > this.maxSizeBytes) {
+            callback(new FileTooLargeError(this.bytesSeen, this.maxSizeBytes));
+            return;
+        }
+
+        callback(null, chunk);
+    }
+}
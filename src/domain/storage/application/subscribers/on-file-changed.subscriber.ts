@@ -0,0 +1,23 @@
+import { DomainEvents } from "@/domain/@shared/events/domain-events";
+import { EventHandler } from "@/domain/@shared/events/event-handler";
+import { FileDeletedEvent } from "../../enterprise/events/file-deleted.event";
+import { FileUploadedEvent } from "../../enterprise/events/file-uploaded.event";
+import { ISignedUrlCacheProvider } from "../providers/signed-url-cache.provider";
+
+export class OnFileChangedSubscriber implements EventHandler {
+    constructor(private signedUrlCache: ISignedUrlCacheProvider) {
+        this.setupSubscriptions();
+    }
+
+    setupSubscriptions(): void {
+        DomainEvents.register(this.invalidateSignedUrls.bind(this), FileDeletedEvent.name);
+        DomainEvents.register(this.invalidateSignedUrls.bind(this), FileUploadedEvent.name);
+    }
+
+    /**
+     * Deleted or re-uploaded paths must not keep serving previously signed URLs from the cache
+     */
+    private async invalidateSignedUrls(event: FileDeletedEvent | FileUploadedEvent): Promise<void> {
+        await this.signedUrlCache.invalidate(event.file.path.toString());
+    }
+}
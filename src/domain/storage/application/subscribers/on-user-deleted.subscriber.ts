@@ -1,10 +1,17 @@
+import { Logger } from "@nestjs/common";
 import { DomainEvents } from "@/domain/@shared/events/domain-events";
 import { EventHandler } from "@/domain/@shared/events/event-handler";
+import { PageCursor } from "@/domain/@shared/value-objects/page-cursor.vo";
 import { UserDeletedEvent } from "@/domain/identity/enterprise/events/user-deleted.event";
 import { FilesRepository } from "../repositories/files.repository";
 import { IStorageProvider } from "../providers/storage.provider";
 
 export class OnUserDeletedSubscriber implements EventHandler {
+    private readonly logger = new Logger(OnUserDeletedSubscriber.name);
+
+    /** File records loaded per query while collecting the user's folders */
+    private readonly pageSize = 500;
+
     constructor(
         private filesRepository: FilesRepository,
         private storageProvider: IStorageProvider,
@@ -19,18 +26,38 @@ export class OnUserDeletedSubscriber implements EventHandler {
     private async deleteUserFiles(event: UserDeletedEvent): Promise<void> {
         const userId = event.getAggregateId().toString();
 
-        // Find all files associated with this user
-        const files = await this.filesRepository.findByEntity("user", userId);
-
-        // Delete each file from storage and database
-        for (const file of files) {
-            try {
-                // Delete from cloud storage
-                await this.storageProvider.delete(file.path.toString());
-            } catch {
-                // Log error but continue - file might already be deleted from storage
-                console.error(`Failed to delete file from storage: ${file.path.toString()}`);
+        // Purge each folder holding the user's files in one bulk operation (also catches
+        // leftovers without a record), instead of one storage round trip per file
+        const directories = new Set<string>();
+        let after: PageCursor | undefined;
+
+        // Page through the records so users with many files aren't loaded at once
+        while (true) {
+            const files = await this.filesRepository.findByEntity("user", userId, { limit: this.pageSize, after });
+
+            files.forEach((file) => directories.add(file.path.entityDirectory));
+
+            if (files.length < this.pageSize) break;
+
+            after = PageCursor.fromEntity(files[files.length - 1]);
+        }
+
+        const results = await Promise.all(
+            [...directories].map((directory) => this.storageProvider.deleteByPrefix(directory)),
+        );
+
+        const failed = results.flatMap((result) => result.failed);
+
+        if (failed.length > 0) {
+            for (const failure of failed) {
+                this.logger.error(`Failed to delete file from storage: ${failure.path} (${failure.error})`);
             }
+
+            // Keep the records so a retry (outbox bus) finds the folders again
+            throw new AggregateError(
+                failed.map((failure) => new Error(`${failure.path}: ${failure.error}`)),
+                `Failed to delete ${failed.length} file(s) of user ${userId} from storage`,
+            );
         }
 
         // Delete all file records from database
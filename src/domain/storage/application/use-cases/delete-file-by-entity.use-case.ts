@@ -34,7 +34,7 @@ export class DeleteFileByEntityUseCase {
         file.delete();
 
         // Dispatch domain events before physical deletion
-        DomainEvents.dispatchEventsForAggregate(file.id);
+        await DomainEvents.dispatchEventsForAggregate(file.id);
 
         // Delete from storage
         await this.storageProvider.delete(file.path.toString());
@@ -32,7 +32,7 @@ export class DeleteFileUseCase {
         file.delete();
 
         // Dispatch domain events before physical deletion
-        DomainEvents.dispatchEventsForAggregate(file.id);
+        await DomainEvents.dispatchEventsForAggregate(file.id);
 
         // Delete from storage
         await this.storageProvider.delete(file.path.toString());
@@ -0,0 +1,114 @@
+import { Readable } from "stream";
+import { Either, Left, Right } from "@/domain/@shared/either";
+import { File } from "../../enterprise/entities/file.entity";
+import { FilesRepository } from "../repositories/files.repository";
+import { ByteRange, IStorageProvider, StoredObjectInfo } from "../providers/storage.provider";
+import { FileNotFoundError } from "../../errors/file-not-found.error";
+import { RangeNotSatisfiableError } from "../../errors/range-not-satisfiable.error";
+
+/**
+ * `{ start }` reads to the end, `{ suffixLength }` reads the last bytes (HTTP "bytes=-N")
+ */
+export type RequestedRange = { start: number; end?: number } | { suffixLength: number };
+
+interface DownloadFileRequest {
+    path: string;
+    range?: RequestedRange;
+    /** Raw If-None-Match value: the content isn't opened when it matches */
+    ifNoneMatch?: string;
+}
+
+type DownloadFileError = FileNotFoundError | RangeNotSatisfiableError;
+
+type DownloadFileResponse = Either<
+    DownloadFileError,
+    {
+        file: File;
+        info: StoredObjectInfo;
+        notModified: boolean;
+        /** Resolved range when a partial response is served */
+        range?: ByteRange;
+        /** Null when not modified */
+        stream: Readable | null;
+    }
+>;
+
+export class DownloadFileUseCase {
+    constructor(
+        private filesRepository: FilesRepository,
+        private storageProvider: IStorageProvider,
+    ) {}
+
+    async execute(request: DownloadFileRequest): Promise<DownloadFileResponse> {
+        const { path, range, ifNoneMatch } = request;
+
+        // Only files with a record can be downloaded
+        const file = await this.filesRepository.findByPath(path);
+
+        if (!file) {
+            return Left.call(new FileNotFoundError(path));
+        }
+
+        const info = await this.storageProvider.stat(path);
+
+        if (!info) {
+            return Left.call(new FileNotFoundError(path));
+        }
+
+        if (ifNoneMatch && this.matchesETag(ifNoneMatch, info.etag)) {
+            return Right.call({ file, info, notModified: true, stream: null });
+        }
+
+        let byteRange: ByteRange | undefined;
+
+        if (range) {
+            const resolved = this.resolveRange(range, info.size);
+
+            if (!resolved) {
+                return Left.call(new RangeNotSatisfiableError(info.size));
+            }
+
+            // A range covering the whole file is served as a regular response
+            if (resolved.start > 0 || resolved.end < info.size - 1) {
+                byteRange = resolved;
+            }
+        }
+
+        const stream = await this.storageProvider.createReadStream(path, byteRange);
+
+        return Right.call({ file, info, notModified: false, range: byteRange, stream });
+    }
+
+    private resolveRange(range: RequestedRange, size: number): ByteRange | null {
+        if (size === 0) {
+            return null;
+        }
+
+        if ("suffixLength" in range) {
+            if (range.suffixLength <= 0) {
+                return null;
+            }
+
+            return { start: Math.max(0, size - range.suffixLength), end: size - 1 };
+        }
+
+        const end = Math.min(range.end ?? size - 1, size - 1);
+
+        if (range.start >= size || range.start > end) {
+            return null;
+        }
+
+        return { start: range.start, end };
+    }
+
+    /**
+     * Weak comparison, as If-None-Match requires
+     */
+    private matchesETag(ifNoneMatch: string, etag: string): boolean {
+        const normalize = (value: string) => value.trim().replace(/^W\//, "").replace(/^"(.*)"$/, "$1");
+
+        return ifNoneMatch
+            .split(",")
+            .some((candidate) => candidate.trim() === "*" || normalize(candidate) === normalize(etag));
+    }
+}
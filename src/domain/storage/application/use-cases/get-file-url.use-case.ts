@@ -1,6 +1,8 @@
 import { Either, Left, Right } from "@/domain/@shared/either";
+import { File } from "../../enterprise/entities/file.entity";
 import { FilesRepository } from "../repositories/files.repository";
 import { IStorageProvider } from "../providers/storage.provider";
+import { ISignedUrlCacheProvider } from "../providers/signed-url-cache.provider";
 import { FileNotFoundError } from "../../errors/file-not-found.error";
 
 interface GetFileUrlRequest {
@@ -12,22 +14,40 @@ interface GetFileUrlRequest {
     expiresInMinutes?: number;
 }
 
+interface GetFileUrlsByEntitiesRequest {
+    entityType: string;
+    entityIds: string[];
+    field: string;
+    signed?: boolean;
+    expiresInMinutes?: number;
+}
+
+export interface FileUrl {
+    url: string;
+    filename: string;
+    mimeType: string;
+    size: number;
+}
+
 type GetFileUrlError = FileNotFoundError;
 
-type GetFileUrlResponse = Either<
-    GetFileUrlError,
-    {
-        url: string;
-        filename: string;
-        mimeType: string;
-        size: number;
-    }
->;
+type GetFileUrlResponse = Either<GetFileUrlError, FileUrl>;
+
+/**
+ * Files keyed by entityId. Entities without a file for the field are absent from the map.
+ */
+type GetFileUrlsByEntitiesResponse = Either<never, { files: Map<string, FileUrl> }>;
 
 export class GetFileUrlUseCase {
+    /** Signed URLs are valid for this multiple of the requested lifetime, so they can be reused for a while */
+    private readonly signedLifetimeFactor = 2;
+    /** Longest lifetime of a V4 signed URL */
+    private readonly maxSignedLifetimeMinutes = 7 * 24 * 60;
+
     constructor(
         private filesRepository: FilesRepository,
         private storageProvider: IStorageProvider,
+        private signedUrlCache: ISignedUrlCacheProvider,
     ) {}
 
     async execute(request: GetFileUrlRequest): Promise<GetFileUrlResponse> {
@@ -45,15 +65,70 @@ export class GetFileUrlUseCase {
             return Left.call(new FileNotFoundError(fileId ?? `${entityType}/${entityId}/${field}`));
         }
 
+        return Right.call(await this.toFileUrl(file, signed, expiresInMinutes));
+    }
+
+    /**
+     * Resolve the URLs of the same field for many entities with a single repository query
+     */
+    async executeMany(request: GetFileUrlsByEntitiesRequest): Promise<GetFileUrlsByEntitiesResponse> {
+        const { entityType, field, signed = false, expiresInMinutes = 60 } = request;
+
+        const entityIds = [...new Set(request.entityIds)];
+        const files = new Map<string, FileUrl>();
+
+        if (entityIds.length === 0) {
+            return Right.call({ files });
+        }
+
+        const found = await this.filesRepository.findByEntitiesAndField(entityType, entityIds, field);
+
+        await Promise.all(
+            found.map(async (file) => {
+                files.set(file.entityId, await this.toFileUrl(file, signed, expiresInMinutes));
+            }),
+        );
+
+        return Right.call({ files });
+    }
+
+    private async toFileUrl(file: File, signed: boolean, expiresInMinutes: number): Promise<FileUrl> {
         const url = signed
-            ? await this.storageProvider.getSignedUrl(file.path.toString(), expiresInMinutes)
+            ? await this.getSignedUrl(file.path.toString(), expiresInMinutes)
             : this.storageProvider.getPublicUrl(file.path.toString());
 
-        return Right.call({
+        return {
             url,
             filename: file.filename,
             mimeType: file.mimeType,
             size: file.size,
-        });
+        };
+    }
+
+    /**
+     * Signing is expensive (RSA or an IAM signBlob call), so URLs are signed for twice the requested
+     * lifetime and a cached one is reused while it remains valid for at least the requested lifetime.
+     * A signed URL therefore stays valid for between `expiresInMinutes` and twice as long.
+     */
+    private async getSignedUrl(path: string, expiresInMinutes: number): Promise<string> {
+        const key = { path, action: "read" as const, expiresInMinutes };
+        const now = Date.now();
+
+        const cached = await this.signedUrlCache.get(key, new Date(now + expiresInMinutes * 60 * 1000));
+
+        if (cached) {
+            return cached;
+        }
+
+        const signedMinutes = Math.max(
+            expiresInMinutes,
+            Math.min(expiresInMinutes * this.signedLifetimeFactor, this.maxSignedLifetimeMinutes),
+        );
+        const url = await this.storageProvider.getSignedUrl(path, signedMinutes);
+
+        // Signed after `now`, so the URL lives at least until this
+        await this.signedUrlCache.set(key, { url, expiresAt: new Date(now + signedMinutes * 60 * 1000) });
+
+        return url;
     }
 }
@@ -1,4 +1,4 @@
-import { Readable } from "stream";
+import { pipeline, Readable } from "stream";
 import { Either, Left, Right } from "@/domain/@shared/either";
 import { DomainEvents } from "@/domain/@shared/events/domain-events";
 import { File } from "../../enterprise/entities/file.entity";
@@ -6,19 +6,24 @@ import { FilePath } from "../../enterprise/value-objects/file-path.vo";
 import { FileMetadata } from "../../enterprise/value-objects/file-metadata.vo";
 import { FilesRepository } from "../repositories/files.repository";
 import { IStorageProvider } from "../providers/storage.provider";
-import { IFileValidatorProvider, ValidationOptions } from "../providers/file-validator.provider";
-import { IImageProcessorProvider, ResizeOptions } from "../providers/image-processor.provider";
+import {
+    FileAnalysis,
+    IFileValidatorProvider,
+    ImageAnalysis,
+    ValidationOptions,
+} from "../providers/file-validator.provider";
+import { IImageProcessorProvider, ImageTransformStream, ResizeOptions } from "../providers/image-processor.provider";
+import { SizeLimitStream } from "../streams/size-limit.stream";
 import { InvalidFileTypeError } from "../../errors/invalid-file-type.error";
 import { FileTooLargeError } from "../../errors/file-too-large.error";
 import { InvalidImageDimensionsError } from "../../errors/invalid-image-dimensions.error";
 import { StorageUploadError } from "../../errors/storage-upload.error";
 
-interface UploadFileRequest {
+interface UploadFileBaseRequest {
     entityType: string;
     entityId: string;
     field: string;
     filename: string;
-    buffer: Buffer;
     environment: string;
     validationOptions?: ValidationOptions;
     /** Optimize image before saving (resize/compress). Only the optimized version is saved. */
@@ -26,6 +31,16 @@ interface UploadFileRequest {
     replaceExisting?: boolean;
 }
 
+type UploadFileSource =
+    | { buffer: Buffer; stream?: undefined }
+    /**
+     * Streaming mode: the content is validated and uploaded chunk by chunk. Image dimensions come
+     * from the header in the leading bytes; it is only buffered when that header can't be read.
+     */
+    | { stream: Readable; buffer?: undefined };
+
+type UploadFileRequest = UploadFileBaseRequest & UploadFileSource;
+
 type UploadFileError =
     | InvalidFileTypeError
     | FileTooLargeError
@@ -34,6 +49,13 @@ type UploadFileError =
 
 type UploadFileResponse = Either<UploadFileError, { file: File }>;
 
+interface StoredContent {
+    mimeType: string;
+    size: number;
+    width?: number;
+    height?: number;
+}
+
 export class UploadFileUseCase {
     constructor(
         private filesRepository: FilesRepository,
@@ -43,19 +65,19 @@ export class UploadFileUseCase {
     ) {}
 
     async execute(request: UploadFileRequest): Promise<UploadFileResponse> {
-        const {
-            entityType,
-            entityId,
-            field,
-            filename,
-            buffer,
-            environment,
-            validationOptions,
-            optimizeImage,
-            replaceExisting = true,
-        } = request;
-
-        // Validate file
+        if (request.stream) {
+            return this.executeStream(request, request.stream);
+        }
+
+        return this.executeBuffer(request, request.buffer);
+    }
+
+    private async executeBuffer(request: UploadFileBaseRequest, buffer: Buffer): Promise<UploadFileResponse> {
+        const { validationOptions, optimizeImage } = request;
+
+        // Validate file; the analysis it computes is reused by every later step
+        let analysis: FileAnalysis | undefined;
+
         if (validationOptions) {
             const validationResult = await this.fileValidator.validate(buffer, validationOptions);
 
@@ -72,18 +94,22 @@ export class UploadFileUseCase {
                     return Left.call(new InvalidImageDimensionsError(validationResult.error));
                 }
             }
+
+            analysis = validationResult.analysis;
         }
 
-        // Detect MIME type
-        let detectedMimeType = await this.fileValidator.detectMimeType(buffer);
+        // Analyze once (MIME type + image header) when validation didn't already
+        analysis ??= await this.fileValidator.analyze(buffer);
+
+        let detectedMimeType = analysis.mimeType;
         if (!detectedMimeType) {
             return Left.call(new InvalidFileTypeError());
         }
 
         // Process image: optimize/resize if requested (only save optimized version)
         let finalBuffer = buffer;
-        let width: number | undefined;
-        let height: number | undefined;
+        let width = analysis.image?.width;
+        let height = analysis.image?.height;
 
         if (detectedMimeType.startsWith("image/") && optimizeImage) {
             const processed = await this.imageProcessor.resize(buffer, optimizeImage);
@@ -91,52 +117,151 @@ export class UploadFileUseCase {
             width = processed.width;
             height = processed.height;
             detectedMimeType = processed.mimeType;
-        } else if (detectedMimeType.startsWith("image/")) {
-            // Just get dimensions without processing
-            const dimensions = await this.fileValidator.getImageDimensions(buffer);
-            if (dimensions) {
-                width = dimensions.width;
-                height = dimensions.height;
+        }
+
+        const mimeType = detectedMimeType;
+
+        return this.store(request, async (path) => {
+            await this.storageProvider.uploadStream(Readable.from(finalBuffer), { path, mimeType });
+
+            return { mimeType, size: finalBuffer.length, width, height };
+        });
+    }
+
+    private async executeStream(request: UploadFileBaseRequest, source: Readable): Promise<UploadFileResponse> {
+        const { validationOptions, optimizeImage } = request;
+
+        // Sniff the MIME type (and the image header) from the leading bytes only
+        let mimeType: string | null;
+        let image: ImageAnalysis | undefined;
+        let stream: Readable;
+
+        if (validationOptions) {
+            const validationResult = await this.fileValidator.validateMimeTypeFromStream(
+                source,
+                validationOptions.allowedMimeTypes,
+            );
+
+            if (!validationResult.isValid) {
+                validationResult.stream.destroy();
+                return Left.call(new InvalidFileTypeError(validationResult.detectedMimeType));
+            }
+
+            mimeType = validationResult.detectedMimeType ?? null;
+            image = validationResult.image;
+            stream = validationResult.stream;
+        } else {
+            ({ mimeType, image, stream } = await this.fileValidator.detectMimeTypeFromStream(source));
+        }
+
+        if (!mimeType) {
+            stream.destroy();
+            return Left.call(new InvalidFileTypeError());
+        }
+
+        // Enforce the size limit incrementally while the content flows
+        if (validationOptions?.maxSizeBytes) {
+            stream = pipeline(stream, new SizeLimitStream(validationOptions.maxSizeBytes), () => undefined);
+        }
+
+        const isImage = mimeType.startsWith("image/");
+        const hasDimensionConstraints =
+            validationOptions?.minWidth ||
+            validationOptions?.maxWidth ||
+            validationOptions?.minHeight ||
+            validationOptions?.maxHeight;
+
+        // The header didn't fit the sample: dimensions need the whole image, fall back to the buffer path
+        if (isImage && !image && (!optimizeImage || hasDimensionConstraints)) {
+            let buffer: Buffer;
+
+            try {
+                buffer = await this.readToBuffer(stream);
+            } catch (error) {
+                if (error instanceof FileTooLargeError) {
+                    return Left.call(error);
+                }
+                throw error;
+            }
+
+            return this.executeBuffer(request, buffer);
+        }
+
+        if (isImage && validationOptions && hasDimensionConstraints) {
+            const dimensionResult = this.fileValidator.validateImageDimensions(image ?? null, validationOptions);
+
+            if (!dimensionResult.isValid) {
+                stream.destroy();
+                return Left.call(new InvalidImageDimensionsError(dimensionResult.error));
             }
         }
 
-        // Check for existing file and delete it if replacing
+        let transform: ImageTransformStream | undefined;
+
+        if (isImage && optimizeImage) {
+            transform = await this.imageProcessor.resizeStream(optimizeImage);
+            stream = pipeline(stream, transform.stream, () => undefined);
+        }
+
+        const uploadMimeType = transform?.mimeType ?? mimeType;
+        const body = stream;
+
+        try {
+            return await this.store(request, async (path) => {
+                const uploaded = await this.storageProvider.uploadStream(body, { path, mimeType: uploadMimeType });
+                // Resized images report their output size; the others keep the dimensions from the header
+                const output = transform ? await transform.result : image;
+
+                return {
+                    mimeType: uploadMimeType,
+                    size: uploaded.size,
+                    width: output?.width,
+                    height: output?.height,
+                };
+            });
+        } finally {
+            // Tear the pipeline down when the upload didn't consume it, releasing the image processing slot
+            body.destroy();
+        }
+    }
+
+    private async store(
+        request: UploadFileBaseRequest,
+        upload: (path: string) => Promise<StoredContent>,
+    ): Promise<UploadFileResponse> {
+        const { entityType, entityId, field, filename, environment, replaceExisting = true } = request;
+
         const existingFile = await this.filesRepository.findByEntityAndField(
             entityType,
             entityId,
             field,
         );
 
-        if (existingFile && replaceExisting) {
-            // Delete old file from storage
-            await this.storageProvider.delete(existingFile.path.toString());
-            // Delete from database
-            await this.filesRepository.delete(existingFile.id.toString());
-        }
-
         // Build file path
         const filePath = FilePath.build(entityType, entityId, filename, environment);
 
-        // Upload to storage (only the optimized version)
+        // Upload to storage (only the optimized version). The size limit and the image decode
+        // only fail here, so the existing file is kept until the replacement is stored.
+        let content: StoredContent;
+
         try {
-            const stream = Readable.from(finalBuffer);
-            await this.storageProvider.uploadStream(stream, {
-                path: filePath.toString(),
-                mimeType: detectedMimeType,
-            });
+            content = await upload(filePath.toString());
         } catch (error) {
+            if (error instanceof FileTooLargeError) {
+                return Left.call(error);
+            }
             return Left.call(
                 new StorageUploadError(error instanceof Error ? error.message : "Unknown error"),
             );
         }
 
+        // Paths are unique: the old record goes before the new one is created
+        if (existingFile && replaceExisting) {
+            await this.filesRepository.delete(existingFile.id.toString());
+        }
+
         // Create file record
-        const fileMetadata = FileMetadata.create({
-            mimeType: detectedMimeType,
-            size: finalBuffer.length,
-            width,
-            height,
-        });
+        const fileMetadata = FileMetadata.create(content);
 
         const file = File.create({
             entityType,
@@ -149,9 +274,24 @@ export class UploadFileUseCase {
 
         const savedFile = await this.filesRepository.create(file);
 
+        // Same filename in the same month: the upload already overwrote the old object
+        if (existingFile && replaceExisting && existingFile.path.toString() !== filePath.toString()) {
+            await this.storageProvider.delete(existingFile.path.toString());
+        }
+
         // Dispatch domain events (FileUploadedEvent)
-        DomainEvents.dispatchEventsForAggregate(file.id);
+        await DomainEvents.dispatchEventsForAggregate(file.id);
 
         return Right.call({ file: savedFile });
     }
+
+    private async readToBuffer(stream: Readable): Promise<Buffer> {
+        const chunks: Buffer[] = [];
+
+        for await (const chunk of stream) {
+            chunks.push(chunk);
+        }
+
+        return Buffer.concat(chunks);
+    }
 }
@@ -0,0 +1,33 @@
+import { Semaphore } from "@/domain/@shared/utils/semaphore";
+import { BulkOperationResult } from "../providers/storage.provider";
+
+/**
+ * Run `operation` for every item with at most `concurrency` in flight.
+ * A failing item is reported under its key and doesn't stop the others.
+ */
+export async function runBulkOperation<T>(
+    items: T[],
+    concurrency: number,
+    keyOf: (item: T) => string,
+    operation: (item: T) => Promise<void>,
+): Promise<BulkOperationResult> {
+    const slots = new Semaphore(concurrency);
+    const result: BulkOperationResult = { succeeded: [], failed: [] };
+
+    await Promise.all(
+        items.map((item) =>
+            slots.run(async () => {
+                const key = keyOf(item);
+
+                try {
+                    await operation(item);
+                    result.succeeded.push(key);
+                } catch (error) {
+                    result.failed.push({ path: key, error: error instanceof Error ? error.message : String(error) });
+                }
+            }),
+        ),
+    );
+
+    return result;
+}
@@ -70,8 +70,15 @@ export class FilePath extends ValueObject<FilePathProps> {
         return this.props.filename;
     }
 
-    toString(): string {
+    /**
+     * Folder holding the entity's files for this environment and month (with trailing slash)
+     */
+    get entityDirectory(): string {
         const monthPadded = this.props.month.toString().padStart(2, "0");
-        return `${this.props.environment}/${this.props.year}/${monthPadded}/${this.props.entityType}/${this.props.entityId}/${this.props.filename}`;
+        return `${this.props.environment}/${this.props.year}/${monthPadded}/${this.props.entityType}/${this.props.entityId}/`;
+    }
+
+    toString(): string {
+        return `${this.entityDirectory}${this.props.filename}`;
     }
 }
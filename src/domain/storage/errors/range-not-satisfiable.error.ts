@@ -0,0 +1,6 @@
+export class RangeNotSatisfiableError extends Error {
+    constructor(public readonly size: number) {
+        super(`Requested range not satisfiable (file size: ${size} bytes)`);
+        this.name = "RangeNotSatisfiableError";
+    }
+}
@@ -13,14 +13,48 @@ export const envSchema = z.object({
 
     JWT_PRIVATE_KEY: z.base64(),
     JWT_PUBLIC_KEY: z.base64(),
+    AUTH_TOKEN_CACHE_SIZE: z.coerce.number().int().positive().default(10000),
+
+    // Password hashing (bcrypt, in worker threads)
+    PASSWORD_HASH_ROUNDS: z.coerce.number().int().min(4).max(31).default(6),
+    PASSWORD_HASH_THREADS: z.coerce.number().int().min(0).optional(),
+    PASSWORD_HASH_QUEUE_SIZE: z.coerce.number().int().positive().default(100),
 
     GOOGLE_OAUTH2_CLIENT_ID: z.string(),
     GOOGLE_OAUTH2_CLIENT_SECRET: z.string(),
     GOOGLE_OAUTH2_REDIRECT_URL: z.string(),
 
+    // Storage
+    STORAGE_DRIVER: z.enum(["gcp", "local"]).default("gcp"),
+    STORAGE_BULK_CONCURRENCY: z.coerce.number().int().positive().optional(),
+
     // GCP Storage
     GCP_BUCKET_NAME: z.string().optional(),
     GCP_KEY_FILE_PATH: z.string().optional(),
+
+    // Local Storage
+    LOCAL_STORAGE_PATH: z.string().default("./storage"),
+    LOCAL_STORAGE_PUBLIC_URL: z.string().default("http://localhost:3333/storage/files"),
+
+    // Read-through disk cache in front of GCS (enabled when a path is set)
+    STORAGE_CACHE_PATH: z.string().optional(),
+    STORAGE_CACHE_MAX_MB: z.coerce.number().int().positive().default(512),
+    STORAGE_CACHE_MAX_AGE_SECONDS: z.coerce.number().int().min(0).default(300),
+
+    // Signed URLs are reused while enough of their lifetime remains
+    SIGNED_URL_CACHE_MAX_MB: z.coerce.number().int().positive().default(16),
+
+    // Image processing (sharp/libvips)
+    IMAGE_PROCESSING_THREADS: z.coerce.number().int().positive().optional(),
+    IMAGE_PROCESSING_CONCURRENCY: z.coerce.number().int().positive().optional(),
+    IMAGE_PROCESSING_CACHE_MB: z.coerce.number().int().min(0).optional(),
+
+    // Domain events
+    DOMAIN_EVENTS_BUS: z.enum(["in-process", "outbox"]).default("in-process"),
+    DOMAIN_EVENTS_CONCURRENCY: z.coerce.number().int().positive().default(4),
+    DOMAIN_EVENTS_QUEUE_SIZE: z.coerce.number().int().positive().default(1000),
+    OUTBOX_POLL_INTERVAL_MS: z.coerce.number().int().positive().default(1000),
+    OUTBOX_MAX_ATTEMPTS: z.coerce.number().int().positive().default(10),
 });
 
 export type Env = z.infer<typeof envSchema>;
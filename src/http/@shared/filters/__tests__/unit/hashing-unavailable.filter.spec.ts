@@ -0,0 +1,24 @@
+import { ArgumentsHost, HttpStatus } from "@nestjs/common";
+import { HashingUnavailableError } from "@/domain/@shared/errors/hashing-unavailable.error";
+import { HashingUnavailableFilter } from "../../hashing-unavailable.filter";
+
+describe("HashingUnavailableFilter", () => {
+    it("should answer 503 with a Retry-After header", () => {
+        const response = {
+            setHeader: jest.fn(),
+            status: jest.fn().mockReturnThis(),
+            json: jest.fn().mockReturnThis(),
+        };
+        const host = {
+            switchToHttp: () => ({ getResponse: () => response }),
+        } as unknown as ArgumentsHost;
+
+        new HashingUnavailableFilter().catch(new HashingUnavailableError(), host);
+
+        expect(response.setHeader).toHaveBeenCalledWith("Retry-After", "1");
+        expect(response.status).toHaveBeenCalledWith(HttpStatus.SERVICE_UNAVAILABLE);
+        expect(response.json).toHaveBeenCalledWith(
+            expect.objectContaining({ statusCode: 503, error: "Service Unavailable" }),
+        );
+    });
+});
@@ -0,0 +1,20 @@
+import { HashingUnavailableError } from "@/domain/@shared/errors/hashing-unavailable.error";
+import { ArgumentsHost, Catch, ExceptionFilter, HttpStatus } from "@nestjs/common";
+import type { Response } from "express";
+
+/**
+ * Shed load with a fast 503 when every password hashing worker is busy and the queue is full
+ */
+@Catch(HashingUnavailableError)
+export class HashingUnavailableFilter implements ExceptionFilter {
+    catch(exception: HashingUnavailableError, host: ArgumentsHost) {
+        const response = host.switchToHttp().getResponse<Response>();
+
+        response.setHeader("Retry-After", "1");
+        response.status(HttpStatus.SERVICE_UNAVAILABLE).json({
+            statusCode: HttpStatus.SERVICE_UNAVAILABLE,
+            message: exception.message,
+            error: "Service Unavailable",
+        });
+    }
+}
@@ -0,0 +1,69 @@
+import { CallHandler, ExecutionContext } from "@nestjs/common";
+import { EventEmitter } from "events";
+import { access, mkdtemp, rm, writeFile } from "fs/promises";
+import { tmpdir } from "os";
+import { join } from "path";
+import { lastValueFrom, of, throwError } from "rxjs";
+import { SpooledFileInterceptor } from "../../spooled-file.interceptor";
+
+const exists = (path: string) =>
+    access(path).then(
+        () => true,
+        () => false,
+    );
+
+const waitUntilRemoved = async (path: string) => {
+    for (let attempt = 0; (await exists(path)) && attempt < 50; attempt++) {
+        await new Promise((resolve) => setTimeout(resolve, 10));
+    }
+};
+
+describe("SpooledFileInterceptor", () => {
+    let dir: string;
+    let spooledPath: string;
+    let request: { headers: Record<string, string>; file?: Partial<Express.Multer.File> };
+    let response: EventEmitter;
+    let context: ExecutionContext;
+
+    beforeEach(async () => {
+        dir = await mkdtemp(join(tmpdir(), "spooled-file-"));
+        spooledPath = join(dir, "upload");
+        await writeFile(spooledPath, "content");
+
+        // Not a multipart request: multer leaves it alone, as if it had already spooled the file
+        request = { headers: {}, file: { path: spooledPath } };
+        response = new EventEmitter();
+        context = {
+            switchToHttp: () => ({ getRequest: () => request, getResponse: () => response }),
+        } as unknown as ExecutionContext;
+    });
+
+    afterEach(async () => {
+        await rm(dir, { recursive: true, force: true });
+    });
+
+    it("should remove the spooled file once the response is closed", async () => {
+        const sut = new (SpooledFileInterceptor("file", 1024))();
+        const next: CallHandler = { handle: () => of("ok") };
+
+        await expect(lastValueFrom(await sut.intercept(context, next))).resolves.toBe("ok");
+        expect(await exists(spooledPath)).toBe(true);
+
+        response.emit("close");
+        await waitUntilRemoved(spooledPath);
+
+        expect(await exists(spooledPath)).toBe(false);
+    });
+
+    it("should remove the spooled file when the request is rejected before the handler runs", async () => {
+        const sut = new (SpooledFileInterceptor("file", 1024))();
+        const next: CallHandler = { handle: () => throwError(() => new Error("Validation failed")) };
+
+        await expect(lastValueFrom(await sut.intercept(context, next))).rejects.toThrow("Validation failed");
+
+        response.emit("close");
+        await waitUntilRemoved(spooledPath);
+
+        expect(await exists(spooledPath)).toBe(false);
+    });
+});
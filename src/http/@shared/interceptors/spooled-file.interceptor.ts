@@ -0,0 +1,45 @@
+import { CallHandler, ExecutionContext, Injectable, mixin, NestInterceptor, Type } from "@nestjs/common";
+import { FileInterceptor } from "@nestjs/platform-express";
+import type { Request, Response } from "express";
+import { unlink } from "fs/promises";
+import { diskStorage } from "multer";
+import { Observable } from "rxjs";
+
+/**
+ * Multipart file interceptor that spools the upload to a temporary file instead of
+ * keeping it in memory, so handlers can stream it with `createReadStream(file.path)`.
+ * Oversized uploads are aborted while parsing (413).
+ *
+ * The temporary file is removed once the response is closed, whether the handler ran,
+ * failed, or the request was rejected by a pipe first: handlers never clean it up.
+ */
+export const SpooledFileInterceptor = (fieldName: string, maxSizeBytes: number): Type<NestInterceptor> => {
+    const MulterInterceptor = FileInterceptor(fieldName, {
+        storage: diskStorage({}),
+        limits: { fileSize: maxSizeBytes },
+    });
+
+    @Injectable()
+    class MixinInterceptor implements NestInterceptor {
+        private readonly multer = new MulterInterceptor();
+
+        async intercept(context: ExecutionContext, next: CallHandler): Promise<Observable<unknown>> {
+            const http = context.switchToHttp();
+            const request = http.getRequest<Request>();
+
+            http.getResponse<Response>().once("close", () => {
+                if (request.file) {
+                    void removeSpooledFile(request.file);
+                }
+            });
+
+            return this.multer.intercept(context, next);
+        }
+    }
+
+    return mixin(MixinInterceptor);
+};
+
+const removeSpooledFile = async (file: Express.Multer.File) => {
+    await unlink(file.path).catch(() => undefined);
+};
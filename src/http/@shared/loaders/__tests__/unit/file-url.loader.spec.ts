@@ -0,0 +1,120 @@
+import { FilesRepository } from "@/domain/storage/application/repositories/files.repository";
+import { IStorageProvider } from "@/domain/storage/application/providers/storage.provider";
+import { ISignedUrlCacheProvider } from "@/domain/storage/application/providers/signed-url-cache.provider";
+import { GetFileUrlUseCase } from "@/domain/storage/application/use-cases/get-file-url.use-case";
+import { File } from "@/domain/storage/enterprise/entities/file.entity";
+import { FilePath } from "@/domain/storage/enterprise/value-objects/file-path.vo";
+import { FileMetadata } from "@/domain/storage/enterprise/value-objects/file-metadata.vo";
+import { FileUrlLoader } from "../../file-url.loader";
+
+const makeAvatar = (entityId: string): File =>
+    File.create({
+        entityType: "user",
+        entityId,
+        field: "avatar",
+        filename: "avatar.png",
+        path: FilePath.build("user", entityId, "avatar.png", "development"),
+        metadata: FileMetadata.create({ mimeType: "image/png", size: 1024, width: 200, height: 200 }),
+    });
+
+const makeFilesRepository = (): jest.Mocked<FilesRepository> => ({
+    findById: jest.fn(),
+    findByPath: jest.fn(),
+    findByEntity: jest.fn(),
+    findByEntityAndField: jest.fn(),
+    findByEntitiesAndField: jest.fn(),
+    create: jest.fn(),
+    update: jest.fn(),
+    delete: jest.fn(),
+    deleteByEntity: jest.fn(),
+});
+
+const makeStorageProvider = (): jest.Mocked<IStorageProvider> => ({
+    uploadStream: jest.fn(),
+    uploadBuffer: jest.fn(),
+    delete: jest.fn(),
+    deleteMany: jest.fn(),
+    deleteByPrefix: jest.fn(),
+    exists: jest.fn(),
+    stat: jest.fn(),
+    createReadStream: jest.fn(),
+    getSignedUrl: jest.fn(),
+    getPublicUrl: jest.fn().mockImplementation((path: string) => `https://cdn.example.com/${path}`),
+    copy: jest.fn(),
+    copyMany: jest.fn(),
+});
+
+const makeSignedUrlCache = (): jest.Mocked<ISignedUrlCacheProvider> => ({
+    get: jest.fn().mockResolvedValue(null),
+    set: jest.fn(),
+    invalidate: jest.fn(),
+});
+
+describe("FileUrlLoader", () => {
+    let sut: FileUrlLoader;
+    let filesRepository: jest.Mocked<FilesRepository>;
+    let storageProvider: jest.Mocked<IStorageProvider>;
+
+    beforeEach(() => {
+        filesRepository = makeFilesRepository();
+        storageProvider = makeStorageProvider();
+        const getFileUrlUseCase = new GetFileUrlUseCase(filesRepository, storageProvider, makeSignedUrlCache());
+        sut = new FileUrlLoader(getFileUrlUseCase, { entityType: "user", field: "avatar" });
+    });
+
+    it("should resolve the loads of the same tick with a single repository query", async () => {
+        const userIds = Array.from({ length: 100 }, (_, i) => `user-${i}`);
+        filesRepository.findByEntitiesAndField.mockImplementation(async (_type, entityIds) =>
+            entityIds.map(makeAvatar),
+        );
+
+        const urls = await Promise.all(userIds.map((userId) => sut.load(userId)));
+
+        expect(filesRepository.findByEntitiesAndField).toHaveBeenCalledTimes(1);
+        expect(filesRepository.findByEntitiesAndField).toHaveBeenCalledWith("user", userIds, "avatar");
+        expect(filesRepository.findByEntityAndField).not.toHaveBeenCalled();
+        expect(urls).toHaveLength(100);
+        expect(urls[42]).toContain("/user/user-42/avatar.png");
+    });
+
+    it("should query each entity id once, however many times it is loaded", async () => {
+        filesRepository.findByEntitiesAndField.mockImplementation(async (_type, entityIds) =>
+            entityIds.map(makeAvatar),
+        );
+
+        const [first, second, third] = await sut.loadMany(["user-1", "user-2", "user-1"]);
+
+        expect(filesRepository.findByEntitiesAndField).toHaveBeenCalledWith("user", ["user-1", "user-2"], "avatar");
+        expect(first).toBe(third);
+        expect(second).not.toBe(first);
+    });
+
+    it("should resolve entities without a file to null", async () => {
+        filesRepository.findByEntitiesAndField.mockResolvedValue([makeAvatar("user-1")]);
+
+        const urls = await sut.loadMany(["user-1", "user-2"]);
+
+        expect(urls[0]).toContain("/user/user-1/avatar.png");
+        expect(urls[1]).toBeNull();
+    });
+
+    it("should memoize results for later ticks", async () => {
+        filesRepository.findByEntitiesAndField.mockResolvedValue([makeAvatar("user-1")]);
+
+        await sut.load("user-1");
+        await sut.load("user-1");
+
+        expect(filesRepository.findByEntitiesAndField).toHaveBeenCalledTimes(1);
+    });
+
+    it("should reject the whole batch and retry it on the next load when the query fails", async () => {
+        filesRepository.findByEntitiesAndField
+            .mockRejectedValueOnce(new Error("Database unavailable"))
+            .mockResolvedValue([makeAvatar("user-1")]);
+
+        await expect(sut.loadMany(["user-1", "user-2"])).rejects.toThrow("Database unavailable");
+
+        await expect(sut.load("user-1")).resolves.toContain("/user/user-1/avatar.png");
+        expect(filesRepository.findByEntitiesAndField).toHaveBeenCalledTimes(2);
+    });
+});
@@ -0,0 +1,72 @@
+import { GetFileUrlUseCase } from "@/domain/storage/application/use-cases/get-file-url.use-case";
+
+interface FileUrlLoaderOptions {
+    entityType: string;
+    field: string;
+    signed?: boolean;
+    expiresInMinutes?: number;
+}
+
+/**
+ * DataLoader-style coalescer for entity file URLs.
+ *
+ * Every `load()` issued during the same tick is collected and resolved with a single
+ * `GetFileUrlUseCase.executeMany` call, so presenting a list of N entities costs one query
+ * instead of N. Create one loader per request; results are memoized for its lifetime.
+ */
+export class FileUrlLoader {
+    private cache = new Map<string, Promise<string | null>>();
+    private queue: { entityId: string; resolve: (url: string | null) => void; reject: (error: unknown) => void }[] = [];
+
+    constructor(
+        private getFileUrlUseCase: GetFileUrlUseCase,
+        private options: FileUrlLoaderOptions,
+    ) {}
+
+    load(entityId: string): Promise<string | null> {
+        const cached = this.cache.get(entityId);
+
+        if (cached) {
+            return cached;
+        }
+
+        const promise = new Promise<string | null>((resolve, reject) => {
+            this.queue.push({ entityId, resolve, reject });
+
+            if (this.queue.length === 1) {
+                process.nextTick(() => this.dispatch());
+            }
+        });
+
+        this.cache.set(entityId, promise);
+
+        return promise;
+    }
+
+    loadMany(entityIds: string[]): Promise<(string | null)[]> {
+        return Promise.all(entityIds.map((entityId) => this.load(entityId)));
+    }
+
+    private async dispatch() {
+        const batch = this.queue;
+        this.queue = [];
+
+        try {
+            const result = await this.getFileUrlUseCase.executeMany({
+                ...this.options,
+                entityIds: batch.map((item) => item.entityId),
+            });
+
+            const files = result.value.files;
+
+            for (const item of batch) {
+                item.resolve(files.get(item.entityId)?.url ?? null);
+            }
+        } catch (error) {
+            for (const item of batch) {
+                this.cache.delete(item.entityId);
+                item.reject(error);
+            }
+        }
+    }
+}
@@ -0,0 +1,81 @@
+import { Inject, Module, OnModuleDestroy } from "@nestjs/common";
+import { ConfigService } from "@nestjs/config";
+import { PrismaModule } from "./prisma.module";
+import { PrismaService } from "@/infra/database/prisma/prisma.service";
+
+// Domain Events
+import { DomainEvents } from "@/domain/@shared/events/domain-events";
+import { InProcessEventBus } from "@/domain/@shared/events/in-process-event-bus";
+import { InMemoryEventHandlerMetrics } from "@/domain/@shared/events/event-handler-metrics";
+import { ITransactionProvider } from "@/domain/@shared/providers/transaction.provider";
+
+// Outbox
+import { PrismaOutboxEventBus } from "@/infra/events/outbox/prisma-outbox.event-bus";
+import { OutboxPollingWorker } from "@/infra/events/outbox/outbox-polling.worker";
+import { inProcessEventNames, outboxEventSerializers } from "@/infra/events/outbox/outbox-event.serializer";
+
+/**
+ * Configures the bus behind DomainEvents.
+ * "in-process" handles events in a bounded background queue once the publishing transaction commits;
+ * "outbox" records them in Postgres within the publishing transaction and delivers them from a polling worker.
+ */
+@Module({
+    imports: [PrismaModule],
+    providers: [
+        {
+            provide: "EventHandlerMetrics",
+            useFactory: () => {
+                const metrics = new InMemoryEventHandlerMetrics();
+                DomainEvents.useMetrics(metrics);
+                return metrics;
+            },
+        },
+        {
+            provide: "InProcessEventBus",
+            inject: [ConfigService, "TransactionProvider"],
+            useFactory: (configService: ConfigService, transactionProvider: ITransactionProvider) =>
+                new InProcessEventBus((event) => DomainEvents.handle(event), {
+                    concurrency: configService.get<number>("DOMAIN_EVENTS_CONCURRENCY"),
+                    maxQueueSize: configService.get<number>("DOMAIN_EVENTS_QUEUE_SIZE"),
+                    transactionProvider,
+                }),
+        },
+        {
+            provide: "EventBus",
+            inject: [ConfigService, PrismaService, "InProcessEventBus"],
+            useFactory: (configService: ConfigService, prisma: PrismaService, inProcessBus: InProcessEventBus) => {
+                const bus =
+                    configService.get<string>("DOMAIN_EVENTS_BUS") === "outbox"
+                        ? new PrismaOutboxEventBus(prisma, outboxEventSerializers, inProcessBus, inProcessEventNames)
+                        : inProcessBus;
+
+                DomainEvents.useBus(bus);
+                return bus;
+            },
+        },
+        {
+            provide: "OutboxPollingWorker",
+            inject: [ConfigService, PrismaService],
+            useFactory: (configService: ConfigService, prisma: PrismaService) => {
+                if (configService.get<string>("DOMAIN_EVENTS_BUS") !== "outbox") {
+                    return null;
+                }
+
+                return new OutboxPollingWorker(prisma, outboxEventSerializers, {
+                    pollIntervalMs: configService.get<number>("OUTBOX_POLL_INTERVAL_MS"),
+                    maxAttempts: configService.get<number>("OUTBOX_MAX_ATTEMPTS"),
+                    concurrency: configService.get<number>("DOMAIN_EVENTS_CONCURRENCY"),
+                });
+            },
+        },
+    ],
+    exports: ["EventBus", "EventHandlerMetrics"],
+})
+export class EventsModule implements OnModuleDestroy {
+    constructor(@Inject("InProcessEventBus") private inProcessBus: InProcessEventBus) {}
+
+    async onModuleDestroy() {
+        // Let queued handlers finish before the database connection goes away
+        await this.inProcessBus.drain();
+    }
+}
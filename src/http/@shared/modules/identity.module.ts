@@ -4,18 +4,38 @@ import { DeleteUserUseCase } from "@/domain/identity/application/use-cases/delet
 import { GetAllUsersUseCase } from "@/domain/identity/application/use-cases/get-all-users.use-case";
 import { GetUserByIdUseCase } from "@/domain/identity/application/use-cases/get-user-by-id.use-case";
 import { UpdateUserUseCase } from "@/domain/identity/application/use-cases/update-user.use-case";
+import { ITransactionProvider } from "@/domain/@shared/providers/transaction.provider";
 import { BcryptHashProvider } from "@/infra/cryptography/providers/bcrypt.provider";
+import { BcryptWorkerPool } from "@/infra/cryptography/workers/bcrypt-worker-pool";
 import { PrismaUsersRepository } from "@/infra/database/repositories/prisma/prisma-users.repository";
 import { Module } from "@nestjs/common";
+import { ConfigService } from "@nestjs/config";
+import { APP_FILTER } from "@nestjs/core";
+import { HashingUnavailableFilter } from "../filters/hashing-unavailable.filter";
 import { PrismaModule } from "./prisma.module";
 
 @Module({
     imports: [PrismaModule],
     providers: [
         // Providers
+        {
+            provide: "BcryptWorkerPool",
+            inject: [ConfigService],
+            useFactory: (configService: ConfigService) =>
+                new BcryptWorkerPool({
+                    size: configService.get<number>("PASSWORD_HASH_THREADS"),
+                    maxQueueSize: configService.get<number>("PASSWORD_HASH_QUEUE_SIZE"),
+                }),
+        },
         {
             provide: "BcryptHashProvider",
-            useClass: BcryptHashProvider,
+            inject: ["BcryptWorkerPool", ConfigService],
+            useFactory: (pool: BcryptWorkerPool, configService: ConfigService) =>
+                new BcryptHashProvider(pool, configService.get<number>("PASSWORD_HASH_ROUNDS")),
+        },
+        {
+            provide: APP_FILTER,
+            useClass: HashingUnavailableFilter,
         },
 
         // Repositories
@@ -39,8 +59,9 @@ import { PrismaModule } from "./prisma.module";
         },
         {
             provide: "DeleteUserUseCase",
-            inject: ["UsersRepository"],
-            useFactory: (usersRepository: UsersRepository) => new DeleteUserUseCase(usersRepository),
+            inject: ["UsersRepository", "TransactionProvider"],
+            useFactory: (usersRepository: UsersRepository, transactionProvider: ITransactionProvider) =>
+                new DeleteUserUseCase(usersRepository, transactionProvider),
         },
         {
             provide: "GetAllUsersUseCase",
@@ -54,6 +75,7 @@ import { PrismaModule } from "./prisma.module";
         },
     ],
     exports: [
+        "BcryptHashProvider",
         "UsersRepository",
         "CreateUserUseCase",
         "UpdateUserUseCase",
@@ -1,8 +1,15 @@
 import { PrismaService } from "@/infra/database/prisma/prisma.service";
+import { PrismaTransactionProvider } from "@/infra/database/providers/prisma-transaction.provider";
 import { Module } from "@nestjs/common";
 
 @Module({
-    providers: [PrismaService],
-    exports: [PrismaService],
+    providers: [
+        PrismaService,
+        {
+            provide: "TransactionProvider",
+            useClass: PrismaTransactionProvider,
+        },
+    ],
+    exports: [PrismaService, "TransactionProvider"],
 })
 export class PrismaModule {}
@@ -8,20 +8,26 @@ import { FilesRepository } from "@/domain/storage/application/repositories/files
 
 // Providers
 import { GcpStorageProvider } from "@/infra/storage/providers/gcp-storage.provider";
+import { LocalStorageProvider } from "@/infra/storage/providers/local-storage.provider";
+import { CachedStorageProvider } from "@/infra/storage/providers/cached-storage.provider";
 import { FileValidatorProvider } from "@/infra/storage/providers/file-validator.provider";
 import { SharpImageProcessorProvider } from "@/infra/storage/providers/sharp-image-processor.provider";
+import { InMemorySignedUrlCacheProvider } from "@/infra/storage/providers/in-memory-signed-url-cache.provider";
 import { IStorageProvider } from "@/domain/storage/application/providers/storage.provider";
 import { IFileValidatorProvider } from "@/domain/storage/application/providers/file-validator.provider";
 import { IImageProcessorProvider } from "@/domain/storage/application/providers/image-processor.provider";
+import { ISignedUrlCacheProvider } from "@/domain/storage/application/providers/signed-url-cache.provider";
 
 // Use Cases
 import { UploadFileUseCase } from "@/domain/storage/application/use-cases/upload-file.use-case";
 import { DeleteFileUseCase } from "@/domain/storage/application/use-cases/delete-file.use-case";
 import { DeleteFileByEntityUseCase } from "@/domain/storage/application/use-cases/delete-file-by-entity.use-case";
 import { GetFileUrlUseCase } from "@/domain/storage/application/use-cases/get-file-url.use-case";
+import { DownloadFileUseCase } from "@/domain/storage/application/use-cases/download-file.use-case";
 
 // Subscribers (Domain Events)
 import { OnUserDeletedSubscriber } from "@/domain/storage/application/subscribers/on-user-deleted.subscriber";
+import { OnFileChangedSubscriber } from "@/domain/storage/application/subscribers/on-file-changed.subscriber";
 
 @Module({
     imports: [PrismaModule],
@@ -37,6 +43,16 @@ import { OnUserDeletedSubscriber } from "@/domain/storage/application/subscriber
             provide: "StorageProvider",
             inject: [ConfigService],
             useFactory: (configService: ConfigService) => {
+                const bulkConcurrency = configService.get<number>("STORAGE_BULK_CONCURRENCY");
+
+                if (configService.get<string>("STORAGE_DRIVER") === "local") {
+                    return new LocalStorageProvider(
+                        configService.get<string>("LOCAL_STORAGE_PATH") as string,
+                        configService.get<string>("LOCAL_STORAGE_PUBLIC_URL") as string,
+                        { bulkConcurrency },
+                    );
+                }
+
                 const bucketName = configService.get<string>("GCP_BUCKET_NAME");
                 const keyFilePath = configService.get<string>("GCP_KEY_FILE_PATH");
 
@@ -44,7 +60,17 @@ import { OnUserDeletedSubscriber } from "@/domain/storage/application/subscriber
                     throw new Error("GCP_BUCKET_NAME environment variable is required");
                 }
 
-                return new GcpStorageProvider(bucketName, keyFilePath);
+                const gcpStorageProvider = new GcpStorageProvider(bucketName, keyFilePath, { bulkConcurrency });
+                const cachePath = configService.get<string>("STORAGE_CACHE_PATH");
+
+                if (!cachePath) {
+                    return gcpStorageProvider;
+                }
+
+                return new CachedStorageProvider(gcpStorageProvider, cachePath, {
+                    maxBytes: (configService.get<number>("STORAGE_CACHE_MAX_MB") as number) * 1024 * 1024,
+                    maxAgeMs: (configService.get<number>("STORAGE_CACHE_MAX_AGE_SECONDS") as number) * 1000,
+                });
             },
         },
         {
@@ -53,7 +79,21 @@ import { OnUserDeletedSubscriber } from "@/domain/storage/application/subscriber
         },
         {
             provide: "ImageProcessorProvider",
-            useClass: SharpImageProcessorProvider,
+            inject: [ConfigService],
+            useFactory: (configService: ConfigService) =>
+                new SharpImageProcessorProvider({
+                    threads: configService.get<number>("IMAGE_PROCESSING_THREADS"),
+                    maxConcurrentOperations: configService.get<number>("IMAGE_PROCESSING_CONCURRENCY"),
+                    cacheMemoryMb: configService.get<number>("IMAGE_PROCESSING_CACHE_MB"),
+                }),
+        },
+        {
+            provide: "SignedUrlCacheProvider",
+            inject: [ConfigService],
+            useFactory: (configService: ConfigService) =>
+                new InMemorySignedUrlCacheProvider({
+                    maxBytes: (configService.get<number>("SIGNED_URL_CACHE_MAX_MB") as number) * 1024 * 1024,
+                }),
         },
 
         // Use Cases
@@ -75,9 +115,18 @@ import { OnUserDeletedSubscriber } from "@/domain/storage/application/subscriber
         },
         {
             provide: "GetFileUrlUseCase",
+            inject: ["FilesRepository", "StorageProvider", "SignedUrlCacheProvider"],
+            useFactory: (
+                filesRepository: FilesRepository,
+                storageProvider: IStorageProvider,
+                signedUrlCache: ISignedUrlCacheProvider,
+            ) => new GetFileUrlUseCase(filesRepository, storageProvider, signedUrlCache),
+        },
+        {
+            provide: "DownloadFileUseCase",
             inject: ["FilesRepository", "StorageProvider"],
             useFactory: (filesRepository: FilesRepository, storageProvider: IStorageProvider) =>
-                new GetFileUrlUseCase(filesRepository, storageProvider),
+                new DownloadFileUseCase(filesRepository, storageProvider),
         },
         {
             provide: "DeleteFileByEntityUseCase",
@@ -93,6 +142,11 @@ import { OnUserDeletedSubscriber } from "@/domain/storage/application/subscriber
             useFactory: (filesRepository: FilesRepository, storageProvider: IStorageProvider) =>
                 new OnUserDeletedSubscriber(filesRepository, storageProvider),
         },
+        {
+            provide: "OnFileChangedSubscriber",
+            inject: ["SignedUrlCacheProvider"],
+            useFactory: (signedUrlCache: ISignedUrlCacheProvider) => new OnFileChangedSubscriber(signedUrlCache),
+        },
     ],
     exports: [
         // Note: FilesRepository is intentionally NOT exported to enforce bounded context separation
@@ -104,6 +158,7 @@ import { OnUserDeletedSubscriber } from "@/domain/storage/application/subscriber
         "DeleteFileUseCase",
         "DeleteFileByEntityUseCase",
         "GetFileUrlUseCase",
+        "DownloadFileUseCase",
     ],
 })
 export class StorageSharedModule {}
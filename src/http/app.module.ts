@@ -4,6 +4,7 @@ import { ConfigModule } from "@nestjs/config";
 import { AuthModule } from "./auth/auth.module";
 import { UsersModule } from "./users/users.module";
 import { StorageModule } from "./storage/storage.module";
+import { EventsModule } from "./@shared/modules/events.module";
 
 @Module({
     imports: [
@@ -11,6 +12,7 @@ import { StorageModule } from "./storage/storage.module";
             validate: (env) => validateEnv(),
             isGlobal: true,
         }),
+        EventsModule,
         AuthModule,
         UsersModule,
         StorageModule,
@@ -0,0 +1,157 @@
+import { Controller, ExecutionContext, Get, UnauthorizedException } from "@nestjs/common";
+import { DiscoveryService, MetadataScanner, Reflector } from "@nestjs/core";
+import { JwtService } from "@nestjs/jwt";
+import { DomainEvents } from "@/domain/@shared/events/domain-events";
+import { ROLES, User } from "@/domain/identity/enterprise/entities/user.entity";
+import { UserDeletedEvent } from "@/domain/identity/enterprise/events/user-deleted.event";
+import { Username } from "@/domain/identity/enterprise/value-objects/username.vo";
+import { revokeDeletedUsers, VerifiedTokenCache } from "../../cache/verified-token.cache";
+import { Admin } from "../../decorators/admin.decorator";
+import { Public } from "../../decorators/public.decorator";
+import { Roles } from "../../decorators/roles.decorator";
+import { Role } from "../../enums/role.enum";
+import { AuthGuard } from "../../guards/auth.guard";
+
+@Controller("test")
+class TestController {
+    @Public()
+    @Get("public")
+    open() {}
+
+    @Get("restricted")
+    restricted() {}
+
+    @Admin()
+    @Get("admin")
+    admin() {}
+
+    @Roles(Role.ADMIN)
+    @Get("roles")
+    roles() {}
+}
+
+const makeContext = (handler: keyof TestController, authorization?: string) => {
+    const request: Record<string, unknown> = { headers: { authorization } };
+
+    const context = {
+        getClass: () => TestController,
+        getHandler: () => TestController.prototype[handler],
+        switchToHttp: () => ({ getRequest: () => request }),
+    } as unknown as ExecutionContext;
+
+    return { context, request };
+};
+
+describe("AuthGuard", () => {
+    let jwtService: jest.Mocked<Pick<JwtService, "verifyAsync">>;
+    let reflector: Reflector;
+    let tokenCache: VerifiedTokenCache;
+    let sut: AuthGuard;
+
+    const userPayload = { id: "user-1", roles: [Role.USER] };
+    const adminPayload = { id: "admin-1", roles: [Role.ADMIN] };
+
+    beforeEach(() => {
+        jwtService = {
+            verifyAsync: jest.fn().mockImplementation(async (token: string) => {
+                if (token === "user-token") return userPayload;
+                if (token === "admin-token") return adminPayload;
+                throw new Error("invalid signature");
+            }),
+        };
+        reflector = new Reflector();
+        tokenCache = new VerifiedTokenCache();
+
+        const discoveryService = {
+            getControllers: () => [{ instance: new TestController(), metatype: TestController }],
+        } as unknown as DiscoveryService;
+
+        sut = new AuthGuard(
+            jwtService as unknown as JwtService,
+            reflector,
+            discoveryService,
+            new MetadataScanner(),
+            tokenCache,
+        );
+        sut.onApplicationBootstrap();
+    });
+
+    afterEach(() => {
+        DomainEvents.clearHandlers();
+    });
+
+    describe("route policies", () => {
+        it("should resolve every route's metadata at bootstrap instead of per request", async () => {
+            const getAllAndOverride = jest.spyOn(reflector, "getAllAndOverride");
+
+            await sut.canActivate(makeContext("open").context);
+            await sut.canActivate(makeContext("restricted", "Bearer user-token").context);
+
+            expect(getAllAndOverride).not.toHaveBeenCalled();
+        });
+
+        it("should let public routes through without a token", async () => {
+            await expect(sut.canActivate(makeContext("open").context)).resolves.toBe(true);
+            expect(jwtService.verifyAsync).not.toHaveBeenCalled();
+        });
+
+        it("should require a token on other routes", async () => {
+            await expect(sut.canActivate(makeContext("restricted").context)).rejects.toThrow("Missing JWT Token");
+        });
+
+        it("should allow admins on admin routes and deny other users", async () => {
+            await expect(sut.canActivate(makeContext("admin", "Bearer admin-token").context)).resolves.toBe(true);
+            await expect(sut.canActivate(makeContext("admin", "Bearer user-token").context)).rejects.toThrow(
+                "You must be Admin",
+            );
+        });
+
+        it("should allow users with one of the required roles and deny the others", async () => {
+            await expect(sut.canActivate(makeContext("roles", "Bearer admin-token").context)).resolves.toBe(true);
+            await expect(sut.canActivate(makeContext("roles", "Bearer user-token").context)).rejects.toThrow(
+                "You do not have the proper role",
+            );
+        });
+    });
+
+    describe("token verification", () => {
+        it("should attach the payload to the request", async () => {
+            const { context, request } = makeContext("restricted", "Bearer user-token");
+
+            await sut.canActivate(context);
+
+            expect(request.user).toEqual(userPayload);
+        });
+
+        it("should verify each token once and serve it from the cache afterwards", async () => {
+            await sut.canActivate(makeContext("restricted", "Bearer user-token").context);
+            await sut.canActivate(makeContext("restricted", "Bearer user-token").context);
+
+            expect(jwtService.verifyAsync).toHaveBeenCalledTimes(1);
+        });
+
+        it("should reject invalid tokens", async () => {
+            await expect(sut.canActivate(makeContext("restricted", "Bearer forged").context)).rejects.toThrow(
+                UnauthorizedException,
+            );
+            expect(tokenCache.size).toBe(0);
+        });
+
+        it("should reject a cached token once its user has been deleted", async () => {
+            revokeDeletedUsers(tokenCache);
+            const user = User.create(
+                { username: Username.create("testuser"), email: "test@example.com", roles: [ROLES.USER] },
+                userPayload.id,
+            );
+
+            await sut.canActivate(makeContext("restricted", "Bearer user-token").context);
+
+            await DomainEvents.handle(new UserDeletedEvent(user));
+
+            await expect(sut.canActivate(makeContext("restricted", "Bearer user-token").context)).rejects.toThrow(
+                "Invalid JWT Token",
+            );
+            expect(tokenCache.size).toBe(0);
+        });
+    });
+});
@@ -0,0 +1,111 @@
+import { VerifiedTokenCache } from "../../cache/verified-token.cache";
+
+const NOW = new Date("2026-01-01T00:00:00Z").getTime();
+
+/** `exp` claim (seconds) `ms` milliseconds from now */
+const expIn = (ms: number) => Math.floor((NOW + ms) / 1000);
+
+describe("VerifiedTokenCache", () => {
+    beforeEach(() => {
+        jest.useFakeTimers({ now: NOW });
+    });
+
+    afterEach(() => {
+        jest.useRealTimers();
+    });
+
+    describe("expiry", () => {
+        it("should serve a payload until the token expires", () => {
+            const cache = new VerifiedTokenCache();
+            const payload = { id: "user-1", exp: expIn(60_000) };
+
+            cache.set("token", payload);
+
+            expect(cache.get("token")).toBe(payload);
+
+            jest.setSystemTime(NOW + 59_000);
+            expect(cache.get("token")).toBe(payload);
+
+            jest.setSystemTime(NOW + 60_000);
+            expect(cache.get("token")).toBeNull();
+            expect(cache.size).toBe(0);
+        });
+
+        it("should not cache a token that is already expired", () => {
+            const cache = new VerifiedTokenCache();
+
+            cache.set("expired", { id: "user-1", exp: expIn(-1_000) });
+            cache.set("expiring-now", { id: "user-1", exp: expIn(0) });
+
+            expect(cache.get("expired")).toBeNull();
+            expect(cache.get("expiring-now")).toBeNull();
+            expect(cache.size).toBe(0);
+        });
+
+        it("should keep tokens without exp", () => {
+            const cache = new VerifiedTokenCache();
+
+            cache.set("token", { id: "user-1" });
+            jest.setSystemTime(NOW + 365 * 24 * 60 * 60 * 1000);
+
+            expect(cache.get("token")).toEqual({ id: "user-1" });
+        });
+    });
+
+    describe("LRU eviction", () => {
+        it("should evict the least recently used token beyond maxEntries", () => {
+            const cache = new VerifiedTokenCache({ maxEntries: 2 });
+
+            cache.set("a", { id: "user-a" });
+            cache.set("b", { id: "user-b" });
+            cache.get("a");
+            cache.set("c", { id: "user-c" });
+
+            expect(cache.size).toBe(2);
+            expect(cache.get("a")).not.toBeNull();
+            expect(cache.get("b")).toBeNull();
+            expect(cache.get("c")).not.toBeNull();
+        });
+
+        it("should not grow when the same token is set again", () => {
+            const cache = new VerifiedTokenCache({ maxEntries: 2 });
+
+            cache.set("a", { id: "user-a" });
+            cache.set("a", { id: "user-a" });
+            cache.set("b", { id: "user-b" });
+
+            expect(cache.size).toBe(2);
+            expect(cache.get("a")).not.toBeNull();
+        });
+    });
+
+    describe("revocation", () => {
+        it("should evict every cached token of a revoked user", () => {
+            const cache = new VerifiedTokenCache();
+
+            cache.set("first", { id: "user-1" });
+            cache.set("second", { id: "user-1" });
+            cache.set("other", { id: "user-2" });
+
+            cache.revokeUser("user-1");
+
+            expect(cache.get("first")).toBeNull();
+            expect(cache.get("second")).toBeNull();
+            expect(cache.get("other")).not.toBeNull();
+            expect(cache.isRevoked("user-1")).toBe(true);
+            expect(cache.isRevoked("user-2")).toBe(false);
+        });
+
+        it("should stop rejecting a revoked user once its tokens have all expired", () => {
+            const cache = new VerifiedTokenCache({ revocationTtlMs: 60_000 });
+
+            cache.revokeUser("user-1");
+
+            jest.setSystemTime(NOW + 59_000);
+            expect(cache.isRevoked("user-1")).toBe(true);
+
+            jest.setSystemTime(NOW + 60_000);
+            expect(cache.isRevoked("user-1")).toBe(false);
+        });
+    });
+});
@@ -3,16 +3,29 @@ import { AuthController } from "@/http/auth/controllers/auth.controller";
 import { AuthService } from "@/http/auth/services/auth.service";
 import { GoogleAuthProvider } from "@/infra/auth/providers/google-auth.provider";
 import { PasswordAuthProvider } from "@/infra/auth/providers/password-auth.provider";
+import { BcryptHashProvider } from "@/infra/cryptography/providers/bcrypt.provider";
 import { Module } from "@nestjs/common";
 import { ConfigService } from "@nestjs/config";
-import { APP_GUARD } from "@nestjs/core";
+import { APP_GUARD, DiscoveryModule } from "@nestjs/core";
 import { JwtModule } from "@nestjs/jwt";
 import { IdentityModule } from "../@shared/modules/identity.module";
+import { revokeDeletedUsers, VerifiedTokenCache } from "./cache/verified-token.cache";
 import { AuthGuard } from "./guards/auth.guard";
 
+/**
+ * Authentication: JWT issuing and the global AuthGuard.
+ *
+ * The guard keeps verified tokens in a per-process cache (VerifiedTokenCache). Deleting a user revokes
+ * its tokens in the process that deleted it, including under the outbox bus (UserDeletedEvent is also
+ * delivered in-process there). Other replicas don't see that revocation: they keep accepting the user's
+ * cached tokens until the tokens expire (JWT lifetime, 1 day), exactly as they would accept a token
+ * they verify for the first time. Deployments running several replicas that need immediate revocation
+ * must shorten the token lifetime or check users against the database.
+ */
 @Module({
     imports: [
         IdentityModule,
+        DiscoveryModule,
         JwtModule.registerAsync({
             global: true,
             inject: [ConfigService],
@@ -35,6 +48,19 @@ import { AuthGuard } from "./guards/auth.guard";
             provide: APP_GUARD,
             useClass: AuthGuard,
         },
+        {
+            provide: "VerifiedTokenCache",
+            inject: [ConfigService],
+            useFactory: (configService: ConfigService<Env, true>) => {
+                const cache = new VerifiedTokenCache({
+                    maxEntries: configService.get("AUTH_TOKEN_CACHE_SIZE", { infer: true }),
+                });
+
+                revokeDeletedUsers(cache);
+
+                return cache;
+            },
+        },
 
         // Providers
         {
@@ -43,7 +69,8 @@ import { AuthGuard } from "./guards/auth.guard";
         },
         {
             provide: "PasswordAuthProvider",
-            useClass: PasswordAuthProvider,
+            inject: ["BcryptHashProvider"],
+            useFactory: (bcryptHashProvider: BcryptHashProvider) => new PasswordAuthProvider(bcryptHashProvider),
         },
     ],
 })
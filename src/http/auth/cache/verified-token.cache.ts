@@ -0,0 +1,156 @@
+import { createHash } from "crypto";
+import { DomainEvents } from "@/domain/@shared/events/domain-events";
+import { UserDeletedEvent } from "@/domain/identity/enterprise/events/user-deleted.event";
+
+export interface VerifiedTokenCacheOptions {
+    /** Verified tokens kept before the least recently used are evicted (default: 10000) */
+    maxEntries?: number;
+    /** How long a revoked user's tokens keep being rejected, at least the access token lifetime (default: 1 day) */
+    revocationTtlMs?: number;
+}
+
+/**
+ * Claims the guard relies on (see UserPresenter, which the tokens are signed from)
+ */
+export interface TokenPayload {
+    id: string;
+    roles?: string[];
+    exp?: number;
+    [claim: string]: unknown;
+}
+
+interface Entry {
+    payload: TokenPayload;
+    /** Epoch ms, Infinity for tokens without `exp` */
+    expiresAt: number;
+}
+
+/**
+ * Per-process LRU of verified JWT payloads, keyed by the SHA-256 of the token so raw tokens
+ * aren't kept in memory. An entry is served until the token's `exp`, so a cache hit never
+ * accepts a token verification would reject.
+ */
+export class VerifiedTokenCache {
+    private readonly maxEntries: number;
+    private readonly revocationTtlMs: number;
+
+    /** Map iteration order is the LRU order: oldest first */
+    private entries = new Map<string, Entry>();
+    private keysByUser = new Map<string, Set<string>>();
+    /** User id -> epoch ms until which its tokens are rejected */
+    private revokedUsers = new Map<string, number>();
+
+    constructor(options: VerifiedTokenCacheOptions = {}) {
+        this.maxEntries = options.maxEntries ?? 10_000;
+        this.revocationTtlMs = options.revocationTtlMs ?? 24 * 60 * 60 * 1000;
+    }
+
+    get size() {
+        return this.entries.size;
+    }
+
+    get(token: string): TokenPayload | null {
+        const key = this.keyOf(token);
+        const entry = this.entries.get(key);
+
+        if (!entry) return null;
+
+        if (entry.expiresAt <= Date.now()) {
+            this.remove(key);
+            return null;
+        }
+
+        this.entries.delete(key);
+        this.entries.set(key, entry);
+
+        return entry.payload;
+    }
+
+    set(token: string, payload: TokenPayload): void {
+        const key = this.keyOf(token);
+        const expiresAt = typeof payload.exp === "number" ? payload.exp * 1000 : Infinity;
+
+        if (expiresAt <= Date.now()) return;
+
+        this.remove(key);
+        this.entries.set(key, { payload, expiresAt });
+
+        let keys = this.keysByUser.get(payload.id);
+
+        if (!keys) {
+            keys = new Set();
+            this.keysByUser.set(payload.id, keys);
+        }
+
+        keys.add(key);
+
+        for (const oldest of this.entries.keys()) {
+            if (this.entries.size <= this.maxEntries) break;
+
+            this.remove(oldest);
+        }
+    }
+
+    isRevoked(userId: string): boolean {
+        if (this.revokedUsers.size === 0) return false;
+
+        const until = this.revokedUsers.get(userId);
+
+        if (until === undefined) return false;
+
+        if (until <= Date.now()) {
+            this.revokedUsers.delete(userId);
+            return false;
+        }
+
+        return true;
+    }
+
+    /**
+     * Evict the user's cached tokens and reject its tokens until they have all expired
+     */
+    revokeUser(userId: string): void {
+        for (const key of [...(this.keysByUser.get(userId) ?? [])]) {
+            this.remove(key);
+        }
+
+        const now = Date.now();
+
+        // Drop revocations that no longer matter, so the map stays bounded by recent deletions
+        for (const [revokedUserId, until] of this.revokedUsers) {
+            if (until <= now) this.revokedUsers.delete(revokedUserId);
+        }
+
+        this.revokedUsers.set(userId, now + this.revocationTtlMs);
+    }
+
+    private keyOf(token: string) {
+        return createHash("sha256").update(token).digest("base64");
+    }
+
+    private remove(key: string) {
+        const entry = this.entries.get(key);
+
+        if (!entry) return;
+
+        this.entries.delete(key);
+
+        const keys = this.keysByUser.get(entry.payload.id);
+        keys?.delete(key);
+
+        if (keys?.size === 0) {
+            this.keysByUser.delete(entry.payload.id);
+        }
+    }
+}
+
+/**
+ * Revocation hook: a deleted user's tokens stop being accepted by this process as soon as it handles
+ * the UserDeletedEvent
+ */
+export function revokeDeletedUsers(cache: VerifiedTokenCache): void {
+    DomainEvents.register(
+        (event: UserDeletedEvent) => cache.revokeUser(event.user.id.toString()),
+        UserDeletedEvent.name,
+    );
+}
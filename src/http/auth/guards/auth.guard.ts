@@ -1,40 +1,64 @@
-import type { Env } from "@/env/env";
-import { CanActivate, ExecutionContext, Injectable, UnauthorizedException } from "@nestjs/common";
-import { ConfigService } from "@nestjs/config";
-import { Reflector } from "@nestjs/core";
+import {
+    CanActivate,
+    ExecutionContext,
+    Inject,
+    Injectable,
+    OnApplicationBootstrap,
+    UnauthorizedException,
+} from "@nestjs/common";
+import { DiscoveryService, MetadataScanner, Reflector } from "@nestjs/core";
 import { JwtService } from "@nestjs/jwt";
-import type { User } from "@prisma/client";
 import type { Request } from "express";
+import { TokenPayload, VerifiedTokenCache } from "../cache/verified-token.cache";
 import { ADMIN_KEY } from "../decorators/admin.decorator";
 import { IS_PUBLIC_KEY } from "../decorators/public.decorator";
 import { ROLES_KEY } from "../decorators/roles.decorator";
 import { Role, type Roles } from "../enums/role.enum";
 
+/**
+ * Route metadata (@Public, @Admin, @Roles) resolved once per handler
+ */
+interface RoutePolicy {
+    isPublic: boolean;
+    adminOnly: boolean;
+    requiredRoles: Set<string> | null;
+}
+
+type Handler = (...args: unknown[]) => unknown;
+
 @Injectable()
-export class AuthGuard implements CanActivate {
+export class AuthGuard implements CanActivate, OnApplicationBootstrap {
+    /** Policies by controller class, then handler */
+    private policies = new Map<Function, Map<Handler, RoutePolicy>>();
+
     constructor(
         private jwtService: JwtService,
         private reflector: Reflector,
-        private configService: ConfigService<Env, true>,
+        private discoveryService: DiscoveryService,
+        private metadataScanner: MetadataScanner,
+        @Inject("VerifiedTokenCache")
+        private tokenCache: VerifiedTokenCache,
     ) {}
 
+    /**
+     * Compile the policy of every route up front, so requests only do a map lookup
+     */
+    onApplicationBootstrap() {
+        for (const { instance, metatype } of this.discoveryService.getControllers()) {
+            if (!instance || !metatype) continue;
+
+            const prototype = Object.getPrototypeOf(instance);
+
+            for (const name of this.metadataScanner.getAllMethodNames(prototype)) {
+                this.getPolicy(metatype, prototype[name]);
+            }
+        }
+    }
+
     async canActivate(context: ExecutionContext): Promise<boolean> {
-        const isPublic = this.reflector.getAllAndOverride<boolean>(IS_PUBLIC_KEY, [
-            context.getHandler(),
-            context.getClass(),
-        ]);
-
-        const adminOnly = this.reflector.getAllAndOverride<boolean>(ADMIN_KEY, [
-            context.getHandler(),
-            context.getClass(),
-        ]);
-
-        const requiredRoles = this.reflector.getAllAndOverride<Roles[]>(ROLES_KEY, [
-            context.getHandler(),
-            context.getClass(),
-        ]);
-
-        if (isPublic) {
+        const policy = this.getPolicy(context.getClass(), context.getHandler() as Handler);
+
+        if (policy.isPublic) {
             return true;
         }
 
@@ -46,30 +70,85 @@ export class AuthGuard implements CanActivate {
             throw new UnauthorizedException("Missing JWT Token");
         }
 
-        let user: User;
+        const user = await this.verify(token);
 
-        try {
-            const payload = await this.jwtService.verifyAsync(token);
+        request["user"] = user;
 
-            request["user"] = payload;
-            user = payload;
-        } catch {
-            throw new UnauthorizedException("Invalid JWT Token");
-        }
-
-        if (adminOnly && !user.roles?.includes(Role.ADMIN)) {
+        if (policy.adminOnly && !user.roles?.includes(Role.ADMIN)) {
             throw new UnauthorizedException("You must be Admin");
         }
 
-        if (requiredRoles && !requiredRoles.some((role) => user.roles?.includes(role))) {
+        const requiredRoles = policy.requiredRoles;
+
+        if (requiredRoles && !user.roles?.some((role) => requiredRoles.has(role))) {
             throw new UnauthorizedException("You do not have the proper role");
         }
 
         return true;
     }
 
+    /**
+     * Verify the token, reusing the payload of a token already verified and not yet expired
+     */
+    private async verify(token: string): Promise<TokenPayload> {
+        const cached = this.tokenCache.get(token);
+        let payload: TokenPayload;
+
+        if (cached) {
+            payload = cached;
+        } else {
+            try {
+                payload = await this.jwtService.verifyAsync<TokenPayload>(token);
+            } catch {
+                throw new UnauthorizedException("Invalid JWT Token");
+            }
+        }
+
+        // Deleted users' tokens stay cryptographically valid until they expire
+        if (this.tokenCache.isRevoked(payload.id)) {
+            throw new UnauthorizedException("Invalid JWT Token");
+        }
+
+        if (!cached) {
+            this.tokenCache.set(token, payload);
+        }
+
+        return payload;
+    }
+
+    private getPolicy(controller: Function, handler: Handler): RoutePolicy {
+        let handlers = this.policies.get(controller);
+
+        if (!handlers) {
+            handlers = new Map();
+            this.policies.set(controller, handlers);
+        }
+
+        let policy = handlers.get(handler);
+
+        if (!policy) {
+            const targets = [handler, controller];
+            const requiredRoles = this.reflector.getAllAndOverride<Roles[] | undefined>(ROLES_KEY, targets);
+
+            policy = {
+                isPublic: this.reflector.getAllAndOverride<boolean>(IS_PUBLIC_KEY, targets) ?? false,
+                adminOnly: this.reflector.getAllAndOverride<boolean>(ADMIN_KEY, targets) ?? false,
+                requiredRoles: requiredRoles ? new Set(requiredRoles) : null,
+            };
+
+            handlers.set(handler, policy);
+        }
+
+        return policy;
+    }
+
     private extractTokenFromHeader(request: Request): string | undefined {
-        const [type, token] = request.headers.authorization?.split(" ") ?? [];
-        return type === "Bearer" ? token : undefined;
+        const authorization = request.headers.authorization;
+
+        if (!authorization?.startsWith("Bearer ")) {
+            return undefined;
+        }
+
+        return authorization.slice("Bearer ".length).trim() || undefined;
     }
 }
@@ -239,4 +239,22 @@ describe("StorageController (e2e)", () => {
             expect(response.status).toBe(404);
         });
     });
+
+    describe("GET /storage/files/*path", () => {
+        it("should not require authentication", async () => {
+            const response = await request(app.getHttpServer()).get(
+                "/storage/files/test/2024/01/user/non-existent/avatar.png",
+            );
+
+            expect(response.status).not.toBe(401);
+        });
+
+        it("should return 404 when the path has no file", async () => {
+            const response = await request(app.getHttpServer()).get(
+                "/storage/files/test/2024/01/user/non-existent/avatar.png",
+            );
+
+            expect(response.status).toBe(404);
+        });
+    });
 });
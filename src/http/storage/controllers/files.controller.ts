@@ -0,0 +1,114 @@
+import { Public } from "@/http/auth/decorators/public.decorator";
+import { Controller, Get, Param, Headers, Res, Injectable } from "@nestjs/common";
+import type { Response } from "express";
+import { pipeline } from "stream/promises";
+import { ApiBearerAuth, ApiOperation, ApiParam, ApiResponse, ApiTags } from "@nestjs/swagger";
+import { StorageService } from "../services/storage.service";
+
+@Injectable()
+abstract class FileDownloadController {
+    protected abstract readonly cacheControl: string;
+
+    constructor(private storageService: StorageService) {}
+
+    protected async send(
+        path: string | string[],
+        range: string | undefined,
+        ifNoneMatch: string | undefined,
+        res: Response,
+    ) {
+        const result = await this.storageService.download(
+            Array.isArray(path) ? path.join("/") : path,
+            range,
+            ifNoneMatch,
+        );
+
+        res.setHeader("ETag", `"${result.info.etag}"`);
+        res.setHeader("Accept-Ranges", "bytes");
+        res.setHeader("Cache-Control", this.cacheControl);
+
+        if (result.notModified || !result.stream) {
+            res.status(304).end();
+            return;
+        }
+
+        res.setHeader("Content-Type", result.file.mimeType);
+
+        if (result.range) {
+            const { start, end } = result.range;
+
+            res.status(206);
+            res.setHeader("Content-Range", `bytes ${start}-${end}/${result.info.size}`);
+            res.setHeader("Content-Length", end - start + 1);
+        } else {
+            res.status(200);
+            res.setHeader("Content-Length", result.info.size);
+        }
+
+        // Headers are already sent: a failure midway can only abort the response
+        await pipeline(result.stream, res).catch(() => res.destroy());
+    }
+}
+
+/**
+ * Files of the local storage driver: the URLs it hands out point here, so they are served without
+ * authentication, like a public bucket
+ */
+@ApiTags("Storage")
+@Controller("storage")
+export class PublicFilesController extends FileDownloadController {
+    protected readonly cacheControl = "public, no-cache";
+
+    @Public()
+    @Get("files/*path")
+    @ApiOperation({
+        summary: "Download file",
+        description: "Stream a stored file by its path. Supports single byte ranges and ETag revalidation.",
+    })
+    @ApiParam({ name: "path", type: String, description: "Storage path of the file" })
+    @ApiResponse({ status: 200, description: "File content" })
+    @ApiResponse({ status: 206, description: "Partial file content (Range request)" })
+    @ApiResponse({ status: 304, description: "Not modified (If-None-Match)" })
+    @ApiResponse({ status: 404, description: "File not found" })
+    @ApiResponse({ status: 416, description: "Range not satisfiable" })
+    download(
+        @Param("path") path: string | string[],
+        @Headers("range") range: string | undefined,
+        @Headers("if-none-match") ifNoneMatch: string | undefined,
+        @Res() res: Response,
+    ) {
+        return this.send(path, range, ifNoneMatch, res);
+    }
+}
+
+/**
+ * Files of remote drivers, streamed through the API (and its disk cache). Anonymous access goes
+ * through signed URLs, so serving them here requires authentication.
+ */
+@ApiTags("Storage")
+@ApiBearerAuth("JWT-auth")
+@Controller("storage")
+export class FilesController extends FileDownloadController {
+    protected readonly cacheControl = "private, no-cache";
+
+    @Get("files/*path")
+    @ApiOperation({
+        summary: "Download file",
+        description: "Stream a stored file by its path. Supports single byte ranges and ETag revalidation.",
+    })
+    @ApiParam({ name: "path", type: String, description: "Storage path of the file" })
+    @ApiResponse({ status: 200, description: "File content" })
+    @ApiResponse({ status: 206, description: "Partial file content (Range request)" })
+    @ApiResponse({ status: 304, description: "Not modified (If-None-Match)" })
+    @ApiResponse({ status: 401, description: "Unauthorized" })
+    @ApiResponse({ status: 404, description: "File not found" })
+    @ApiResponse({ status: 416, description: "Range not satisfiable" })
+    download(
+        @Param("path") path: string | string[],
+        @Headers("range") range: string | undefined,
+        @Headers("if-none-match") ifNoneMatch: string | undefined,
+        @Res() res: Response,
+    ) {
+        return this.send(path, range, ifNoneMatch, res);
+    }
+}
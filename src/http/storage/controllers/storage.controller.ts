@@ -1,4 +1,5 @@
 import { Validator } from "@/http/@shared/decorators/validator.decorator";
+import { SpooledFileInterceptor } from "@/http/@shared/interceptors/spooled-file.interceptor";
 import {
     Controller,
     Post,
@@ -13,7 +14,6 @@ import {
     MaxFileSizeValidator,
 } from "@nestjs/common";
 import { ConfigService } from "@nestjs/config";
-import { FileInterceptor } from "@nestjs/platform-express";
 import {
     ApiBearerAuth,
     ApiBody,
@@ -48,7 +48,7 @@ export class StorageController {
     ) {}
 
     @Post("upload")
-    @UseInterceptors(FileInterceptor("file"))
+    @UseInterceptors(SpooledFileInterceptor("file", MAX_FILE_SIZE))
     @Validator(uploadFileBodySchema)
     @ApiOperation({ summary: "Upload file", description: "Upload a file and associate it with an entity" })
     @ApiConsumes("multipart/form-data")
@@ -128,7 +128,12 @@ export class StorageController {
     @ApiOperation({ summary: "Get file URL", description: "Get the URL for a specific file by its ID" })
     @ApiParam({ name: "fileId", type: String, description: "File UUID" })
     @ApiQuery({ name: "signed", required: false, type: Boolean, description: "Return signed URL (default: false)" })
-    @ApiQuery({ name: "expiresInMinutes", required: false, type: Number, description: "Signed URL expiration (default: 60)" })
+    @ApiQuery({
+        name: "expiresInMinutes",
+        required: false,
+        type: Number,
+        description: "Minimum signed URL lifetime; the URL may stay valid up to twice as long (default: 60)",
+    })
     @ApiResponse({ status: 200, description: "File URL retrieved", type: FileUrlResponseDTO })
     @ApiResponse({ status: 401, description: "Unauthorized" })
     @ApiResponse({ status: 404, description: "File not found" })
@@ -146,7 +151,12 @@ export class StorageController {
     @ApiParam({ name: "entityId", type: String, description: "Entity UUID" })
     @ApiParam({ name: "field", type: String, description: "Field name (e.g., 'avatar')" })
     @ApiQuery({ name: "signed", required: false, type: Boolean, description: "Return signed URL (default: false)" })
-    @ApiQuery({ name: "expiresInMinutes", required: false, type: Number, description: "Signed URL expiration (default: 60)" })
+    @ApiQuery({
+        name: "expiresInMinutes",
+        required: false,
+        type: Number,
+        description: "Minimum signed URL lifetime; the URL may stay valid up to twice as long (default: 60)",
+    })
     @ApiResponse({ status: 200, description: "File URL retrieved", type: FileUrlResponseDTO })
     @ApiResponse({ status: 401, description: "Unauthorized" })
     @ApiResponse({ status: 404, description: "File not found" })
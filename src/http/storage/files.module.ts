@@ -0,0 +1,24 @@
+import { Module } from "@nestjs/common";
+import { StorageSharedModule } from "../@shared/modules/storage.module";
+import { FilesController, PublicFilesController } from "./controllers/files.controller";
+import { StorageService } from "./services/storage.service";
+
+/**
+ * GET /storage/files/*path for STORAGE_DRIVER="local", whose URLs point there
+ */
+@Module({
+    imports: [StorageSharedModule],
+    controllers: [PublicFilesController],
+    providers: [StorageService],
+})
+export class PublicFilesModule {}
+
+/**
+ * GET /storage/files/*path for remote drivers, behind authentication
+ */
+@Module({
+    imports: [StorageSharedModule],
+    controllers: [FilesController],
+    providers: [StorageService],
+})
+export class FilesModule {}
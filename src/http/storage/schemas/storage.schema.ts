@@ -29,7 +29,12 @@ export class EntityFileParamDTO extends createZodDto(entityFileParamSchema) {}
 // Query params for file URL
 export const fileUrlQuerySchema = z.object({
     signed: z.coerce.boolean().default(false).describe("Return signed URL with expiration"),
-    expiresInMinutes: z.coerce.number().min(1).max(1440).default(60).describe("Signed URL expiration time in minutes"),
+    expiresInMinutes: z.coerce
+        .number()
+        .min(1)
+        .max(1440)
+        .default(60)
+        .describe("Minimum signed URL lifetime in minutes (it may stay valid up to twice as long)"),
 });
 
 export class FileUrlQueryDTO extends createZodDto(fileUrlQuerySchema) {}
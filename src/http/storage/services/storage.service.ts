@@ -1,7 +1,17 @@
-import { Inject, Injectable, BadRequestException, NotFoundException } from "@nestjs/common";
+import {
+    Inject,
+    Injectable,
+    BadRequestException,
+    NotFoundException,
+    HttpException,
+    HttpStatus,
+} from "@nestjs/common";
+import { createReadStream } from "fs";
 import { UploadFileUseCase } from "@/domain/storage/application/use-cases/upload-file.use-case";
 import { DeleteFileUseCase } from "@/domain/storage/application/use-cases/delete-file.use-case";
 import { GetFileUrlUseCase } from "@/domain/storage/application/use-cases/get-file-url.use-case";
+import { DownloadFileUseCase, RequestedRange } from "@/domain/storage/application/use-cases/download-file.use-case";
+import { RangeNotSatisfiableError } from "@/domain/storage/errors/range-not-satisfiable.error";
 import { ResizeOptions } from "@/domain/storage/application/providers/image-processor.provider";
 import { ValidationOptions } from "@/domain/storage/application/providers/file-validator.provider";
 
@@ -24,15 +34,18 @@ export class StorageService {
         private deleteFileUseCase: DeleteFileUseCase,
         @Inject("GetFileUrlUseCase")
         private getFileUrlUseCase: GetFileUrlUseCase,
+        @Inject("DownloadFileUseCase")
+        private downloadFileUseCase: DownloadFileUseCase,
     ) {}
 
     async upload(params: UploadParams) {
+        // SpooledFileInterceptor removes the temporary file once the response is sent
         const result = await this.uploadFileUseCase.execute({
             entityType: params.entityType,
             entityId: params.entityId,
             field: params.field,
             filename: params.file.originalname,
-            buffer: params.file.buffer,
+            stream: createReadStream(params.file.path),
             environment: params.environment,
             validationOptions: params.validationOptions,
             optimizeImage: params.optimizeImage,
@@ -90,4 +103,46 @@ export class StorageService {
 
         return result.value;
     }
+
+    async download(path: string, rangeHeader?: string, ifNoneMatch?: string) {
+        const result = await this.downloadFileUseCase.execute({
+            path,
+            range: this.parseRange(rangeHeader),
+            ifNoneMatch,
+        });
+
+        if (result.isLeft()) {
+            if (result.value instanceof RangeNotSatisfiableError) {
+                throw new HttpException(result.value.message, HttpStatus.REQUESTED_RANGE_NOT_SATISFIABLE);
+            }
+            throw new NotFoundException(result.value.message);
+        }
+
+        return result.value;
+    }
+
+    /**
+     * Single "bytes=" ranges only; anything else is ignored and the whole file is served
+     */
+    private parseRange(header?: string): RequestedRange | undefined {
+        const match = header?.match(/^bytes=(\d*)-(\d*)$/);
+
+        if (!match || (!match[1] && !match[2])) {
+            return undefined;
+        }
+
+        if (!match[1]) {
+            return { suffixLength: Number(match[2]) };
+        }
+
+        const start = Number(match[1]);
+        const end = match[2] ? Number(match[2]) : undefined;
+
+        // A range ending before it starts is invalid and must be ignored
+        if (end !== undefined && end < start) {
+            return undefined;
+        }
+
+        return { start, end };
+    }
 }
@@ -1,10 +1,19 @@
 import { Module } from "@nestjs/common";
+import { ConditionalModule } from "@nestjs/config";
 import { StorageSharedModule } from "../@shared/modules/storage.module";
 import { StorageController } from "./controllers/storage.controller";
 import { StorageService } from "./services/storage.service";
+import { FilesModule, PublicFilesModule } from "./files.module";
+
+const isLocalDriver = (env: NodeJS.ProcessEnv) => env.STORAGE_DRIVER === "local";
 
 @Module({
-    imports: [StorageSharedModule],
+    imports: [
+        StorageSharedModule,
+        // Files are only served anonymously when they are kept on disk
+        ConditionalModule.registerWhen(PublicFilesModule, isLocalDriver),
+        ConditionalModule.registerWhen(FilesModule, (env) => !isLocalDriver(env)),
+    ],
     controllers: [StorageController],
     providers: [StorageService],
 })
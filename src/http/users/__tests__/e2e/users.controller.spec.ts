@@ -131,10 +131,24 @@ describe("UsersController (e2e)", () => {
 
             const response = await request(app.getHttpServer())
                 .get("/users")
-                .query({ page: 1, limit: 5 })
+                .query({ limit: 5 })
                 .set("Authorization", `Bearer ${authToken}`);
 
             expect(response.status).toBe(200);
+            expect(response.body).toHaveProperty("nextCursor");
+        });
+
+        it("should return 400 when the cursor is invalid", async () => {
+            if (!authToken) {
+                return;
+            }
+
+            const response = await request(app.getHttpServer())
+                .get("/users")
+                .query({ cursor: "not-a-cursor" })
+                .set("Authorization", `Bearer ${authToken}`);
+
+            expect(response.status).toBe(400);
         });
     });
 
@@ -1,9 +1,9 @@
 import { Validator } from "@/http/@shared/decorators/validator.decorator";
+import { SpooledFileInterceptor } from "@/http/@shared/interceptors/spooled-file.interceptor";
 import { Public } from "@/http/auth/decorators/public.decorator";
 import type { Env } from "@/env/env";
 import { Body, Controller, Delete, Get, Param, Patch, Post, Query, UploadedFile, UseInterceptors } from "@nestjs/common";
 import { ConfigService } from "@nestjs/config";
-import { FileInterceptor } from "@nestjs/platform-express";
 import { ApiBearerAuth, ApiBody, ApiConsumes, ApiOperation, ApiParam, ApiQuery, ApiResponse, ApiTags } from "@nestjs/swagger";
 import {
     CreateUserDTO,
@@ -16,6 +16,8 @@ import {
 } from "../schemas/users.schema";
 import { UsersService } from "../services/users.service";
 
+const MAX_AVATAR_SIZE = 5 * 1024 * 1024; // 5MB
+
 @ApiTags("Users")
 @ApiBearerAuth("JWT-auth")
 @Controller("/users")
@@ -39,10 +41,14 @@ export class UsersController {
 
     @Get()
     @Validator(listUsersQuerySchema)
-    @ApiOperation({ summary: "List users", description: "Get paginated list of all users" })
-    @ApiQuery({ name: "page", required: false, type: Number, description: "Page number (default: 1)" })
+    @ApiOperation({
+        summary: "List users",
+        description: "Get a page of users, oldest first. Pass the returned nextCursor to get the next page.",
+    })
+    @ApiQuery({ name: "cursor", required: false, type: String, description: "nextCursor of the previous page" })
     @ApiQuery({ name: "limit", required: false, type: Number, description: "Items per page (default: 10, max: 100)" })
     @ApiResponse({ status: 200, description: "Users list", type: [UserResponseDTO] })
+    @ApiResponse({ status: 400, description: "Invalid cursor" })
     @ApiResponse({ status: 401, description: "Unauthorized" })
     findAll(@Query() query: ListUsersQueryDTO) {
         return this.usersService.findAll(query);
@@ -59,7 +65,7 @@ export class UsersController {
     }
 
     @Patch(":id")
-    @UseInterceptors(FileInterceptor("avatar"))
+    @UseInterceptors(SpooledFileInterceptor("avatar", MAX_AVATAR_SIZE))
     @Validator(updateUserBodySchema)
     @ApiOperation({
         summary: "Update user",
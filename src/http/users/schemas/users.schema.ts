@@ -3,7 +3,7 @@ import z from "zod";
 
 // Query params for listing users
 export const listUsersQuerySchema = z.object({
-    page: z.coerce.number().min(1).default(1).describe("Page number"),
+    cursor: z.string().min(1).optional().describe("Cursor returned as nextCursor by the previous page"),
     limit: z.coerce.number().min(1).max(100).default(10).describe("Items per page"),
 });
 
@@ -7,9 +7,11 @@ import { ROLES, Roles, User } from "@/domain/identity/enterprise/entities/user.e
 import { DeleteFileByEntityUseCase } from "@/domain/storage/application/use-cases/delete-file-by-entity.use-case";
 import { GetFileUrlUseCase } from "@/domain/storage/application/use-cases/get-file-url.use-case";
 import { UploadFileUseCase } from "@/domain/storage/application/use-cases/upload-file.use-case";
+import { FileUrlLoader } from "@/http/@shared/loaders/file-url.loader";
 import { UserPresenter } from "@/http/@shared/presenters/user.presenter";
 import { CreateUserDTO, ListUsersQueryDTO, UpdateUserDTO } from "@/http/users/schemas/users.schema";
 import { BadRequestException, ConflictException, Inject, Injectable, NotFoundException } from "@nestjs/common";
+import { createReadStream } from "fs";
 
 @Injectable()
 export class UsersService {
@@ -32,27 +34,19 @@ export class UsersService {
         private deleteFileByEntityUseCase: DeleteFileByEntityUseCase,
     ) {}
 
-    private async getUserAvatarUrl(userId: string): Promise<string | null> {
-        const result = await this.getFileUrlUseCase.execute({
-            entityType: "user",
-            entityId: userId,
-            field: "avatar",
-        });
-
-        if (result.isLeft()) {
-            return null;
-        }
-
-        return result.value.url;
+    private createAvatarLoader() {
+        return new FileUrlLoader(this.getFileUrlUseCase, { entityType: "user", field: "avatar" });
     }
 
-    private async presentUser(user: User) {
-        const avatarUrl = await this.getUserAvatarUrl(user.id.toString());
+    private async presentUser(user: User, avatarLoader: FileUrlLoader = this.createAvatarLoader()) {
+        const avatarUrl = await avatarLoader.load(user.id.toString());
         return UserPresenter.toHTTP(user, { avatarUrl });
     }
 
     private async presentUsers(users: User[]) {
-        return Promise.all(users.map((user) => this.presentUser(user)));
+        // A single loader coalesces every avatar lookup of the page into one query
+        const avatarLoader = this.createAvatarLoader();
+        return Promise.all(users.map((user) => this.presentUser(user, avatarLoader)));
     }
 
     async create(dto: CreateUserDTO) {
@@ -78,15 +72,19 @@ export class UsersService {
 
     async findAll(query: ListUsersQueryDTO) {
         const result = await this.getAllUsersUseCase.execute({
-            page: query.page,
+            cursor: query.cursor,
             limit: query.limit,
         });
 
-        const users = result.value.users;
+        if (result.isLeft()) {
+            throw new BadRequestException(result.value.message);
+        }
+
+        const { users, nextCursor } = result.value;
 
         return {
             users: await this.presentUsers(users),
-            page: query.page,
+            nextCursor,
             limit: query.limit,
         };
     }
@@ -145,12 +143,14 @@ export class UsersService {
         }
         // Upload avatar if provided
         else if (options?.avatar && options?.environment) {
+            const avatar = options.avatar;
+            // SpooledFileInterceptor removes the temporary file once the response is sent
             const uploadResult = await this.uploadFileUseCase.execute({
                 entityType: "user",
                 entityId: userId,
                 field: "avatar",
-                filename: options.avatar.originalname,
-                buffer: options.avatar.buffer,
+                filename: avatar.originalname,
+                stream: createReadStream(avatar.path),
                 environment: options.environment,
                 validationOptions: {
                     allowedMimeTypes: ["image/jpeg", "image/png", "image/webp", "image/gif"],
@@ -1,14 +1,18 @@
 import { IPasswordAuthProvider } from "@/domain/identity/application/providers/password-auth.provider";
-import { compare, hash } from "@/infra/cryptography/providers/bcrypt.provider";
+import { BcryptHashProvider } from "@/infra/cryptography/providers/bcrypt.provider";
 
 export class PasswordAuthProvider implements IPasswordAuthProvider {
-    private readonly SALT_ROUNDS = 6;
+    constructor(private bcryptHashProvider: BcryptHashProvider) {}
 
     async hash(password: string): Promise<string> {
-        return hash(password, this.SALT_ROUNDS);
+        return this.bcryptHashProvider.hash(password);
     }
 
     async compare(password: string, hashedPassword: string): Promise<boolean> {
-        return compare(password, hashedPassword);
+        return this.bcryptHashProvider.compare(password, hashedPassword);
+    }
+
+    needsRehash(hashedPassword: string): boolean {
+        return this.bcryptHashProvider.needsRehash(hashedPassword);
     }
 }
@@ -0,0 +1,146 @@
+import { EventEmitter } from "events";
+import { compare } from "bcryptjs";
+import { HashingUnavailableError } from "@/domain/@shared/errors/hashing-unavailable.error";
+import { BcryptWorkerPool, BcryptWorkerRequest, BcryptWorkerResponse } from "../../workers/bcrypt-worker-pool";
+
+/**
+ * Stands in for a worker thread: the test answers the posted jobs or crashes it.
+ * The "mock" prefix lets the hoisted jest.mock factory reference it.
+ */
+class MockWorker extends EventEmitter {
+    static instances: MockWorker[] = [];
+
+    requests: BcryptWorkerRequest[] = [];
+    terminated = false;
+
+    constructor() {
+        super();
+        MockWorker.instances.push(this);
+    }
+
+    postMessage(request: BcryptWorkerRequest) {
+        this.requests.push(request);
+    }
+
+    respond(response: { result: string | boolean } | { error: string }) {
+        const request = this.requests[this.requests.length - 1];
+        this.emit("message", { ...response, id: request.id } as BcryptWorkerResponse);
+    }
+
+    /** Like a real worker, "exit" is emitted before terminate() resolves */
+    async terminate() {
+        if (this.terminated) return 1;
+
+        this.terminated = true;
+        this.emit("exit", 1);
+        return 1;
+    }
+
+    ref() {}
+
+    unref() {}
+}
+
+jest.mock("worker_threads", () => ({
+    Worker: jest.fn().mockImplementation(() => new MockWorker()),
+}));
+
+const settle = <T>(promise: Promise<T>) =>
+    promise.then(
+        (value) => ({ value, error: undefined }),
+        (error: Error) => ({ value: undefined, error }),
+    );
+
+describe("BcryptWorkerPool", () => {
+    beforeEach(() => {
+        MockWorker.instances = [];
+    });
+
+    it("should dispatch jobs to workers and resolve with their result", async () => {
+        const pool = new BcryptWorkerPool({ size: 2 });
+
+        const hashing = pool.hash("secret", 4);
+        MockWorker.instances[0].respond({ result: "hashed" });
+
+        await expect(hashing).resolves.toBe("hashed");
+        expect(MockWorker.instances[0].requests[0]).toEqual(
+            expect.objectContaining({ op: "hash", plain: "secret", rounds: 4 }),
+        );
+        expect(pool.stats).toEqual({ workers: 1, busy: 0, queued: 0 });
+    });
+
+    it("should reject new jobs with HashingUnavailableError once the queue is full", async () => {
+        const pool = new BcryptWorkerPool({ size: 1, maxQueueSize: 1 });
+
+        const running = pool.compare("secret", "hashed");
+        const queued = pool.compare("secret", "hashed");
+
+        await expect(pool.compare("secret", "hashed")).rejects.toBeInstanceOf(HashingUnavailableError);
+        expect(pool.stats).toEqual({ workers: 1, busy: 1, queued: 1 });
+
+        const [worker] = MockWorker.instances;
+        worker.respond({ result: true });
+        await expect(running).resolves.toBe(true);
+
+        worker.respond({ result: false });
+        await expect(queued).resolves.toBe(false);
+    });
+
+    it("should reject the in-flight job of a crashed worker and replace it for the queued ones", async () => {
+        const pool = new BcryptWorkerPool({ size: 1 });
+
+        const inFlight = settle(pool.hash("first", 4));
+        const queued = pool.hash("second", 4);
+
+        const [crashed] = MockWorker.instances;
+        crashed.emit("error", new Error("worker crashed"));
+
+        expect((await inFlight).error?.message).toBe("worker crashed");
+        expect(crashed.terminated).toBe(true);
+        expect(MockWorker.instances).toHaveLength(2);
+
+        const replacement = MockWorker.instances[1];
+        expect(replacement.requests[0]).toEqual(expect.objectContaining({ plain: "second" }));
+
+        replacement.respond({ result: "hashed" });
+        await expect(queued).resolves.toBe("hashed");
+    });
+
+    it("should reject the job of a worker that exits unexpectedly", async () => {
+        const pool = new BcryptWorkerPool({ size: 1 });
+
+        const inFlight = pool.hash("secret", 4);
+        MockWorker.instances[0].emit("exit", 1);
+
+        await expect(inFlight).rejects.toThrow("Bcrypt worker exited with code 1");
+        expect(pool.stats.workers).toBe(0);
+    });
+
+    it("should reject queued and new work once closed", async () => {
+        const pool = new BcryptWorkerPool({ size: 1 });
+
+        const inFlight = settle(pool.hash("first", 4));
+        const queued = pool.hash("second", 4);
+
+        await pool.close();
+
+        await expect(queued).rejects.toBeInstanceOf(HashingUnavailableError);
+        await expect(pool.hash("third", 4)).rejects.toBeInstanceOf(HashingUnavailableError);
+        expect(MockWorker.instances[0].terminated).toBe(true);
+        expect(pool.stats).toEqual({ workers: 0, busy: 0, queued: 0 });
+
+        // Terminating the worker fails the job it was running
+        expect((await inFlight).error?.message).toBe("Bcrypt worker exited with code 1");
+    });
+
+    it("should hash on the main thread without workers when size is 0", async () => {
+        const pool = new BcryptWorkerPool({ size: 0 });
+
+        const hashed = await pool.hash("secret", 4);
+
+        expect(await compare("secret", hashed)).toBe(true);
+        await expect(pool.compare("secret", hashed)).resolves.toBe(true);
+        await expect(pool.compare("other", hashed)).resolves.toBe(false);
+        expect(MockWorker.instances).toHaveLength(0);
+    });
+});
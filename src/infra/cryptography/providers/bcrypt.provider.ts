@@ -1,16 +1,30 @@
 import { IHashComparerProvider, IHashProvider } from "@/domain/@shared/providers/bcrypt.provider";
-import { compare, hash } from "bcryptjs";
+import { getRounds } from "bcryptjs";
+import { BcryptWorkerPool } from "../workers/bcrypt-worker-pool";
 
 export class BcryptHashProvider implements IHashProvider, IHashComparerProvider {
-    private readonly SALT_ROUNDS = 6;
+    constructor(
+        private pool: BcryptWorkerPool,
+        private saltRounds = 6,
+    ) {}
 
     async hash(plain: string): Promise<string> {
-        return hash(plain, this.SALT_ROUNDS);
+        return this.pool.hash(plain, this.saltRounds);
     }
 
     async compare(plain: string, hashed: string): Promise<boolean> {
-        return compare(plain, hashed);
+        return this.pool.compare(plain, hashed);
     }
-}
 
-export { compare, hash };
+    /**
+     * Whether the hash was made with a cost other than the current one
+     */
+    needsRehash(hashed: string): boolean {
+        try {
+            return getRounds(hashed) !== this.saltRounds;
+        } catch {
+            // Not a bcrypt hash
+            return false;
+        }
+    }
+}
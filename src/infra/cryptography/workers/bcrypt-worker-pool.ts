@@ -0,0 +1,202 @@
+import { HashingUnavailableError } from "@/domain/@shared/errors/hashing-unavailable.error";
+import { compare, hash } from "bcryptjs";
+import { availableParallelism } from "os";
+import { extname, join } from "path";
+import { Worker } from "worker_threads";
+
+export type BcryptJob =
+    | { op: "hash"; plain: string; rounds: number }
+    | { op: "compare"; plain: string; hashed: string };
+
+export type BcryptWorkerRequest = BcryptJob & { id: number };
+
+export type BcryptWorkerResponse = { id: number; result: string | boolean } | { id: number; error: string };
+
+export interface BcryptWorkerPoolOptions {
+    /** Worker threads, 0 hashes on the main thread (default: available cores) */
+    size?: number;
+    /** Jobs waiting for a free worker before new ones are rejected (default: 100) */
+    maxQueueSize?: number;
+}
+
+interface PendingJob {
+    request: BcryptWorkerRequest;
+    resolve: (result: any) => void;
+    reject: (error: Error) => void;
+}
+
+interface PoolWorker {
+    worker: Worker;
+    job: PendingJob | null;
+}
+
+// Compiled builds run the .js worker, sources (tests, ts-node) the .ts one through ts-node
+const WORKER_EXTENSION = extname(__filename);
+const WORKER_FILE = join(__dirname, `bcrypt.worker${WORKER_EXTENSION}`);
+const WORKER_EXEC_ARGV = WORKER_EXTENSION === ".ts" ? ["-r", "ts-node/register/transpile-only"] : undefined;
+
+/**
+ * Runs bcrypt in worker threads, so hashing a password never blocks the event loop.
+ *
+ * Workers are started on demand and process one job at a time. When every worker is busy, jobs
+ * wait in a bounded queue; once it is full, new jobs fail right away with HashingUnavailableError
+ * instead of piling up behind a login burst.
+ */
+export class BcryptWorkerPool {
+    private readonly size: number;
+    private readonly maxQueueSize: number;
+
+    private workers: PoolWorker[] = [];
+    private queue: PendingJob[] = [];
+    private nextId = 0;
+    private closed = false;
+
+    constructor(options: BcryptWorkerPoolOptions = {}) {
+        this.size = options.size ?? availableParallelism();
+        this.maxQueueSize = options.maxQueueSize ?? 100;
+    }
+
+    get stats() {
+        return {
+            workers: this.workers.length,
+            busy: this.workers.filter((poolWorker) => poolWorker.job).length,
+            queued: this.queue.length,
+        };
+    }
+
+    hash(plain: string, rounds: number): Promise<string> {
+        return this.run({ op: "hash", plain, rounds });
+    }
+
+    compare(plain: string, hashed: string): Promise<boolean> {
+        return this.run({ op: "compare", plain, hashed });
+    }
+
+    async close(): Promise<void> {
+        this.closed = true;
+
+        for (const job of this.queue.splice(0)) {
+            job.reject(new HashingUnavailableError());
+        }
+
+        await Promise.all(this.workers.map(({ worker }) => worker.terminate()));
+        this.workers = [];
+    }
+
+    async onModuleDestroy() {
+        await this.close();
+    }
+
+    private run<T>(job: BcryptJob): Promise<T> {
+        if (this.size === 0) {
+            return (job.op === "hash" ? hash(job.plain, job.rounds) : compare(job.plain, job.hashed)) as Promise<T>;
+        }
+
+        return new Promise<T>((resolve, reject) => {
+            if (this.closed) {
+                return reject(new HashingUnavailableError());
+            }
+
+            const pending: PendingJob = { request: { ...job, id: this.nextId++ }, resolve, reject };
+            const poolWorker = this.acquire();
+
+            if (poolWorker) {
+                this.dispatch(poolWorker, pending);
+            } else if (this.queue.length < this.maxQueueSize) {
+                this.queue.push(pending);
+            } else {
+                reject(new HashingUnavailableError());
+            }
+        });
+    }
+
+    /**
+     * An idle worker, starting a new one while the pool isn't full
+     */
+    private acquire(): PoolWorker | null {
+        const idle = this.workers.find((poolWorker) => !poolWorker.job);
+
+        if (idle) return idle;
+
+        if (this.workers.length >= this.size) return null;
+
+        const poolWorker: PoolWorker = {
+            worker: new Worker(WORKER_FILE, { execArgv: WORKER_EXEC_ARGV }),
+            job: null,
+        };
+
+        poolWorker.worker.on("message", (response: BcryptWorkerResponse) => this.complete(poolWorker, response));
+        poolWorker.worker.on("error", (error) => this.fail(poolWorker, error));
+        poolWorker.worker.on("exit", (code) => {
+            this.fail(poolWorker, new Error(`Bcrypt worker exited with code ${code}`));
+        });
+
+        // Idle workers must not keep the process alive
+        poolWorker.worker.unref();
+
+        this.workers.push(poolWorker);
+
+        return poolWorker;
+    }
+
+    private dispatch(poolWorker: PoolWorker, job: PendingJob) {
+        poolWorker.job = job;
+        poolWorker.worker.ref();
+        poolWorker.worker.postMessage(job.request);
+    }
+
+    private complete(poolWorker: PoolWorker, response: BcryptWorkerResponse) {
+        const job = poolWorker.job;
+
+        if (!job || job.request.id !== response.id) return;
+
+        if ("error" in response) {
+            job.reject(new Error(response.error));
+        } else {
+            job.resolve(response.result);
+        }
+
+        this.release(poolWorker);
+    }
+
+    private release(poolWorker: PoolWorker) {
+        poolWorker.job = null;
+
+        const next = this.queue.shift();
+
+        if (next) {
+            this.dispatch(poolWorker, next);
+        } else {
+            poolWorker.worker.unref();
+        }
+    }
+
+    /**
+     * A crashed worker is replaced on demand; its job fails, the queued ones move to other workers
+     */
+    private fail(poolWorker: PoolWorker, error: Error) {
+        const index = this.workers.indexOf(poolWorker);
+
+        if (index === -1) return;
+
+        this.workers.splice(index, 1);
+        poolWorker.job?.reject(error);
+        poolWorker.job = null;
+
+        if (this.closed) return;
+
+        void poolWorker.worker.terminate();
+
+        const next = this.queue.shift();
+
+        if (next) {
+            const replacement = this.acquire();
+
+            if (replacement) {
+                this.dispatch(replacement, next);
+            } else {
+                this.queue.unshift(next);
+            }
+        }
+    }
+}
@@ -0,0 +1,21 @@
+import { compareSync, hashSync } from "bcryptjs";
+import { parentPort } from "worker_threads";
+import type { BcryptWorkerRequest, BcryptWorkerResponse } from "./bcrypt-worker-pool";
+
+// A worker runs one job at a time, so the synchronous variants are the cheapest
+parentPort?.on("message", (request: BcryptWorkerRequest) => {
+    let response: BcryptWorkerResponse;
+
+    try {
+        const result =
+            request.op === "hash"
+                ? hashSync(request.plain, request.rounds)
+                : compareSync(request.plain, request.hashed);
+
+        response = { id: request.id, result };
+    } catch (error) {
+        response = { id: request.id, error: error instanceof Error ? error.message : String(error) };
+    }
+
+    parentPort?.postMessage(response);
+});
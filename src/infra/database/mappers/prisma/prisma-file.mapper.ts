@@ -5,7 +5,7 @@ import type { File as PrismaFile } from "@prisma/client";
 
 export class PrismaFileMapper {
     static toDomain(raw: PrismaFile): File {
-        return File.create(
+        const file = File.create(
             {
                 entityType: raw.entityType,
                 entityId: raw.entityId,
@@ -21,6 +21,12 @@ export class PrismaFileMapper {
             },
             raw.id,
         );
+
+        // Pagination cursors are built from the stored creation date
+        file.createdAt = raw.createdAt;
+        file.updatedAt = raw.updatedAt;
+
+        return file;
     }
 
     static toPrisma(file: File) {
@@ -2,9 +2,15 @@ import { Roles, User } from "@/domain/identity/enterprise/entities/user.entity";
 import { Username } from "@/domain/identity/enterprise/value-objects/username.vo";
 import type { User as PrismaUser } from "@prisma/client";
 
+/**
+ * User row as loaded by full queries or by listing projections (which leave out the password hash)
+ */
+export type PrismaUserRow = Omit<PrismaUser, "passwordHash" | "createdAt" | "updatedAt"> &
+    Partial<Pick<PrismaUser, "passwordHash" | "createdAt" | "updatedAt">>;
+
 export class PrismaUserMapper {
-    static toDomain(raw: PrismaUser): User {
-        return User.create(
+    static toDomain(raw: PrismaUserRow): User {
+        const user = User.create(
             {
                 username: Username.create(raw.username),
                 email: raw.email,
@@ -13,6 +19,12 @@ export class PrismaUserMapper {
             },
             raw.id,
         );
+
+        // Pagination cursors are built from the stored creation date
+        if (raw.createdAt) user.createdAt = raw.createdAt;
+        if (raw.updatedAt) user.updatedAt = raw.updatedAt;
+
+        return user;
     }
 
     static toPrisma(user: User) {
@@ -0,0 +1,8 @@
+-- DropIndex
+DROP INDEX "files_entity_type_entity_id_idx";
+
+-- CreateIndex
+CREATE INDEX "users_created_at_id_idx" ON "users"("created_at", "id");
+
+-- CreateIndex
+CREATE INDEX "files_entity_type_entity_id_created_at_id_idx" ON "files"("entity_type", "entity_id", "created_at", "id");
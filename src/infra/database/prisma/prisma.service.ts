@@ -1,11 +1,21 @@
 import type { Env } from "@/env/env";
+import { AsyncLocalStorage } from "async_hooks";
 import { Injectable, OnModuleDestroy, OnModuleInit } from "@nestjs/common";
 import { ConfigService } from "@nestjs/config";
 import { PrismaPg } from "@prisma/adapter-pg";
-import { PrismaClient } from "@prisma/client";
+import { Prisma, PrismaClient } from "@prisma/client";
+
+type AfterCommitCallback = () => void | Promise<void>;
+
+interface TransactionContext {
+    client: Prisma.TransactionClient | null;
+    afterCommit: AfterCommitCallback[];
+}
 
 @Injectable()
 export class PrismaService extends PrismaClient implements OnModuleInit, OnModuleDestroy {
+    private readonly transactionContext = new AsyncLocalStorage<TransactionContext>();
+
     constructor(configService: ConfigService<Env, true>) {
         const databaseUrl = configService.get("DATABASE_URL", { infer: true });
         const adapter = new PrismaPg({ connectionString: databaseUrl });
@@ -13,6 +23,57 @@ export class PrismaService extends PrismaClient implements OnModuleInit, OnModul
         super({ adapter });
     }
 
+    /**
+     * Client bound to the transaction opened by `transaction()` in the current async context,
+     * or the regular client outside of one
+     */
+    get client(): Prisma.TransactionClient {
+        return this.transactionContext.getStore()?.client ?? this;
+    }
+
+    async transaction<T>(work: () => Promise<T>): Promise<T> {
+        // Nested calls join the outer transaction
+        if (this.transactionContext.getStore()?.client) {
+            return work();
+        }
+
+        const context: TransactionContext = { client: null, afterCommit: [] };
+        let result: T;
+
+        try {
+            result = await this.$transaction((tx) => {
+                context.client = tx;
+                return this.transactionContext.run(context, work);
+            });
+        } finally {
+            // Async work started inside the transaction keeps this context:
+            // make it fall back to the regular client once it's closed
+            context.client = null;
+        }
+
+        // Committed: run what waited for it (e.g. in-process event delivery) outside of the context
+        for (const callback of context.afterCommit.splice(0)) {
+            await this.transactionContext.exit(callback);
+        }
+
+        return result;
+    }
+
+    /**
+     * Defer the callback until the transaction open in the current async context commits,
+     * dropping it on rollback. Runs it right away outside of a transaction.
+     */
+    async afterCommit(callback: AfterCommitCallback): Promise<void> {
+        const context = this.transactionContext.getStore();
+
+        if (context?.client) {
+            context.afterCommit.push(callback);
+            return;
+        }
+
+        await this.transactionContext.exit(callback);
+    }
+
     async onModuleInit() {
         await this.$connect();
     }
@@ -0,0 +1,16 @@
+import { ITransactionProvider } from "@/domain/@shared/providers/transaction.provider";
+import { Injectable } from "@nestjs/common";
+import { PrismaService } from "../prisma/prisma.service";
+
+@Injectable()
+export class PrismaTransactionProvider implements ITransactionProvider {
+    constructor(private prisma: PrismaService) {}
+
+    run<T>(work: () => Promise<T>): Promise<T> {
+        return this.prisma.transaction(work);
+    }
+
+    afterCommit(callback: () => void | Promise<void>): Promise<void> {
+        return this.prisma.afterCommit(callback);
+    }
+}
@@ -1,6 +1,9 @@
 import { Injectable } from "@nestjs/common";
 import { PrismaService } from "@/infra/database/prisma/prisma.service";
-import { FilesRepository } from "@/domain/storage/application/repositories/files.repository";
+import {
+    FilesRepository,
+    FindByEntityOptions,
+} from "@/domain/storage/application/repositories/files.repository";
 import { File } from "@/domain/storage/enterprise/entities/file.entity";
 import { PrismaFileMapper } from "../../mappers/prisma/prisma-file.mapper";
 
@@ -9,7 +12,7 @@ export class PrismaFilesRepository implements FilesRepository {
     constructor(private prisma: PrismaService) {}
 
     async findById(id: string): Promise<File | null> {
-        const file = await this.prisma.file.findUnique({
+        const file = await this.prisma.client.file.findUnique({
             where: { id },
         });
 
@@ -19,7 +22,7 @@ export class PrismaFilesRepository implements FilesRepository {
     }
 
     async findByPath(path: string): Promise<File | null> {
-        const file = await this.prisma.file.findUnique({
+        const file = await this.prisma.client.file.findUnique({
             where: { path },
         });
 
@@ -28,10 +31,21 @@ export class PrismaFilesRepository implements FilesRepository {
         return PrismaFileMapper.toDomain(file);
     }
 
-    async findByEntity(entityType: string, entityId: string): Promise<File[]> {
-        const files = await this.prisma.file.findMany({
-            where: { entityType, entityId },
-            orderBy: { createdAt: "desc" },
+    async findByEntity(entityType: string, entityId: string, options: FindByEntityOptions = {}): Promise<File[]> {
+        const { limit, after } = options;
+
+        // Keyset pagination over the (entity_type, entity_id, created_at, id) index
+        const files = await this.prisma.client.file.findMany({
+            where: {
+                entityType,
+                entityId,
+                ...(after && {
+                    createdAt: { lte: after.createdAt },
+                    OR: [{ createdAt: { lt: after.createdAt } }, { id: { lt: after.id } }],
+                }),
+            },
+            orderBy: [{ createdAt: "desc" }, { id: "desc" }],
+            take: limit,
         });
 
         return files.map(PrismaFileMapper.toDomain);
@@ -42,7 +56,7 @@ export class PrismaFilesRepository implements FilesRepository {
         entityId: string,
         field: string,
     ): Promise<File | null> {
-        const file = await this.prisma.file.findFirst({
+        const file = await this.prisma.client.file.findFirst({
             where: { entityType, entityId, field },
         });
 
@@ -51,10 +65,20 @@ export class PrismaFilesRepository implements FilesRepository {
         return PrismaFileMapper.toDomain(file);
     }
 
+    async findByEntitiesAndField(entityType: string, entityIds: string[], field: string): Promise<File[]> {
+        if (entityIds.length === 0) return [];
+
+        const files = await this.prisma.client.file.findMany({
+            where: { entityType, entityId: { in: entityIds }, field },
+        });
+
+        return files.map(PrismaFileMapper.toDomain);
+    }
+
     async create(file: File): Promise<File> {
         const data = PrismaFileMapper.toPrisma(file);
 
-        const created = await this.prisma.file.create({
+        const created = await this.prisma.client.file.create({
             data,
         });
 
@@ -65,7 +89,7 @@ export class PrismaFilesRepository implements FilesRepository {
         const data = PrismaFileMapper.toPrisma(file);
 
         try {
-            const updated = await this.prisma.file.update({
+            const updated = await this.prisma.client.file.update({
                 where: { id: data.id },
                 data: {
                     filename: data.filename,
@@ -85,7 +109,7 @@ export class PrismaFilesRepository implements FilesRepository {
 
     async delete(id: string): Promise<File | null> {
         try {
-            const deleted = await this.prisma.file.delete({
+            const deleted = await this.prisma.client.file.delete({
                 where: { id },
             });
 
@@ -96,7 +120,7 @@ export class PrismaFilesRepository implements FilesRepository {
     }
 
     async deleteByEntity(entityType: string, entityId: string): Promise<number> {
-        const result = await this.prisma.file.deleteMany({
+        const result = await this.prisma.client.file.deleteMany({
             where: { entityType, entityId },
         });
 
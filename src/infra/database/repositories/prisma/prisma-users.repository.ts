@@ -1,16 +1,37 @@
-import { UsersRepository } from "@/domain/identity/application/repositories/users.repository";
+import { ListUsersParams, UsersRepository } from "@/domain/identity/application/repositories/users.repository";
 import { User } from "@/domain/identity/enterprise/entities/user.entity";
 import { Injectable } from "@nestjs/common";
+import type { Prisma } from "@prisma/client";
 import { PrismaUserMapper } from "../../mappers/prisma/prisma-user.mapper";
 import { PrismaService } from "../../prisma/prisma.service";
 
+/**
+ * Columns listings render (see UserPresenter), plus the creation date cursors are built from
+ */
+const listSelect = {
+    id: true,
+    username: true,
+    email: true,
+    roles: true,
+    createdAt: true,
+} satisfies Prisma.UserSelect;
+
 @Injectable()
 export class PrismaUsersRepository implements UsersRepository {
     constructor(private prisma: PrismaService) {}
 
-    async list(page: number, limit: number): Promise<User[]> {
-        const users = await this.prisma.user.findMany({
-            skip: (page - 1) * limit,
+    async list({ limit, after }: ListUsersParams): Promise<User[]> {
+        // Keyset pagination over the (created_at, id) index: the `gte` bounds the index range,
+        // the OR breaks ties between users created in the same millisecond
+        const where: Prisma.UserWhereInput | undefined = after && {
+            createdAt: { gte: after.createdAt },
+            OR: [{ createdAt: { gt: after.createdAt } }, { id: { gt: after.id } }],
+        };
+
+        const users = await this.prisma.client.user.findMany({
+            select: listSelect,
+            where,
+            orderBy: [{ createdAt: "asc" }, { id: "asc" }],
             take: limit,
         });
 
@@ -18,7 +39,7 @@ export class PrismaUsersRepository implements UsersRepository {
     }
 
     async findById(id: string): Promise<User | null> {
-        const user = await this.prisma.user.findUnique({
+        const user = await this.prisma.client.user.findUnique({
             where: { id },
         });
 
@@ -28,7 +49,7 @@ export class PrismaUsersRepository implements UsersRepository {
     }
 
     async findByUsername(username: string): Promise<User | null> {
-        const user = await this.prisma.user.findUnique({
+        const user = await this.prisma.client.user.findUnique({
             where: { username },
         });
 
@@ -38,7 +59,7 @@ export class PrismaUsersRepository implements UsersRepository {
     }
 
     async findByEmail(email: string): Promise<User | null> {
-        const user = await this.prisma.user.findUnique({
+        const user = await this.prisma.client.user.findUnique({
             where: { email },
         });
 
@@ -50,7 +71,7 @@ export class PrismaUsersRepository implements UsersRepository {
     async create(user: User): Promise<User> {
         const data = PrismaUserMapper.toPrisma(user);
 
-        const created = await this.prisma.user.create({
+        const created = await this.prisma.client.user.create({
             data,
         });
 
@@ -58,7 +79,7 @@ export class PrismaUsersRepository implements UsersRepository {
     }
 
     async update(user: User): Promise<User | null> {
-        const existingUser = await this.prisma.user.findUnique({
+        const existingUser = await this.prisma.client.user.findUnique({
             where: { id: user.id.toString() },
         });
 
@@ -66,7 +87,7 @@ export class PrismaUsersRepository implements UsersRepository {
 
         const data = PrismaUserMapper.toPrisma(user);
 
-        const updated = await this.prisma.user.update({
+        const updated = await this.prisma.client.user.update({
             where: { id: user.id.toString() },
             data,
         });
@@ -75,13 +96,13 @@ export class PrismaUsersRepository implements UsersRepository {
     }
 
     async delete(userId: string): Promise<User | null> {
-        const user = await this.prisma.user.findUnique({
+        const user = await this.prisma.client.user.findUnique({
             where: { id: userId },
         });
 
         if (!user) return null;
 
-        await this.prisma.user.delete({
+        await this.prisma.client.user.delete({
             where: { id: userId },
         });
 
@@ -0,0 +1,35 @@
+import { DomainEvent } from "@/domain/@shared/events/domain-event";
+import { UserDeletedEvent } from "@/domain/identity/enterprise/events/user-deleted.event";
+import { FileDeletedEvent } from "@/domain/storage/enterprise/events/file-deleted.event";
+import { FileUploadedEvent } from "@/domain/storage/enterprise/events/file-uploaded.event";
+import { PrismaUserMapper } from "@/infra/database/mappers/prisma/prisma-user.mapper";
+import type { Prisma, User as PrismaUser } from "@prisma/client";
+
+export interface OutboxEventSerializer<E extends DomainEvent = DomainEvent> {
+    eventName: string;
+    serialize(event: E): Prisma.InputJsonObject;
+    deserialize(payload: Prisma.JsonObject): E;
+}
+
+const userDeletedEventSerializer: OutboxEventSerializer<UserDeletedEvent> = {
+    eventName: UserDeletedEvent.name,
+    serialize: (event) => ({
+        // Never persist credentials in the outbox
+        user: { ...PrismaUserMapper.toPrisma(event.user), passwordHash: null },
+    }),
+    deserialize: (payload) => new UserDeletedEvent(PrismaUserMapper.toDomain(payload.user as unknown as PrismaUser)),
+};
+
+/**
+ * Events that can be delivered through the outbox. Events with handlers but no serializer
+ * are delivered in-process instead.
+ */
+export const outboxEventSerializers: OutboxEventSerializer<any>[] = [userDeletedEventSerializer];
+
+/**
+ * Events delivered in-process under the outbox bus as well: some of their handlers maintain per-process
+ * state (the signed URL cache, the verified token cache), which a worker in another process couldn't reach.
+ * Those with a serializer are also recorded in the outbox for their durable handlers, so their handlers
+ * run in both places and must be idempotent.
+ */
+export const inProcessEventNames: string[] = [FileUploadedEvent.name, FileDeletedEvent.name, UserDeletedEvent.name];
@@ -0,0 +1,192 @@
+import { DomainEvents } from "@/domain/@shared/events/domain-events";
+import { Semaphore } from "@/domain/@shared/utils/semaphore";
+import { PrismaService } from "@/infra/database/prisma/prisma.service";
+import { Logger, OnApplicationBootstrap, OnModuleDestroy } from "@nestjs/common";
+import type { Prisma } from "@prisma/client";
+import { OutboxEventSerializer } from "./outbox-event.serializer";
+
+export interface OutboxPollingWorkerOptions {
+    /** Delay between polls when the outbox is drained (default: 1000) */
+    pollIntervalMs?: number;
+    /** Events claimed per poll (default: 50) */
+    batchSize?: number;
+    /** Events handled at the same time (default: 4) */
+    concurrency?: number;
+    /** Attempts before an event is marked as failed (default: 10) */
+    maxAttempts?: number;
+    /** How long a claimed event stays invisible to other workers (default: 60s) */
+    leaseMs?: number;
+    baseBackoffMs?: number;
+    maxBackoffMs?: number;
+}
+
+interface ClaimedOutboxEvent {
+    id: string;
+    eventName: string;
+    payload: Prisma.JsonObject;
+    occurredAt: Date;
+    attempts: number;
+}
+
+/**
+ * Delivers outbox events to their handlers. Rows are claimed with FOR UPDATE SKIP LOCKED and
+ * leased through "available_at", so several instances can poll the same table and a crashed
+ * worker's events are picked up again once the lease expires. Failures are retried with
+ * exponential backoff until maxAttempts.
+ */
+export class OutboxPollingWorker implements OnApplicationBootstrap, OnModuleDestroy {
+    private readonly logger = new Logger(OutboxPollingWorker.name);
+    private readonly serializers: Map<string, OutboxEventSerializer>;
+    private readonly options: Required<OutboxPollingWorkerOptions>;
+    private readonly slots: Semaphore;
+
+    private timer?: NodeJS.Timeout;
+    private running?: Promise<void>;
+    private stopped = true;
+
+    constructor(
+        private prisma: PrismaService,
+        serializers: OutboxEventSerializer<any>[],
+        options: OutboxPollingWorkerOptions = {},
+    ) {
+        this.serializers = new Map(serializers.map((serializer) => [serializer.eventName, serializer]));
+        this.options = {
+            pollIntervalMs: options.pollIntervalMs ?? 1000,
+            batchSize: options.batchSize ?? 50,
+            concurrency: options.concurrency ?? 4,
+            maxAttempts: options.maxAttempts ?? 10,
+            leaseMs: options.leaseMs ?? 60_000,
+            baseBackoffMs: options.baseBackoffMs ?? 1000,
+            maxBackoffMs: options.maxBackoffMs ?? 10 * 60_000,
+        };
+        this.slots = new Semaphore(this.options.concurrency);
+    }
+
+    onApplicationBootstrap() {
+        this.start();
+    }
+
+    async onModuleDestroy() {
+        await this.stop();
+    }
+
+    start() {
+        if (!this.stopped) return;
+
+        this.stopped = false;
+        this.schedule(0);
+    }
+
+    async stop() {
+        this.stopped = true;
+        clearTimeout(this.timer);
+        await this.running;
+    }
+
+    /**
+     * Claim and deliver one batch, returning the number of events claimed
+     */
+    async processBatch(): Promise<number> {
+        const events = await this.claim();
+
+        await Promise.all(events.map((event) => this.slots.run(() => this.deliver(event))));
+
+        return events.length;
+    }
+
+    private schedule(delayMs: number) {
+        this.timer = setTimeout(() => {
+            this.running = this.poll().finally(() => {
+                this.running = undefined;
+            });
+        }, delayMs);
+    }
+
+    private async poll() {
+        let claimed = 0;
+
+        try {
+            claimed = await this.processBatch();
+        } catch (error) {
+            this.logger.error("Failed to poll the outbox", error instanceof Error ? error.stack : error);
+        }
+
+        if (!this.stopped) {
+            // A full batch means there is probably more waiting
+            this.schedule(claimed === this.options.batchSize ? 0 : this.options.pollIntervalMs);
+        }
+    }
+
+    private async claim(): Promise<ClaimedOutboxEvent[]> {
+        const now = new Date();
+        const leaseUntil = new Date(now.getTime() + this.options.leaseMs);
+
+        return this.prisma.$queryRaw<ClaimedOutboxEvent[]>`
+            UPDATE "outbox_events"
+            SET "attempts" = "attempts" + 1, "available_at" = ${leaseUntil}
+            WHERE "id" IN (
+                SELECT "id" FROM "outbox_events"
+                WHERE "processed_at" IS NULL AND "failed_at" IS NULL AND "available_at" <= ${now}
+                ORDER BY "available_at"
+                LIMIT ${this.options.batchSize}
+                FOR UPDATE SKIP LOCKED
+            )
+            RETURNING "id", "event_name" AS "eventName", "payload", "occurred_at" AS "occurredAt", "attempts"
+        `;
+    }
+
+    private async deliver(record: ClaimedOutboxEvent) {
+        try {
+            const serializer = this.serializers.get(record.eventName);
+
+            if (!serializer) {
+                throw new Error(`No outbox serializer for ${record.eventName}`);
+            }
+
+            const event = serializer.deserialize(record.payload);
+            event.ocurredAt = record.occurredAt;
+
+            await DomainEvents.handle(event);
+
+            await this.prisma.outboxEvent.update({
+                where: { id: record.id },
+                data: { processedAt: new Date(), lastError: null },
+            });
+        } catch (error) {
+            await this.fail(record, error);
+        }
+    }
+
+    private async fail(record: ClaimedOutboxEvent, error: unknown) {
+        const lastError = this.describe(error);
+        const exhausted = record.attempts >= this.options.maxAttempts;
+
+        if (exhausted) {
+            this.logger.error(`Giving up on ${record.eventName} ${record.id} after ${record.attempts} attempts: ${lastError}`);
+        }
+
+        await this.prisma.outboxEvent.update({
+            where: { id: record.id },
+            data: exhausted
+                ? { failedAt: new Date(), lastError }
+                : { availableAt: new Date(Date.now() + this.backoff(record.attempts)), lastError },
+        });
+    }
+
+    /**
+     * Exponential backoff with jitter so failing events don't retry in lockstep
+     */
+    private backoff(attempts: number): number {
+        const delay = Math.min(this.options.maxBackoffMs, this.options.baseBackoffMs * 2 ** (attempts - 1));
+
+        return Math.round(delay * (0.5 + Math.random() / 2));
+    }
+
+    private describe(error: unknown): string {
+        if (error instanceof AggregateError) {
+            return [error.message, ...error.errors.map((inner) => this.describe(inner))].join("; ");
+        }
+
+        return error instanceof Error ? error.message : String(error);
+    }
+}
@@ -0,0 +1,60 @@
+import { DomainEvent } from "@/domain/@shared/events/domain-event";
+import { DomainEvents } from "@/domain/@shared/events/domain-events";
+import { EventBus } from "@/domain/@shared/events/event-bus";
+import { PrismaService } from "@/infra/database/prisma/prisma.service";
+import { Logger } from "@nestjs/common";
+import { OutboxEventSerializer } from "./outbox-event.serializer";
+
+/**
+ * Records events in the "outbox_events" table, inside the caller's transaction when there is one,
+ * so they are committed together with the aggregate change. OutboxPollingWorker delivers them.
+ */
+export class PrismaOutboxEventBus implements EventBus {
+    private readonly logger = new Logger(PrismaOutboxEventBus.name);
+    private readonly serializers: Map<string, OutboxEventSerializer>;
+    private readonly inProcessEventNames: Set<string>;
+    /** Events already reported as missing a serializer, so the hot path logs each one once */
+    private readonly unserializableEventNames = new Set<string>();
+
+    constructor(
+        private prisma: PrismaService,
+        serializers: OutboxEventSerializer<any>[],
+        private fallback: EventBus,
+        inProcessEventNames: string[] = [],
+    ) {
+        this.serializers = new Map(serializers.map((serializer) => [serializer.eventName, serializer]));
+        this.inProcessEventNames = new Set(inProcessEventNames);
+    }
+
+    async publish(event: DomainEvent): Promise<void> {
+        const eventName = event.constructor.name;
+
+        // Nobody listens: don't pay for a row
+        if (!DomainEvents.hasHandlers(eventName)) return;
+
+        const serializer = this.serializers.get(eventName);
+
+        if (!serializer) {
+            if (!this.inProcessEventNames.has(eventName) && !this.unserializableEventNames.has(eventName)) {
+                this.unserializableEventNames.add(eventName);
+                this.logger.warn(`No outbox serializer for ${eventName}, delivering in-process`);
+            }
+
+            return this.fallback.publish(event);
+        }
+
+        await this.prisma.client.outboxEvent.create({
+            data: {
+                eventName,
+                aggregateId: event.getAggregateId().toString(),
+                payload: serializer.serialize(event),
+                occurredAt: event.ocurredAt,
+            },
+        });
+
+        // Per-process handlers must also run in the process where the event happened
+        if (this.inProcessEventNames.has(eventName)) {
+            await this.fallback.publish(event);
+        }
+    }
+}
@@ -0,0 +1,108 @@
+import { once } from "events";
+import { mkdtemp, readdir, rm } from "fs/promises";
+import { tmpdir } from "os";
+import { join } from "path";
+import { Readable } from "stream";
+import { IStorageProvider } from "@/domain/storage/application/providers/storage.provider";
+import { CachedStorageProvider } from "../../providers/cached-storage.provider";
+
+/**
+ * Origin serving in-memory objects; the ETag changes with every write
+ */
+const makeOrigin = (objects: Map<string, { content: string; etag: string }>): jest.Mocked<IStorageProvider> => ({
+    uploadStream: jest.fn(),
+    uploadBuffer: jest.fn(),
+    delete: jest.fn(),
+    deleteMany: jest.fn(),
+    deleteByPrefix: jest.fn(),
+    exists: jest.fn().mockImplementation(async (path: string) => objects.has(path)),
+    stat: jest.fn().mockImplementation(async (path: string) => {
+        const object = objects.get(path);
+        return object ? { size: Buffer.byteLength(object.content), etag: object.etag } : null;
+    }),
+    createReadStream: jest.fn().mockImplementation(async (path: string) => {
+        const object = objects.get(path);
+        if (!object) throw new Error(`Not found: ${path}`);
+        return Readable.from([Buffer.from(object.content)]);
+    }),
+    getSignedUrl: jest.fn(),
+    getPublicUrl: jest.fn(),
+    copy: jest.fn(),
+    copyMany: jest.fn(),
+});
+
+const readAll = async (stream: Readable) => {
+    const chunks: Buffer[] = [];
+    for await (const chunk of stream) {
+        chunks.push(chunk);
+    }
+    return Buffer.concat(chunks).toString();
+};
+
+describe("CachedStorageProvider", () => {
+    let cacheDir: string;
+    let objects: Map<string, { content: string; etag: string }>;
+    let origin: jest.Mocked<IStorageProvider>;
+
+    beforeEach(async () => {
+        cacheDir = await mkdtemp(join(tmpdir(), "storage-cache-"));
+        objects = new Map([
+            ["a.txt", { content: "aaaaaaaaaa", etag: "a1" }],
+            ["b.txt", { content: "bbbbbbbbbb", etag: "b1" }],
+        ]);
+        origin = makeOrigin(objects);
+    });
+
+    afterEach(async () => {
+        await rm(cacheDir, { recursive: true, force: true });
+    });
+
+    it("should serve repeated reads from the cached copy", async () => {
+        const sut = new CachedStorageProvider(origin, cacheDir);
+
+        expect(await readAll(await sut.createReadStream("a.txt"))).toBe("aaaaaaaaaa");
+        expect(await readAll(await sut.createReadStream("a.txt"))).toBe("aaaaaaaaaa");
+
+        expect(origin.createReadStream).toHaveBeenCalledTimes(1);
+        expect(sut.size).toEqual({ entries: 1, bytes: 10 });
+    });
+
+    it("should cache the new content once revalidation finds the object changed", async () => {
+        // Every read revalidates the copy against the origin
+        const sut = new CachedStorageProvider(origin, cacheDir, { maxAgeMs: 0 });
+
+        expect(await readAll(await sut.createReadStream("a.txt"))).toBe("aaaaaaaaaa");
+
+        objects.set("a.txt", { content: "AAAAAAAAAA", etag: "a2" });
+
+        expect(await readAll(await sut.createReadStream("a.txt"))).toBe("AAAAAAAAAA");
+        expect(await readAll(await sut.createReadStream("a.txt"))).toBe("AAAAAAAAAA");
+
+        // One download per version: the refill was published and then reused
+        expect(origin.createReadStream).toHaveBeenCalledTimes(2);
+        expect(sut.size).toEqual({ entries: 1, bytes: 10 });
+    });
+
+    it("should keep an evicted copy readable until its open streams are closed", async () => {
+        const sut = new CachedStorageProvider(origin, cacheDir, { maxBytes: 15, maxEntryBytes: 15 });
+
+        await readAll(await sut.createReadStream("a.txt"));
+        const reading = await sut.createReadStream("a.txt");
+
+        // Caching b.txt evicts a.txt while a stream on it hasn't even opened its file yet
+        await readAll(await sut.createReadStream("b.txt"));
+        expect(sut.size).toEqual({ entries: 1, bytes: 10 });
+
+        const closed = once(reading, "close");
+        expect(await readAll(reading)).toBe("aaaaaaaaaa");
+        await closed;
+
+        // The last reader unlinked the evicted copy
+        let files = await readdir(join(cacheDir, "entries"));
+        for (let attempt = 0; files.length > 1 && attempt < 50; attempt++) {
+            await new Promise((resolve) => setTimeout(resolve, 10));
+            files = await readdir(join(cacheDir, "entries"));
+        }
+        expect(files).toHaveLength(1);
+    });
+});
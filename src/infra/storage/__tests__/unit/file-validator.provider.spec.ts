@@ -0,0 +1,67 @@
+import sharp from "sharp";
+import { Readable } from "stream";
+import { FileValidatorProvider } from "../../providers/file-validator.provider";
+
+const readAll = async (stream: Readable) => {
+    const chunks: Buffer[] = [];
+    for await (const chunk of stream) {
+        chunks.push(chunk);
+    }
+    return Buffer.concat(chunks);
+};
+
+/** Emits the content in small chunks, like a multipart upload would */
+const chunked = (content: Buffer, chunkSize = 1024) =>
+    Readable.from(
+        Array.from({ length: Math.ceil(content.length / chunkSize) }, (_, i) =>
+            content.subarray(i * chunkSize, (i + 1) * chunkSize),
+        ),
+    );
+
+const makePng = (width: number, height: number) =>
+    sharp({ create: { width, height, channels: 3, background: { r: 255, g: 0, b: 0 } } })
+        .png()
+        .toBuffer();
+
+describe("FileValidatorProvider", () => {
+    let sut: FileValidatorProvider;
+
+    beforeEach(() => {
+        sut = new FileValidatorProvider();
+    });
+
+    describe("detectMimeTypeFromStream", () => {
+        it("should read the image header from the leading bytes and replay the whole content", async () => {
+            const content = await makePng(640, 480);
+
+            const result = await sut.detectMimeTypeFromStream(chunked(content));
+
+            expect(result.mimeType).toBe("image/png");
+            expect(result.image).toEqual(expect.objectContaining({ format: "png", width: 640, height: 480 }));
+            expect((await readAll(result.stream)).equals(content)).toBe(true);
+        });
+
+        it("should not report an image header for other files", async () => {
+            const content = Buffer.concat([Buffer.from("%PDF-1.7\n"), Buffer.alloc(8192, 0x20)]);
+
+            const result = await sut.detectMimeTypeFromStream(chunked(content));
+
+            expect(result.mimeType).toBe("application/pdf");
+            expect(result.image).toBeUndefined();
+            expect((await readAll(result.stream)).equals(content)).toBe(true);
+        });
+    });
+
+    describe("validateImageDimensions", () => {
+        it("should reject dimensions outside the limits", () => {
+            const result = sut.validateImageDimensions({ width: 50, height: 50 }, { minWidth: 100 });
+
+            expect(result.isValid).toBe(false);
+            expect(result.error).toContain("width");
+        });
+
+        it("should reject unknown dimensions", () => {
+            expect(sut.validateImageDimensions(null, { maxWidth: 100 }).isValid).toBe(false);
+        });
+    });
+});
@@ -0,0 +1,153 @@
+import { Bucket, GetFilesOptions, Storage } from "@google-cloud/storage";
+import { GcpStorageProvider } from "../../providers/gcp-storage.provider";
+
+interface StubFile {
+    name: string;
+    delete: jest.Mock;
+    copy: jest.Mock;
+}
+
+/**
+ * In-memory bucket: `getFiles` pages through the stored names, `copy` and `delete` act on them.
+ * Paths listed in `failing` reject every request.
+ */
+const makeBucket = (names: string[], failing: string[] = []) => {
+    const objects = new Set(names);
+    let inFlight = 0;
+    let maxInFlight = 0;
+
+    const request = async (name: string, operation: () => void) => {
+        inFlight++;
+        maxInFlight = Math.max(maxInFlight, inFlight);
+        await new Promise((resolve) => setImmediate(resolve));
+        inFlight--;
+
+        if (failing.includes(name)) {
+            throw new Error(`Request failed for ${name}`);
+        }
+        operation();
+    };
+
+    const file = (name: string): StubFile => ({
+        name,
+        delete: jest.fn().mockImplementation(() => request(name, () => objects.delete(name))),
+        copy: jest.fn().mockImplementation((destination: StubFile) =>
+            request(name, () => {
+                if (!objects.has(name)) throw new Error(`No such object: ${name}`);
+                objects.add(destination.name);
+            }),
+        ),
+    });
+
+    const getFiles = jest.fn().mockImplementation(async (query: GetFilesOptions) => {
+        // Like GCS, a page token resumes after the last name listed, whatever was deleted since
+        const matching = [...objects]
+            .filter((name) => name.startsWith(query.prefix ?? "") && (!query.pageToken || name > query.pageToken))
+            .sort();
+        const page = matching.slice(0, query.maxResults ?? matching.length);
+        const nextQuery = page.length < matching.length ? { ...query, pageToken: page[page.length - 1] } : null;
+
+        return [page.map(file), nextQuery];
+    });
+
+    return {
+        bucket: { file, getFiles } as unknown as Bucket,
+        objects,
+        getFiles,
+        get maxInFlight() {
+            return maxInFlight;
+        },
+    };
+};
+
+describe("GcpStorageProvider", () => {
+    let stub: ReturnType<typeof makeBucket>;
+    let sut: GcpStorageProvider;
+
+    const useBucket = (names: string[], failing?: string[]) => {
+        stub = makeBucket(names, failing);
+        jest.spyOn(Storage.prototype, "bucket").mockReturnValue(stub.bucket);
+        sut = new GcpStorageProvider("bucket", undefined, { bulkConcurrency: 2 });
+    };
+
+    afterEach(() => {
+        jest.restoreAllMocks();
+    });
+
+    describe("deleteMany", () => {
+        it("should delete every path once with bounded concurrency", async () => {
+            useBucket(["a/1", "a/2", "a/3", "a/4", "a/5"]);
+
+            const result = await sut.deleteMany(["a/1", "a/2", "a/3", "a/4", "a/5", "a/1"]);
+
+            expect(result.succeeded.sort()).toEqual(["a/1", "a/2", "a/3", "a/4", "a/5"]);
+            expect(result.failed).toEqual([]);
+            expect(stub.objects.size).toBe(0);
+            expect(stub.maxInFlight).toBe(2);
+        });
+
+        it("should report failed deletions without stopping the others", async () => {
+            useBucket(["a/1", "a/2", "a/3"], ["a/2"]);
+
+            const result = await sut.deleteMany(["a/1", "a/2", "a/3"]);
+
+            expect(result.succeeded.sort()).toEqual(["a/1", "a/3"]);
+            expect(result.failed).toEqual([{ path: "a/2", error: "Request failed for a/2" }]);
+            expect([...stub.objects]).toEqual(["a/2"]);
+        });
+    });
+
+    describe("deleteByPrefix", () => {
+        it("should delete the listed objects page by page", async () => {
+            const names = Array.from({ length: 2500 }, (_, i) => `user/user-1/${String(i).padStart(4, "0")}`);
+            useBucket([...names, "user/user-10/avatar.png"]);
+
+            const result = await sut.deleteByPrefix("user/user-1/");
+
+            expect(stub.getFiles).toHaveBeenCalledTimes(3);
+            expect(stub.getFiles).toHaveBeenCalledWith(
+                expect.objectContaining({ prefix: "user/user-1/", maxResults: 1000, autoPaginate: false }),
+            );
+            expect(result.succeeded).toHaveLength(2500);
+            expect([...stub.objects]).toEqual(["user/user-10/avatar.png"]);
+        });
+
+        it("should report the objects that could not be deleted", async () => {
+            useBucket(["a/1", "a/2"], ["a/1"]);
+
+            const result = await sut.deleteByPrefix("a/");
+
+            expect(result.succeeded).toEqual(["a/2"]);
+            expect(result.failed).toEqual([{ path: "a/1", error: "Request failed for a/1" }]);
+        });
+
+        it("should refuse to delete by an empty prefix", async () => {
+            useBucket(["a/1"]);
+
+            await expect(sut.deleteByPrefix("")).rejects.toThrow("A prefix is required");
+            expect(stub.getFiles).not.toHaveBeenCalled();
+        });
+    });
+
+    describe("copyMany", () => {
+        it("should copy every pair and report failures under the source path", async () => {
+            useBucket(["a/1", "a/2"], ["a/2"]);
+
+            const result = await sut.copyMany([
+                { sourcePath: "a/1", destinationPath: "b/1" },
+                { sourcePath: "a/2", destinationPath: "b/2" },
+                { sourcePath: "a/missing", destinationPath: "b/missing" },
+            ]);
+
+            expect(result.succeeded).toEqual(["a/1"]);
+            expect(result.failed).toHaveLength(2);
+            expect(result.failed).toEqual(
+                expect.arrayContaining([
+                    { path: "a/2", error: "Request failed for a/2" },
+                    { path: "a/missing", error: "No such object: a/missing" },
+                ]),
+            );
+            expect(stub.objects.has("b/1")).toBe(true);
+        });
+    });
+});
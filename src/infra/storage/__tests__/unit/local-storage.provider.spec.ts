@@ -0,0 +1,176 @@
+import { once } from "events";
+import { mkdtemp, readdir, rm, stat } from "fs/promises";
+import { tmpdir } from "os";
+import { join } from "path";
+import { Readable } from "stream";
+import { LocalStorageProvider } from "../../providers/local-storage.provider";
+
+const deferred = () => {
+    let resolve!: () => void;
+    const promise = new Promise<void>((res) => (resolve = res));
+    return { promise, resolve };
+};
+
+const readAll = async (stream: Readable) => {
+    const chunks: Buffer[] = [];
+    for await (const chunk of stream) {
+        chunks.push(chunk);
+    }
+    return Buffer.concat(chunks).toString();
+};
+
+const flush = () => new Promise((resolve) => setImmediate(resolve));
+
+describe("LocalStorageProvider", () => {
+    let rootDir: string;
+    let sut: LocalStorageProvider;
+
+    const upload = (path: string, content = path) =>
+        sut.uploadBuffer(Buffer.from(content), { path, mimeType: "text/plain" });
+
+    const countFiles = async (directory: string) => {
+        const entries = await readdir(join(rootDir, directory), { recursive: true, withFileTypes: true }).catch(
+            () => [],
+        );
+        return entries.filter((entry) => entry.isFile()).length;
+    };
+
+    beforeEach(async () => {
+        rootDir = await mkdtemp(join(tmpdir(), "local-storage-"));
+        sut = new LocalStorageProvider(rootDir, "http://localhost/files", { bulkConcurrency: 2 });
+    });
+
+    afterEach(async () => {
+        await rm(rootDir, { recursive: true, force: true });
+    });
+
+    describe("bulk operations", () => {
+        it("should not run more deletions at once than the bulk concurrency", async () => {
+            const gate = deferred();
+            let inFlight = 0;
+            let maxInFlight = 0;
+
+            jest.spyOn(sut, "delete").mockImplementation(async () => {
+                inFlight++;
+                maxInFlight = Math.max(maxInFlight, inFlight);
+                await gate.promise;
+                inFlight--;
+            });
+
+            const result = sut.deleteMany(["a/1.txt", "a/2.txt", "a/3.txt", "a/4.txt", "a/5.txt"]);
+
+            await flush();
+            expect(inFlight).toBe(2);
+
+            gate.resolve();
+            expect((await result).succeeded).toHaveLength(5);
+            expect(maxInFlight).toBe(2);
+        });
+
+        it("should report failed deletions without stopping the others", async () => {
+            await upload("a/1.txt");
+
+            const result = await sut.deleteMany(["a/1.txt", "../outside.txt", "a/missing.txt"]);
+
+            expect(result.succeeded.sort()).toEqual(["a/1.txt", "a/missing.txt"]);
+            expect(result.failed).toEqual([{ path: "../outside.txt", error: "Invalid storage path: ../outside.txt" }]);
+            expect(await sut.exists("a/1.txt")).toBe(false);
+        });
+
+        it("should report failed copies under their source path", async () => {
+            await upload("a/1.txt");
+
+            const result = await sut.copyMany([
+                { sourcePath: "a/1.txt", destinationPath: "b/1.txt" },
+                { sourcePath: "a/missing.txt", destinationPath: "b/missing.txt" },
+            ]);
+
+            expect(result.succeeded).toEqual(["a/1.txt"]);
+            expect(result.failed).toEqual([{ path: "a/missing.txt", error: expect.stringContaining("ENOENT") }]);
+            expect(await sut.exists("b/1.txt")).toBe(true);
+            expect(await sut.exists("b/missing.txt")).toBe(false);
+        });
+
+        it("should only delete the files under the prefix", async () => {
+            await Promise.all(["a/b/1.txt", "a/b/c/2.txt", "a/bc/3.txt", "a/d/4.txt"].map((path) => upload(path)));
+
+            const result = await sut.deleteByPrefix("a/b/");
+
+            expect(result.succeeded.sort()).toEqual(["a/b/1.txt", "a/b/c/2.txt"]);
+            expect(await sut.exists("a/bc/3.txt")).toBe(true);
+            expect(await sut.exists("a/d/4.txt")).toBe(true);
+        });
+
+        it("should match partial names when the prefix doesn't end with a slash", async () => {
+            await Promise.all(["a/b/1.txt", "a/bc/2.txt", "a/d/3.txt"].map((path) => upload(path)));
+
+            const result = await sut.deleteByPrefix("a/b");
+
+            expect(result.succeeded.sort()).toEqual(["a/b/1.txt", "a/bc/2.txt"]);
+            expect(await sut.exists("a/d/3.txt")).toBe(true);
+        });
+
+        it("should refuse to delete by an empty prefix", async () => {
+            await expect(sut.deleteByPrefix("")).rejects.toThrow("A prefix is required");
+        });
+    });
+
+    describe("content-addressed blobs", () => {
+        it("should store identical content once", async () => {
+            await upload("a/1.txt", "same content");
+            await upload("b/2.txt", "same content");
+
+            const [first, second] = await Promise.all([
+                stat(join(rootDir, "a/1.txt")),
+                stat(join(rootDir, "b/2.txt")),
+            ]);
+
+            expect(first.ino).toBe(second.ino);
+            expect(await countFiles(".blobs")).toBe(1);
+        });
+
+        it("should keep a shared blob until the last path linking it is deleted", async () => {
+            await upload("a/1.txt", "shared");
+            await sut.copy("a/1.txt", "b/1.txt");
+
+            await sut.delete("a/1.txt");
+
+            expect(await sut.exists("a/1.txt")).toBe(false);
+            expect(await readAll(await sut.createReadStream("b/1.txt"))).toBe("shared");
+            expect(await countFiles(".blobs")).toBe(1);
+
+            await sut.delete("b/1.txt");
+
+            expect(await countFiles(".blobs")).toBe(0);
+        });
+
+        it("should remove the previous blob when a path is overwritten with other content", async () => {
+            await upload("a/1.txt", "first version");
+            await upload("a/1.txt", "second version");
+
+            expect(await readAll(await sut.createReadStream("a/1.txt"))).toBe("second version");
+            expect(await countFiles(".blobs")).toBe(1);
+        });
+
+        it("should keep the blob when a path is overwritten with the same content", async () => {
+            await upload("a/1.txt", "unchanged");
+            await upload("a/1.txt", "unchanged");
+
+            expect(await readAll(await sut.createReadStream("a/1.txt"))).toBe("unchanged");
+            expect(await countFiles(".blobs")).toBe(1);
+            expect(await countFiles(".tmp")).toBe(0);
+        });
+
+        it("should publish atomically: open readers keep the content they started with", async () => {
+            await upload("a/1.txt", "first version");
+            const reader = await sut.createReadStream("a/1.txt");
+            await once(reader, "ready");
+
+            await upload("a/1.txt", "second version");
+
+            expect(await readAll(reader)).toBe("first version");
+            expect(await readAll(await sut.createReadStream("a/1.txt"))).toBe("second version");
+            expect(await countFiles(".tmp")).toBe(0);
+        });
+    });
+});
@@ -0,0 +1,295 @@
+import { createReadStream } from "fs";
+import { mkdir, rename, rm } from "fs/promises";
+import { basename, join, resolve } from "path";
+import { Readable } from "stream";
+import {
+    BulkOperationResult,
+    ByteRange,
+    CopyPair,
+    IStorageProvider,
+    StoredObjectInfo,
+    UploadOptions,
+    UploadResult,
+} from "@/domain/storage/application/providers/storage.provider";
+import { writeTempFile } from "../utils/temp-file";
+
+export interface CachedStorageProviderOptions {
+    /** Disk space the cache may use before evicting the least recently read files (default: 512MB) */
+    maxBytes?: number;
+    /** Files larger than this are always streamed from the origin (default: a tenth of maxBytes) */
+    maxEntryBytes?: number;
+    /** How long a cached file is served before its ETag is checked against the origin again (default: 5 min) */
+    maxAgeMs?: number;
+}
+
+interface CacheEntry {
+    info: StoredObjectInfo;
+    file: string;
+    validatedAt: number;
+    /** Read streams still using the file: it is only unlinked once they are closed */
+    readers: number;
+    removed: boolean;
+}
+
+interface PendingFill {
+    promise: Promise<CacheEntry | null>;
+    token: symbol;
+}
+
+/**
+ * Read-through LRU disk cache in front of another provider (typically GCS).
+ * Reads of hot files are served from local disk; writes go to the origin and invalidate
+ * the cached copy. The index lives in memory, so previously cached files are discarded on startup.
+ */
+export class CachedStorageProvider implements IStorageProvider {
+    private readonly entriesDir: string;
+    private readonly tempDir: string;
+    private readonly maxBytes: number;
+    private readonly maxEntryBytes: number;
+    private readonly maxAgeMs: number;
+
+    /** Map iteration order is the LRU order: oldest first */
+    private entries = new Map<string, CacheEntry>();
+    private filling = new Map<string, PendingFill>();
+    private totalBytes = 0;
+    private ready?: Promise<void>;
+
+    constructor(
+        private origin: IStorageProvider,
+        cacheDir: string,
+        options: CachedStorageProviderOptions = {},
+    ) {
+        this.entriesDir = join(resolve(cacheDir), "entries");
+        this.tempDir = join(resolve(cacheDir), ".tmp");
+        this.maxBytes = options.maxBytes ?? 512 * 1024 * 1024;
+        this.maxEntryBytes = options.maxEntryBytes ?? Math.floor(this.maxBytes / 10);
+        this.maxAgeMs = options.maxAgeMs ?? 5 * 60 * 1000;
+    }
+
+    get size() {
+        return { entries: this.entries.size, bytes: this.totalBytes };
+    }
+
+    async uploadStream(stream: Readable, options: UploadOptions): Promise<UploadResult> {
+        this.invalidate(options.path);
+        return this.origin.uploadStream(stream, options);
+    }
+
+    async uploadBuffer(buffer: Buffer, options: UploadOptions): Promise<UploadResult> {
+        this.invalidate(options.path);
+        return this.origin.uploadBuffer(buffer, options);
+    }
+
+    async delete(path: string): Promise<void> {
+        this.invalidate(path);
+        await this.origin.delete(path);
+    }
+
+    async deleteMany(paths: string[]): Promise<BulkOperationResult> {
+        paths.forEach((path) => this.invalidate(path));
+        return this.origin.deleteMany(paths);
+    }
+
+    async deleteByPrefix(prefix: string): Promise<BulkOperationResult> {
+        for (const path of [...this.entries.keys()]) {
+            if (path.startsWith(prefix)) {
+                this.invalidate(path);
+            }
+        }
+
+        return this.origin.deleteByPrefix(prefix);
+    }
+
+    async exists(path: string): Promise<boolean> {
+        return this.entries.has(path) || this.origin.exists(path);
+    }
+
+    async stat(path: string): Promise<StoredObjectInfo | null> {
+        const entry = this.entries.get(path);
+
+        if (entry && this.isFresh(entry)) {
+            return entry.info;
+        }
+
+        const info = await this.origin.stat(path);
+
+        if (entry) {
+            if (info?.etag === entry.info.etag) {
+                entry.validatedAt = Date.now();
+            } else {
+                // Only the outdated copy goes: a refill in progress is downloading the new content
+                this.drop(path);
+            }
+        }
+
+        return info;
+    }
+
+    async createReadStream(path: string, range?: ByteRange): Promise<Readable> {
+        const entry = await this.load(path);
+
+        // Also when the copy was evicted while the caller was waiting for it
+        if (!entry || entry.removed) {
+            return this.origin.createReadStream(path, range);
+        }
+
+        entry.readers++;
+
+        const stream = createReadStream(entry.file, range);
+
+        stream.once("close", () => {
+            entry.readers--;
+
+            if (entry.removed && entry.readers === 0) {
+                this.unlink(entry);
+            }
+        });
+
+        return stream;
+    }
+
+    async getSignedUrl(path: string, expiresInMinutes?: number): Promise<string> {
+        return this.origin.getSignedUrl(path, expiresInMinutes);
+    }
+
+    getPublicUrl(path: string): string {
+        return this.origin.getPublicUrl(path);
+    }
+
+    async copy(sourcePath: string, destinationPath: string): Promise<void> {
+        this.invalidate(destinationPath);
+        await this.origin.copy(sourcePath, destinationPath);
+    }
+
+    async copyMany(pairs: CopyPair[]): Promise<BulkOperationResult> {
+        pairs.forEach((pair) => this.invalidate(pair.destinationPath));
+        return this.origin.copyMany(pairs);
+    }
+
+    /**
+     * Return the cached copy, downloading it first on a miss (concurrent misses share one download).
+     * Null when the file doesn't exist or is too large to cache.
+     */
+    private async load(path: string): Promise<CacheEntry | null> {
+        const entry = this.entries.get(path);
+
+        if (entry && this.isFresh(entry)) {
+            this.touch(path, entry);
+            return entry;
+        }
+
+        let pending = this.filling.get(path);
+
+        if (!pending) {
+            const token = Symbol(path);
+            const promise = this.fill(path, token).finally(() => {
+                if (this.filling.get(path)?.token === token) {
+                    this.filling.delete(path);
+                }
+            });
+
+            pending = { promise, token };
+            this.filling.set(path, pending);
+        }
+
+        return pending.promise;
+    }
+
+    private async fill(path: string, token: symbol): Promise<CacheEntry | null> {
+        await (this.ready ??= this.prepare());
+
+        const info = await this.stat(path);
+
+        if (!info || info.size > this.maxEntryBytes) {
+            return null;
+        }
+
+        // Still the same content: stat() revalidated the existing copy
+        const existing = this.entries.get(path);
+
+        if (existing) {
+            this.touch(path, existing);
+            return existing;
+        }
+
+        // Download to a temp file and publish it atomically, so a reader never sees a partial copy
+        const temp = await writeTempFile(await this.origin.createReadStream(path), this.tempDir);
+
+        // The file was written or deleted while downloading: this copy may be stale
+        if (this.filling.get(path)?.token !== token) {
+            await rm(temp.path, { force: true });
+            return null;
+        }
+
+        const file = join(this.entriesDir, basename(temp.path));
+        await rename(temp.path, file);
+
+        const entry: CacheEntry = {
+            info: { ...info, size: temp.size },
+            file,
+            validatedAt: Date.now(),
+            readers: 0,
+            removed: false,
+        };
+
+        this.entries.set(path, entry);
+        this.totalBytes += temp.size;
+        this.evict();
+
+        return entry;
+    }
+
+    private async prepare() {
+        // Only the folders this cache owns are cleared
+        await Promise.all([
+            rm(this.entriesDir, { recursive: true, force: true }),
+            rm(this.tempDir, { recursive: true, force: true }),
+        ]);
+        await mkdir(this.entriesDir, { recursive: true });
+    }
+
+    private isFresh(entry: CacheEntry) {
+        return Date.now() - entry.validatedAt < this.maxAgeMs;
+    }
+
+    private touch(path: string, entry: CacheEntry) {
+        this.entries.delete(path);
+        this.entries.set(path, entry);
+    }
+
+    /**
+     * The origin object changed: forget the cached copy and any download in progress
+     */
+    private invalidate(path: string) {
+        // A download in progress must not publish its now outdated copy
+        this.filling.delete(path);
+        this.drop(path);
+    }
+
+    private drop(path: string) {
+        const entry = this.entries.get(path);
+
+        if (!entry) return;
+
+        this.entries.delete(path);
+        this.totalBytes -= entry.info.size;
+        entry.removed = true;
+
+        // Otherwise the last reader unlinks it when it closes
+        if (entry.readers === 0) {
+            this.unlink(entry);
+        }
+    }
+
+    private unlink(entry: CacheEntry) {
+        rm(entry.file, { force: true }).catch(() => undefined);
+    }
+
+    private evict() {
+        for (const path of this.entries.keys()) {
+            if (this.totalBytes <= this.maxBytes) break;
+
+            this.drop(path);
+        }
+    }
+}
@@ -1,11 +1,16 @@
 import { Injectable } from "@nestjs/common";
 import { fileTypeFromBuffer } from "file-type";
 import sharp from "sharp";
+import { PassThrough, Readable } from "stream";
 import {
     IFileValidatorProvider,
     ValidationResult,
     ValidationOptions,
     ImageDimensions,
+    FileAnalysis,
+    ImageAnalysis,
+    StreamMimeTypeResult,
+    StreamValidationResult,
 } from "@/domain/storage/application/providers/file-validator.provider";
 
 @Injectable()
@@ -19,29 +24,23 @@ export class FileValidatorProvider implements IFileValidatorProvider {
         "application/pdf",
     ];
 
-    async validateMimeType(buffer: Buffer, allowedTypes?: string[]): Promise<ValidationResult> {
-        const detectedType = await this.detectMimeType(buffer);
+    /** Leading bytes file-type needs to recognize every supported format */
+    private readonly mimeSampleSize = 4100;
 
-        if (!detectedType) {
-            return {
-                isValid: false,
-                error: "Could not detect file type. File may be corrupted or unsupported.",
-            };
-        }
+    /** Upper bound on the leading bytes read to find an image header (JPEG EXIF blocks can push SOF far in) */
+    private readonly imageHeaderSampleSize = 64 * 1024;
 
-        const allowed = allowedTypes ?? this.defaultAllowedMimeTypes;
+    async validateMimeType(buffer: Buffer, allowedTypes?: string[]): Promise<ValidationResult> {
+        return this.checkMimeType(await this.detectMimeType(buffer), allowedTypes);
+    }
 
-        if (!allowed.includes(detectedType)) {
-            return {
-                isValid: false,
-                error: `File type '${detectedType}' is not allowed. Allowed types: ${allowed.join(", ")}`,
-                detectedMimeType: detectedType,
-            };
-        }
+    async validateMimeTypeFromStream(stream: Readable, allowedTypes?: string[]): Promise<StreamValidationResult> {
+        const detection = await this.detectMimeTypeFromStream(stream);
 
         return {
-            isValid: true,
-            detectedMimeType: detectedType,
+            ...this.checkMimeType(detection.mimeType, allowedTypes),
+            image: detection.image,
+            stream: detection.stream,
         };
     }
 
@@ -60,75 +59,43 @@ export class FileValidatorProvider implements IFileValidatorProvider {
     }
 
     async validateDimensions(buffer: Buffer, options: ValidationOptions): Promise<ValidationResult> {
-        const dimensions = await this.getImageDimensions(buffer);
+        return this.validateImageDimensions(await this.getImageDimensions(buffer), options);
+    }
 
-        if (!dimensions) {
-            return {
-                isValid: false,
-                error: "Could not read image dimensions. File may not be a valid image.",
-            };
-        }
+    async getImageDimensions(buffer: Buffer): Promise<ImageDimensions | null> {
+        const image = await this.analyzeImage(buffer);
 
-        if (options.minWidth && dimensions.width < options.minWidth) {
-            return {
-                isValid: false,
-                error: `Image width (${dimensions.width}px) is less than minimum (${options.minWidth}px)`,
-            };
-        }
+        return image ? { width: image.width, height: image.height } : null;
+    }
 
-        if (options.maxWidth && dimensions.width > options.maxWidth) {
-            return {
-                isValid: false,
-                error: `Image width (${dimensions.width}px) exceeds maximum (${options.maxWidth}px)`,
-            };
-        }
+    async analyze(buffer: Buffer): Promise<FileAnalysis> {
+        const mimeType = await this.detectMimeType(buffer);
 
-        if (options.minHeight && dimensions.height < options.minHeight) {
-            return {
-                isValid: false,
-                error: `Image height (${dimensions.height}px) is less than minimum (${options.minHeight}px)`,
-            };
+        if (!mimeType?.startsWith("image/")) {
+            return { mimeType };
         }
 
-        if (options.maxHeight && dimensions.height > options.maxHeight) {
-            return {
-                isValid: false,
-                error: `Image height (${dimensions.height}px) exceeds maximum (${options.maxHeight}px)`,
-            };
-        }
-
-        return { isValid: true };
-    }
-
-    async getImageDimensions(buffer: Buffer): Promise<ImageDimensions | null> {
-        try {
-            const metadata = await sharp(buffer).metadata();
-
-            if (metadata.width && metadata.height) {
-                return {
-                    width: metadata.width,
-                    height: metadata.height,
-                };
-            }
+        // Header parse only: sharp reads the metadata without decoding the pixels
+        const image = await this.analyzeImage(buffer);
 
-            return null;
-        } catch {
-            return null;
-        }
+        return image ? { mimeType, image } : { mimeType };
     }
 
     async validate(buffer: Buffer, options: ValidationOptions): Promise<ValidationResult> {
+        // Inspect the file once; every check below reuses this analysis
+        const analysis = await this.analyze(buffer);
+
         // Validate MIME type
-        const mimeResult = await this.validateMimeType(buffer, options.allowedMimeTypes);
+        const mimeResult = this.checkMimeType(analysis.mimeType, options.allowedMimeTypes);
         if (!mimeResult.isValid) {
-            return mimeResult;
+            return { ...mimeResult, analysis };
         }
 
         // Validate size
         if (options.maxSizeBytes) {
             const sizeResult = this.validateSize(buffer.length, options.maxSizeBytes);
             if (!sizeResult.isValid) {
-                return sizeResult;
+                return { ...sizeResult, analysis };
             }
         }
 
@@ -138,15 +105,16 @@ export class FileValidatorProvider implements IFileValidatorProvider {
             options.minWidth || options.maxWidth || options.minHeight || options.maxHeight;
 
         if (isImage && hasDimensionConstraints) {
-            const dimensionResult = await this.validateDimensions(buffer, options);
+            const dimensionResult = this.validateImageDimensions(analysis.image ?? null, options);
             if (!dimensionResult.isValid) {
-                return dimensionResult;
+                return { ...dimensionResult, analysis };
             }
         }
 
         return {
             isValid: true,
             detectedMimeType: mimeResult.detectedMimeType,
+            analysis,
         };
     }
 
@@ -154,4 +122,157 @@ export class FileValidatorProvider implements IFileValidatorProvider {
         const result = await fileTypeFromBuffer(buffer);
         return result?.mime ?? null;
     }
+
+    async detectMimeTypeFromStream(stream: Readable): Promise<StreamMimeTypeResult> {
+        let { sample, ended } = await this.readSample(stream, this.mimeSampleSize);
+        const result = await fileTypeFromBuffer(sample);
+        const mimeType = result?.mime ?? null;
+
+        // Images: parse the header out of the same leading bytes, reading a bit further when it doesn't fit
+        let image: ImageAnalysis | null = null;
+
+        if (mimeType?.startsWith("image/")) {
+            image = await this.analyzeImage(sample);
+
+            if (!image && !ended) {
+                const more = await this.readSample(stream, this.imageHeaderSampleSize - sample.length);
+                sample = Buffer.concat([sample, more.sample]);
+                ended = more.ended;
+                image = await this.analyzeImage(sample);
+            }
+        }
+
+        // Replay the sampled bytes followed by the rest of the source
+        const replay = new PassThrough();
+
+        if (ended) {
+            replay.end(sample);
+        } else {
+            replay.write(sample);
+            stream.once("error", (error) => replay.destroy(error));
+            stream.pipe(replay);
+        }
+
+        return image ? { mimeType, image, stream: replay } : { mimeType, stream: replay };
+    }
+
+    private readSample(stream: Readable, size: number): Promise<{ sample: Buffer; ended: boolean }> {
+        return new Promise((resolve, reject) => {
+            const chunks: Buffer[] = [];
+            let length = 0;
+
+            const cleanup = () => {
+                stream.off("data", onData);
+                stream.off("end", onEnd);
+                stream.off("error", onError);
+            };
+
+            const onData = (chunk: Buffer) => {
+                chunks.push(chunk);
+                length += chunk.length;
+
+                if (length >= size) {
+                    cleanup();
+                    stream.pause();
+                    resolve({ sample: Buffer.concat(chunks), ended: false });
+                }
+            };
+
+            const onEnd = () => {
+                cleanup();
+                resolve({ sample: Buffer.concat(chunks), ended: true });
+            };
+
+            const onError = (error: Error) => {
+                cleanup();
+                reject(error);
+            };
+
+            stream.on("data", onData);
+            stream.once("end", onEnd);
+            stream.once("error", onError);
+        });
+    }
+
+    private async analyzeImage(buffer: Buffer): Promise<ImageAnalysis | null> {
+        try {
+            const metadata = await sharp(buffer).metadata();
+
+            if (metadata.width && metadata.height) {
+                return {
+                    format: metadata.format ?? "unknown",
+                    width: metadata.width,
+                    height: metadata.height,
+                    orientation: metadata.orientation,
+                };
+            }
+
+            return null;
+        } catch {
+            return null;
+        }
+    }
+
+    private checkMimeType(detectedType: string | null, allowedTypes?: string[]): ValidationResult {
+        if (!detectedType) {
+            return {
+                isValid: false,
+                error: "Could not detect file type. File may be corrupted or unsupported.",
+            };
+        }
+
+        const allowed = allowedTypes ?? this.defaultAllowedMimeTypes;
+
+        if (!allowed.includes(detectedType)) {
+            return {
+                isValid: false,
+                error: `File type '${detectedType}' is not allowed. Allowed types: ${allowed.join(", ")}`,
+                detectedMimeType: detectedType,
+            };
+        }
+
+        return {
+            isValid: true,
+            detectedMimeType: detectedType,
+        };
+    }
+
+    validateImageDimensions(dimensions: ImageDimensions | null, options: ValidationOptions): ValidationResult {
+        if (!dimensions) {
+            return {
+                isValid: false,
+                error: "Could not read image dimensions. File may not be a valid image.",
+            };
+        }
+
+        if (options.minWidth && dimensions.width < options.minWidth) {
+            return {
+                isValid: false,
+                error: `Image width (${dimensions.width}px) is less than minimum (${options.minWidth}px)`,
+            };
+        }
+
+        if (options.maxWidth && dimensions.width > options.maxWidth) {
+            return {
+                isValid: false,
+                error: `Image width (${dimensions.width}px) exceeds maximum (${options.maxWidth}px)`,
+            };
+        }
+
+        if (options.minHeight && dimensions.height < options.minHeight) {
+            return {
+                isValid: false,
+                error: `Image height (${dimensions.height}px) is less than minimum (${options.minHeight}px)`,
+            };
+        }
+
+        if (options.maxHeight && dimensions.height > options.maxHeight) {
+            return {
+                isValid: false,
+                error: `Image height (${dimensions.height}px) exceeds maximum (${options.maxHeight}px)`,
+            };
+        }
+
+        return { isValid: true };
+    }
 }
@@ -1,19 +1,32 @@
-import { Storage } from "@google-cloud/storage";
+import { GetFilesOptions, Storage } from "@google-cloud/storage";
 import { Readable } from "stream";
+import { pipeline } from "stream/promises";
 import { Injectable } from "@nestjs/common";
 import {
+    BulkOperationResult,
+    ByteRange,
+    CopyPair,
     IStorageProvider,
+    StoredObjectInfo,
     UploadOptions,
     UploadResult,
 } from "@/domain/storage/application/providers/storage.provider";
+import { runBulkOperation } from "@/domain/storage/application/utils/run-bulk-operation";
+
+export interface GcpStorageProviderOptions {
+    /** Requests in flight for bulk deletes/copies (default: 16) */
+    bulkConcurrency?: number;
+}
 
 @Injectable()
 export class GcpStorageProvider implements IStorageProvider {
     private storage: Storage;
     private bucketName: string;
+    private bulkConcurrency: number;
 
-    constructor(bucketName: string, keyFilePath?: string) {
+    constructor(bucketName: string, keyFilePath?: string, options: GcpStorageProviderOptions = {}) {
         this.bucketName = bucketName;
+        this.bulkConcurrency = options.bulkConcurrency ?? 16;
 
         if (keyFilePath) {
             this.storage = new Storage({ keyFilename: keyFilePath });
@@ -28,36 +41,28 @@ export class GcpStorageProvider implements IStorageProvider {
 
     async uploadStream(stream: Readable, options: UploadOptions): Promise<UploadResult> {
         const file = this.bucket.file(options.path);
+        let uploadedSize = 0;
+
+        const writeStream = file.createWriteStream({
+            metadata: {
+                contentType: options.mimeType,
+                metadata: options.metadata,
+            },
+            resumable: true,
+        });
 
-        return new Promise((resolve, reject) => {
-            let uploadedSize = 0;
-
-            const writeStream = file.createWriteStream({
-                metadata: {
-                    contentType: options.mimeType,
-                    metadata: options.metadata,
-                },
-                resumable: true,
-            });
-
-            stream.on("data", (chunk: Buffer) => {
-                uploadedSize += chunk.length;
-            });
-
-            stream.pipe(writeStream);
-
-            writeStream.on("error", (error) => {
-                reject(error);
-            });
-
-            writeStream.on("finish", () => {
-                resolve({
-                    path: options.path,
-                    publicUrl: this.getPublicUrl(options.path),
-                    size: uploadedSize,
-                });
-            });
+        stream.on("data", (chunk: Buffer) => {
+            uploadedSize += chunk.length;
         });
+
+        // pipeline aborts the upload when the source fails (e.g. size limit exceeded mid-stream)
+        await pipeline(stream, writeStream);
+
+        return {
+            path: options.path,
+            publicUrl: this.getPublicUrl(options.path),
+            size: uploadedSize,
+        };
     }
 
     async uploadBuffer(buffer: Buffer, options: UploadOptions): Promise<UploadResult> {
@@ -79,12 +84,34 @@ export class GcpStorageProvider implements IStorageProvider {
     }
 
     async delete(path: string): Promise<void> {
-        const file = this.bucket.file(path);
-        const [exists] = await file.exists();
+        // A single request: a 404 means the file is already gone
+        await this.bucket.file(path).delete({ ignoreNotFound: true });
+    }
+
+    async deleteMany(paths: string[]): Promise<BulkOperationResult> {
+        return runBulkOperation([...new Set(paths)], this.bulkConcurrency, (path) => path, (path) => this.delete(path));
+    }
+
+    async deleteByPrefix(prefix: string): Promise<BulkOperationResult> {
+        if (!prefix) {
+            throw new Error("A prefix is required to delete by prefix");
+        }
+
+        const result: BulkOperationResult = { succeeded: [], failed: [] };
+        let query: GetFilesOptions | null = { prefix, autoPaginate: false, maxResults: 1000 };
+
+        // Delete page by page so huge prefixes never have to be listed in memory at once
+        while (query) {
+            const [files, nextQuery] = await this.bucket.getFiles(query);
+            const page = await this.deleteMany(files.map((file) => file.name));
+
+            result.succeeded.push(...page.succeeded);
+            result.failed.push(...page.failed);
 
-        if (exists) {
-            await file.delete();
+            query = (nextQuery as GetFilesOptions | undefined) ?? null;
         }
+
+        return result;
     }
 
     async exists(path: string): Promise<boolean> {
@@ -93,6 +120,27 @@ export class GcpStorageProvider implements IStorageProvider {
         return exists;
     }
 
+    async stat(path: string): Promise<StoredObjectInfo | null> {
+        try {
+            const [metadata] = await this.bucket.file(path).getMetadata();
+
+            return {
+                size: Number(metadata.size ?? 0),
+                etag: metadata.etag ?? `${metadata.generation}`,
+            };
+        } catch (error) {
+            if ((error as { code?: number }).code === 404) {
+                return null;
+            }
+            throw error;
+        }
+    }
+
+    async createReadStream(path: string, range?: ByteRange): Promise<Readable> {
+        // GCS ranges are inclusive, like ByteRange
+        return this.bucket.file(path).createReadStream(range ? { start: range.start, end: range.end } : {});
+    }
+
     async getSignedUrl(path: string, expiresInMinutes: number = 60): Promise<string> {
         const file = this.bucket.file(path);
 
@@ -114,4 +162,13 @@ export class GcpStorageProvider implements IStorageProvider {
 
         await sourceFile.copy(destinationFile);
     }
+
+    async copyMany(pairs: CopyPair[]): Promise<BulkOperationResult> {
+        return runBulkOperation(
+            pairs,
+            this.bulkConcurrency,
+            (pair) => pair.sourcePath,
+            (pair) => this.copy(pair.sourcePath, pair.destinationPath),
+        );
+    }
 }
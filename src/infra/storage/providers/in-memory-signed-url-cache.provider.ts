@@ -0,0 +1,135 @@
+import {
+    CachedSignedUrl,
+    ISignedUrlCacheProvider,
+    SignedUrlCacheKey,
+} from "@/domain/storage/application/providers/signed-url-cache.provider";
+
+export interface InMemorySignedUrlCacheOptions {
+    /** Approximate memory the cached URLs may use before the least recently used are evicted (default: 16MB) */
+    maxBytes?: number;
+}
+
+export interface SignedUrlCacheStats {
+    hits: number;
+    misses: number;
+    evictions: number;
+    entries: number;
+    bytes: number;
+}
+
+interface Entry {
+    path: string;
+    url: string;
+    expiresAt: number;
+    bytes: number;
+}
+
+/**
+ * Per-process LRU of signed URLs. Each replica keeps its own copy; implement
+ * ISignedUrlCacheProvider over a shared store (e.g. Redis) to share signatures between replicas.
+ */
+export class InMemorySignedUrlCacheProvider implements ISignedUrlCacheProvider {
+    private readonly maxBytes: number;
+
+    /** Map iteration order is the LRU order: oldest first */
+    private entries = new Map<string, Entry>();
+    private keysByPath = new Map<string, Set<string>>();
+    private bytes = 0;
+
+    private hits = 0;
+    private misses = 0;
+    private evictions = 0;
+
+    constructor(options: InMemorySignedUrlCacheOptions = {}) {
+        this.maxBytes = options.maxBytes ?? 16 * 1024 * 1024;
+    }
+
+    async get(key: SignedUrlCacheKey, validUntil: Date): Promise<string | null> {
+        const id = this.idOf(key);
+        const entry = this.entries.get(id);
+
+        if (!entry || entry.expiresAt < validUntil.getTime()) {
+            this.misses++;
+
+            // About to be replaced by a fresh signature
+            if (entry) this.remove(id);
+
+            return null;
+        }
+
+        this.hits++;
+        this.entries.delete(id);
+        this.entries.set(id, entry);
+
+        return entry.url;
+    }
+
+    async set(key: SignedUrlCacheKey, value: CachedSignedUrl): Promise<void> {
+        const id = this.idOf(key);
+
+        this.remove(id);
+
+        // Strings are UTF-16 in memory, plus a rough allowance for the entry objects
+        const entry: Entry = {
+            path: key.path,
+            url: value.url,
+            expiresAt: value.expiresAt.getTime(),
+            bytes: (id.length + key.path.length + value.url.length) * 2 + 64,
+        };
+
+        this.entries.set(id, entry);
+        this.bytes += entry.bytes;
+
+        let keys = this.keysByPath.get(key.path);
+
+        if (!keys) {
+            keys = new Set();
+            this.keysByPath.set(key.path, keys);
+        }
+
+        keys.add(id);
+
+        for (const oldest of this.entries.keys()) {
+            if (this.bytes <= this.maxBytes) break;
+
+            this.remove(oldest);
+            this.evictions++;
+        }
+    }
+
+    async invalidate(path: string): Promise<void> {
+        for (const id of [...(this.keysByPath.get(path) ?? [])]) {
+            this.remove(id);
+        }
+    }
+
+    stats(): SignedUrlCacheStats {
+        return {
+            hits: this.hits,
+            misses: this.misses,
+            evictions: this.evictions,
+            entries: this.entries.size,
+            bytes: this.bytes,
+        };
+    }
+
+    private idOf(key: SignedUrlCacheKey) {
+        return `${key.action}:${key.expiresInMinutes}:${key.path}`;
+    }
+
+    private remove(id: string) {
+        const entry = this.entries.get(id);
+
+        if (!entry) return;
+
+        this.entries.delete(id);
+        this.bytes -= entry.bytes;
+
+        const keys = this.keysByPath.get(entry.path);
+        keys?.delete(id);
+
+        if (keys?.size === 0) {
+            this.keysByPath.delete(entry.path);
+        }
+    }
+}
@@ -0,0 +1,309 @@
+import { createHash, randomUUID } from "crypto";
+import { createReadStream } from "fs";
+import { access, FileHandle, link, mkdir, open, readdir, rename, rm, stat } from "fs/promises";
+import { dirname, isAbsolute, join, relative, resolve, sep } from "path";
+import { Readable } from "stream";
+import { Injectable } from "@nestjs/common";
+import {
+    BulkOperationResult,
+    ByteRange,
+    CopyPair,
+    IStorageProvider,
+    StoredObjectInfo,
+    UploadOptions,
+    UploadResult,
+} from "@/domain/storage/application/providers/storage.provider";
+import { runBulkOperation } from "@/domain/storage/application/utils/run-bulk-operation";
+import { TempFile, writeTempFile } from "../utils/temp-file";
+
+export interface LocalStorageProviderOptions {
+    /** File operations in flight for bulk deletes/copies (default: 32) */
+    bulkConcurrency?: number;
+}
+
+/**
+ * Stores files under a local directory, using the storage path as the relative file path.
+ *
+ * Content is stored once per SHA-256 in ".blobs" and every path is a hard link to its blob,
+ * so identical uploads and copies take no extra space. Writes go to a temp file first and
+ * are published with an atomic rename. A blob is removed as soon as the last path linking it goes away.
+ *
+ * Meant for development and tests: there is no access control, so signed URLs are public URLs.
+ */
+@Injectable()
+export class LocalStorageProvider implements IStorageProvider {
+    private readonly rootDir: string;
+    private readonly blobsDir: string;
+    private readonly tempDir: string;
+    private readonly bulkConcurrency: number;
+
+    constructor(
+        rootDir: string,
+        private publicBaseUrl: string,
+        options: LocalStorageProviderOptions = {},
+    ) {
+        this.rootDir = resolve(rootDir);
+        this.blobsDir = join(this.rootDir, ".blobs");
+        this.tempDir = join(this.rootDir, ".tmp");
+        this.bulkConcurrency = options.bulkConcurrency ?? 32;
+    }
+
+    async uploadStream(stream: Readable, options: UploadOptions): Promise<UploadResult> {
+        const target = await this.prepareTarget(options.path);
+        const temp = await writeTempFile(stream, this.tempDir);
+
+        try {
+            await this.publish(temp, target);
+        } finally {
+            await rm(temp.path, { force: true });
+        }
+
+        return {
+            path: options.path,
+            publicUrl: this.getPublicUrl(options.path),
+            size: temp.size,
+        };
+    }
+
+    async uploadBuffer(buffer: Buffer, options: UploadOptions): Promise<UploadResult> {
+        return this.uploadStream(Readable.from(buffer), options);
+    }
+
+    async delete(path: string): Promise<void> {
+        const file = this.resolvePath(path);
+        await this.unlinking(file, () => rm(file, { force: true }));
+    }
+
+    async deleteMany(paths: string[]): Promise<BulkOperationResult> {
+        return runBulkOperation([...new Set(paths)], this.bulkConcurrency, (path) => path, (path) => this.delete(path));
+    }
+
+    async deleteByPrefix(prefix: string): Promise<BulkOperationResult> {
+        if (!prefix) {
+            throw new Error("A prefix is required to delete by prefix");
+        }
+
+        const paths: string[] = [];
+
+        // Only walk the deepest directory the prefix fully names
+        for await (const path of this.walk(this.resolvePath(dirname(`${prefix}_`)))) {
+            if (path.startsWith(prefix)) {
+                paths.push(path);
+            }
+        }
+
+        return this.deleteMany(paths);
+    }
+
+    async exists(path: string): Promise<boolean> {
+        try {
+            await access(this.resolvePath(path));
+            return true;
+        } catch {
+            return false;
+        }
+    }
+
+    async stat(path: string): Promise<StoredObjectInfo | null> {
+        try {
+            const stats = await stat(this.resolvePath(path));
+
+            if (!stats.isFile()) return null;
+
+            // Paths sharing a blob share the inode, so identical content gets the same ETag
+            return {
+                size: stats.size,
+                etag: [stats.ino, stats.size, Math.floor(stats.mtimeMs)].map((part) => part.toString(16)).join("-"),
+            };
+        } catch {
+            return null;
+        }
+    }
+
+    async createReadStream(path: string, range?: ByteRange): Promise<Readable> {
+        return createReadStream(this.resolvePath(path), range);
+    }
+
+    async getSignedUrl(path: string): Promise<string> {
+        return this.getPublicUrl(path);
+    }
+
+    getPublicUrl(path: string): string {
+        return `${this.publicBaseUrl.replace(/\/$/, "")}/${path}`;
+    }
+
+    async copy(sourcePath: string, destinationPath: string): Promise<void> {
+        // A copy is one more link to the same blob: no bytes are copied
+        const staged = await this.stage(this.resolvePath(sourcePath));
+        const target = await this.prepareTarget(destinationPath);
+
+        try {
+            await this.unlinking(target, () => rename(staged, target));
+        } finally {
+            await rm(staged, { force: true });
+        }
+    }
+
+    async copyMany(pairs: CopyPair[]): Promise<BulkOperationResult> {
+        return runBulkOperation(
+            pairs,
+            this.bulkConcurrency,
+            (pair) => pair.sourcePath,
+            (pair) => this.copy(pair.sourcePath, pair.destinationPath),
+        );
+    }
+
+    /**
+     * Remove every blob no path links to anymore. Deletes already remove their blob, so this full
+     * scan is only needed to recover from a process that stopped between the two steps.
+     */
+    async collectGarbage(): Promise<void> {
+        for await (const blob of this.walkFiles(this.blobsDir)) {
+            const stats = await stat(blob).catch(() => null);
+
+            if (stats?.nlink === 1) {
+                await rm(blob, { force: true });
+            }
+        }
+    }
+
+    /**
+     * Store the temp file's content as a blob (unless it already exists) and atomically
+     * point the target path at it
+     */
+    private async publish(temp: TempFile, target: string) {
+        const blob = this.blobPath(temp.hash);
+        await mkdir(dirname(blob), { recursive: true });
+
+        try {
+            await link(temp.path, blob);
+        } catch (error) {
+            // Identical content is already stored
+            if ((error as NodeJS.ErrnoException).code !== "EEXIST") throw error;
+        }
+
+        // Link the blob while the temp file still holds a reference, so a concurrent delete
+        // can't remove it; fall back to the temp file if the existing blob was just removed
+        const staged = await this.stage(blob).catch(() => this.stage(temp.path));
+
+        try {
+            // Overwriting a path may orphan its previous blob
+            await this.unlinking(target, () => rename(staged, target));
+        } finally {
+            await rm(staged, { force: true });
+        }
+    }
+
+    /**
+     * Create a hard link to the file in the temp directory, ready to be renamed into place
+     */
+    private async stage(file: string): Promise<string> {
+        await mkdir(this.tempDir, { recursive: true });
+
+        const staged = join(this.tempDir, randomUUID());
+        await link(file, staged);
+
+        return staged;
+    }
+
+    /**
+     * Run `unlink` (which removes or replaces `file`), then remove the blob that held the file's
+     * content if it was the last path linking it. Only that blob is looked at, never the whole store.
+     */
+    private async unlinking(file: string, unlink: () => Promise<unknown>): Promise<void> {
+        // Keep the content open so it can still be identified once the path is gone
+        const handle = await open(file, "r").catch(() => null);
+
+        try {
+            await unlink();
+
+            if (!handle) return;
+
+            // The path is gone either way: a blob left behind is only wasted space
+            await this.removeOrphanedBlob(handle).catch((error) =>
+                console.error("Failed to remove orphaned blob:", error),
+            );
+        } finally {
+            await handle?.close();
+        }
+    }
+
+    private async removeOrphanedBlob(handle: FileHandle): Promise<void> {
+        const stats = await handle.stat();
+
+        // Any other path (or a staged link) still holding the content keeps the count above one
+        if (stats.nlink !== 1) return;
+
+        const hash = createHash("sha256");
+
+        for await (const chunk of handle.createReadStream({ start: 0, autoClose: false })) {
+            hash.update(chunk);
+        }
+
+        // The remaining link must be this content's blob, not a file published without one
+        const blob = this.blobPath(hash.digest("hex"));
+        const blobStats = await stat(blob).catch(() => null);
+
+        if (blobStats?.ino === stats.ino && blobStats.nlink === 1) {
+            await rm(blob, { force: true });
+        }
+    }
+
+    private blobPath(hash: string): string {
+        return join(this.blobsDir, hash.slice(0, 2), hash);
+    }
+
+    /**
+     * Map a storage path to a file under the root directory, rejecting paths that escape it
+     * or point into the internal (dot-prefixed) folders
+     */
+    private resolvePath(path: string): string {
+        const absolute = resolve(this.rootDir, path);
+        const relativePath = relative(this.rootDir, absolute);
+
+        // ".." escapes the root, other dot-prefixed names are the internal folders
+        if (isAbsolute(relativePath) || relativePath.split(sep)[0].startsWith(".")) {
+            throw new Error(`Invalid storage path: ${path}`);
+        }
+
+        return absolute;
+    }
+
+    private async prepareTarget(path: string): Promise<string> {
+        const target = this.resolvePath(path);
+        await mkdir(dirname(target), { recursive: true });
+        return target;
+    }
+
+    /**
+     * Yield the storage paths of every file below a directory
+     */
+    private async *walk(directory: string): AsyncGenerator<string> {
+        for await (const file of this.walkFiles(directory)) {
+            yield relative(this.rootDir, file).split(sep).join("/");
+        }
+    }
+
+    private async *walkFiles(directory: string): AsyncGenerator<string> {
+        let entries;
+
+        try {
+            entries = await readdir(directory, { withFileTypes: true });
+        } catch {
+            return;
+        }
+
+        for (const entry of entries) {
+            const absolute = join(directory, entry.name);
+
+            if (entry.isDirectory()) {
+                // Internal folders are never part of a storage path walk
+                if (directory === this.rootDir && entry.name.startsWith(".")) continue;
+
+                yield* this.walkFiles(absolute);
+            } else {
+                yield absolute;
+            }
+        }
+    }
+}
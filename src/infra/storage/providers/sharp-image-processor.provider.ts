@@ -1,147 +1,130 @@
+import { cpus } from "os";
 import { Injectable } from "@nestjs/common";
 import sharp from "sharp";
+import { Semaphore } from "@/domain/@shared/utils/semaphore";
+import { ImageAnalysis } from "@/domain/storage/application/providers/file-validator.provider";
 import {
     IImageProcessorProvider,
+    ImageTransformResult,
+    ImageTransformStream,
     ResizeOptions,
     ProcessedImage,
     ThumbnailConfig,
 } from "@/domain/storage/application/providers/image-processor.provider";
 
+type OutputFormat = "jpeg" | "png" | "webp" | "avif";
+
+export interface SharpImageProcessorOptions {
+    /** Total libvips threads shared by all concurrent operations (default: available cores) */
+    threads?: number;
+    /** Image operations processed at the same time; the rest wait in a queue (default: half the thread budget) */
+    maxConcurrentOperations?: number;
+    /** libvips operation cache size in MB, 0 disables it (default: 50) */
+    cacheMemoryMb?: number;
+}
+
 @Injectable()
 export class SharpImageProcessorProvider implements IImageProcessorProvider {
     private readonly defaultQuality = 80;
+    private readonly operations: Semaphore;
+
+    constructor(options: SharpImageProcessorOptions = {}) {
+        const threads = options.threads ?? cpus().length;
+        const maxConcurrentOperations = options.maxConcurrentOperations ?? Math.max(1, Math.floor(threads / 2));
+        const cacheMemoryMb = options.cacheMemoryMb ?? 50;
+
+        // sharp settings are process-wide: split the thread budget across the concurrent operations
+        // so a burst of uploads can't oversubscribe the cores
+        sharp.concurrency(Math.max(1, Math.floor(threads / maxConcurrentOperations)));
+        sharp.cache(cacheMemoryMb > 0 ? { memory: cacheMemoryMb } : false);
+
+        this.operations = new Semaphore(maxConcurrentOperations);
+    }
 
     async resize(buffer: Buffer, options: ResizeOptions): Promise<ProcessedImage> {
-        let pipeline = sharp(buffer);
+        return this.operations.run(() =>
+            this.render(this.buildResizePipeline(sharp(buffer), options), options.format ?? "jpeg"),
+        );
+    }
 
-        pipeline = pipeline.resize({
-            width: options.width,
-            height: options.height,
-            fit: options.fit ?? "cover",
-            withoutEnlargement: true,
+    async resizeStream(options: ResizeOptions): Promise<ImageTransformStream> {
+        const mimeType = `image/${options.format ?? "jpeg"}`;
+        const pipeline = this.buildResizePipeline(sharp(), options);
+
+        // sharp emits "info" once the output has been produced
+        const result = new Promise<ImageTransformResult>((resolve, reject) => {
+            pipeline.once("info", (info: sharp.OutputInfo) =>
+                resolve({
+                    width: info.width,
+                    height: info.height,
+                    size: info.size,
+                    mimeType,
+                }),
+            );
+            pipeline.once("error", reject);
         });
 
-        const format = options.format ?? "jpeg";
-        const quality = options.quality ?? this.defaultQuality;
+        // Errors are surfaced through the stream itself; avoid an unhandled rejection when nobody awaits
+        result.catch(() => undefined);
 
-        switch (format) {
-            case "jpeg":
-                pipeline = pipeline.jpeg({ quality });
-                break;
-            case "png":
-                pipeline = pipeline.png({ quality });
-                break;
-            case "webp":
-                pipeline = pipeline.webp({ quality });
-                break;
-            case "avif":
-                pipeline = pipeline.avif({ quality });
-                break;
-        }
+        // Hold a processing slot from now until the stream is done, whatever the outcome. Callers destroy
+        // the stream when they end up not piping it, which releases the slot too.
+        const release = await this.operations.acquire();
 
-        const outputBuffer = await pipeline.toBuffer();
-        const metadata = await sharp(outputBuffer).metadata();
+        result.finally(release).catch(() => undefined);
+        pipeline.once("close", release);
 
-        return {
-            buffer: outputBuffer,
-            width: metadata.width ?? 0,
-            height: metadata.height ?? 0,
-            size: outputBuffer.length,
-            mimeType: `image/${format}`,
-        };
+        return { stream: pipeline, mimeType, result };
     }
 
     async generateThumbnails(
         buffer: Buffer,
         configs: ThumbnailConfig[],
     ): Promise<Map<string, ProcessedImage>> {
-        const results = new Map<string, ProcessedImage>();
-
-        await Promise.all(
-            configs.map(async (config) => {
-                const processed = await this.resize(buffer, {
-                    width: config.width,
-                    height: config.height,
-                    fit: config.fit ?? "cover",
-                });
-
-                results.set(config.name, processed);
-            }),
-        );
-
-        return results;
+        return this.operations.run(async () => {
+            // Every thumbnail is a clone of the same source instance instead of a new decode
+            const source = sharp(buffer);
+
+            const thumbnails = await Promise.all(
+                configs.map(async (config) => {
+                    const pipeline = this.buildResizePipeline(source.clone(), {
+                        width: config.width,
+                        height: config.height,
+                        fit: config.fit ?? "cover",
+                    });
+
+                    return [config.name, await this.render(pipeline, "jpeg")] as const;
+                }),
+            );
+
+            return new Map(thumbnails);
+        });
     }
 
-    async optimize(buffer: Buffer, quality?: number): Promise<ProcessedImage> {
-        const metadata = await sharp(buffer).metadata();
-        const format = metadata.format ?? "jpeg";
+    async optimize(buffer: Buffer, quality?: number, analysis?: ImageAnalysis): Promise<ProcessedImage> {
+        const sourceFormat = analysis?.format ?? (await sharp(buffer).metadata()).format;
 
-        let pipeline = sharp(buffer);
-        const q = quality ?? this.defaultQuality;
+        let format: OutputFormat;
 
-        switch (format) {
-            case "jpeg":
-            case "jpg":
-                pipeline = pipeline.jpeg({ quality: q });
-                break;
+        switch (sourceFormat) {
             case "png":
-                pipeline = pipeline.png({ quality: q });
-                break;
             case "webp":
-                pipeline = pipeline.webp({ quality: q });
-                break;
             case "avif":
-                pipeline = pipeline.avif({ quality: q });
+                format = sourceFormat;
                 break;
             default:
-                pipeline = pipeline.jpeg({ quality: q });
+                format = "jpeg";
         }
 
-        const outputBuffer = await pipeline.toBuffer();
-        const outputMetadata = await sharp(outputBuffer).metadata();
-
-        return {
-            buffer: outputBuffer,
-            width: outputMetadata.width ?? 0,
-            height: outputMetadata.height ?? 0,
-            size: outputBuffer.length,
-            mimeType: `image/${format === "jpg" ? "jpeg" : format}`,
-        };
+        return this.operations.run(() =>
+            this.render(this.encode(sharp(buffer), format, quality ?? this.defaultQuality), format),
+        );
     }
 
-    async convert(
-        buffer: Buffer,
-        format: "jpeg" | "png" | "webp" | "avif",
-        quality?: number,
-    ): Promise<ProcessedImage> {
-        let pipeline = sharp(buffer);
-        const q = quality ?? this.defaultQuality;
-
-        switch (format) {
-            case "jpeg":
-                pipeline = pipeline.jpeg({ quality: q });
-                break;
-            case "png":
-                pipeline = pipeline.png({ quality: q });
-                break;
-            case "webp":
-                pipeline = pipeline.webp({ quality: q });
-                break;
-            case "avif":
-                pipeline = pipeline.avif({ quality: q });
-                break;
-        }
-
-        const outputBuffer = await pipeline.toBuffer();
-        const metadata = await sharp(outputBuffer).metadata();
-
-        return {
-            buffer: outputBuffer,
-            width: metadata.width ?? 0,
-            height: metadata.height ?? 0,
-            size: outputBuffer.length,
-            mimeType: `image/${format}`,
-        };
+    async convert(buffer: Buffer, format: OutputFormat, quality?: number): Promise<ProcessedImage> {
+        return this.operations.run(() =>
+            this.render(this.encode(sharp(buffer), format, quality ?? this.defaultQuality), format),
+        );
     }
 
     async isValidImage(buffer: Buffer): Promise<boolean> {
@@ -176,4 +159,43 @@ export class SharpImageProcessorProvider implements IImageProcessorProvider {
             return null;
         }
     }
+
+    /**
+     * Run the pipeline and take the output dimensions from sharp's result instead of decoding the output again
+     */
+    private async render(pipeline: sharp.Sharp, format: OutputFormat): Promise<ProcessedImage> {
+        const { data, info } = await pipeline.toBuffer({ resolveWithObject: true });
+
+        return {
+            buffer: data,
+            width: info.width,
+            height: info.height,
+            size: data.length,
+            mimeType: `image/${format}`,
+        };
+    }
+
+    private buildResizePipeline(pipeline: sharp.Sharp, options: ResizeOptions): sharp.Sharp {
+        pipeline = pipeline.resize({
+            width: options.width,
+            height: options.height,
+            fit: options.fit ?? "cover",
+            withoutEnlargement: true,
+        });
+
+        return this.encode(pipeline, options.format ?? "jpeg", options.quality ?? this.defaultQuality);
+    }
+
+    private encode(pipeline: sharp.Sharp, format: OutputFormat, quality: number): sharp.Sharp {
+        switch (format) {
+            case "jpeg":
+                return pipeline.jpeg({ quality });
+            case "png":
+                return pipeline.png({ quality });
+            case "webp":
+                return pipeline.webp({ quality });
+            case "avif":
+                return pipeline.avif({ quality });
+        }
+    }
 }
@@ -0,0 +1,43 @@
+import { createHash, randomUUID } from "crypto";
+import { createWriteStream } from "fs";
+import { mkdir, rm } from "fs/promises";
+import { join } from "path";
+import { Readable, Transform } from "stream";
+import { pipeline } from "stream/promises";
+
+export interface TempFile {
+    path: string;
+    size: number;
+    /** Hex SHA-256 of the content */
+    hash: string;
+}
+
+/**
+ * Write a stream to a new file in `tempDir`, hashing it on the way.
+ * Callers publish it with `rename`, which is atomic on the same filesystem, so readers
+ * never observe a partially written file. The temp file is removed if writing fails.
+ */
+export async function writeTempFile(source: Readable, tempDir: string): Promise<TempFile> {
+    await mkdir(tempDir, { recursive: true });
+
+    const path = join(tempDir, randomUUID());
+    const hash = createHash("sha256");
+    let size = 0;
+
+    const digest = new Transform({
+        transform(chunk: Buffer, _encoding, callback) {
+            hash.update(chunk);
+            size += chunk.length;
+            callback(null, chunk);
+        },
+    });
+
+    try {
+        await pipeline(source, digest, createWriteStream(path));
+    } catch (error) {
+        await rm(path, { force: true });
+        throw error;
+    }
+
+    return { path, size, hash: hash.digest("hex") };
+}
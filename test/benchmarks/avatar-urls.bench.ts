@@ -0,0 +1,148 @@
+/**
+ * Compares resolving the avatar URLs of a user list page row by row (one files query per user, the
+ * previous behavior) with the FileUrlLoader batch (one query per page), for pages of 10 and 100 users.
+ * Pages are requested concurrently, so the per-row strategy also competes for the pg pool.
+ *
+ * Seeds BENCH_USERS file rows (default: 100) under the "bench_user" entity type and removes them at the end.
+ *
+ * Usage: DATABASE_URL=... npm run bench:avatar-urls
+ */
+import type { Env } from "@/env/env";
+import { FilesRepository } from "@/domain/storage/application/repositories/files.repository";
+import { IStorageProvider } from "@/domain/storage/application/providers/storage.provider";
+import { GetFileUrlUseCase } from "@/domain/storage/application/use-cases/get-file-url.use-case";
+import { FileUrlLoader } from "@/http/@shared/loaders/file-url.loader";
+import { PrismaService } from "@/infra/database/prisma/prisma.service";
+import { PrismaFilesRepository } from "@/infra/database/repositories/prisma/prisma-files.repository";
+import { InMemorySignedUrlCacheProvider } from "@/infra/storage/providers/in-memory-signed-url-cache.provider";
+import { ConfigService } from "@nestjs/config";
+import { randomUUID } from "crypto";
+
+const USERS = Number(process.env.BENCH_USERS ?? 100);
+const PAGE_SIZES = [10, 100];
+const PAGES = Number(process.env.BENCH_PAGES ?? 200);
+const CONCURRENCY = Number(process.env.BENCH_CONCURRENCY ?? 20);
+const ENTITY_TYPE = "bench_user";
+
+const percentile = (sorted: number[], p: number) => sorted[Math.min(sorted.length - 1, Math.floor(sorted.length * p))];
+
+const prisma = new PrismaService(new ConfigService<Env, true>());
+
+/**
+ * Counts repository calls: each one is a single SQL query
+ */
+function countQueries(repository: FilesRepository) {
+    const counter = { queries: 0 };
+
+    const counted = new Proxy(repository, {
+        get(target, property, receiver) {
+            const value = Reflect.get(target, property, receiver);
+
+            if (typeof value !== "function") return value;
+
+            return (...args: unknown[]) => {
+                counter.queries++;
+                return value.apply(target, args);
+            };
+        },
+    });
+
+    return { counted, counter };
+}
+
+async function seed(): Promise<string[]> {
+    const userIds = Array.from({ length: USERS }, () => randomUUID());
+
+    await prisma.file.createMany({
+        data: userIds.map((entityId) => ({
+            entityType: ENTITY_TYPE,
+            entityId,
+            field: "avatar",
+            filename: "avatar.webp",
+            path: `bench/2026/01/${ENTITY_TYPE}/${entityId}/avatar.webp`,
+            mimeType: "image/webp",
+            size: 1024,
+        })),
+    });
+
+    return userIds;
+}
+
+async function measure(
+    name: string,
+    pageSize: number,
+    userIds: string[],
+    resolvePage: (ids: string[]) => Promise<unknown>,
+) {
+    const timings: number[] = [];
+    let remaining = PAGES;
+
+    await Promise.all(
+        Array.from({ length: CONCURRENCY }, async () => {
+            while (remaining-- > 0) {
+                const offset = Math.floor(Math.random() * (userIds.length - pageSize + 1));
+                const start = performance.now();
+                await resolvePage(userIds.slice(offset, offset + pageSize));
+                timings.push(performance.now() - start);
+            }
+        }),
+    );
+
+    timings.sort((a, b) => a - b);
+
+    const p50 = percentile(timings, 0.5).toFixed(2).padStart(8);
+    const p99 = percentile(timings, 0.99).toFixed(2).padStart(8);
+
+    return `${name.padEnd(8)} p50 ${p50} ms   p99 ${p99} ms`;
+}
+
+async function main() {
+    await prisma.$connect();
+
+    const userIds = await seed();
+
+    try {
+        const { counted, counter } = countQueries(new PrismaFilesRepository(prisma));
+        const storageProvider = {
+            getPublicUrl: (path: string) => `https://cdn.example.com/${path}`,
+        } as IStorageProvider;
+        const getFileUrlUseCase = new GetFileUrlUseCase(
+            counted,
+            storageProvider,
+            new InMemorySignedUrlCacheProvider(),
+        );
+
+        const perRow = (ids: string[]) =>
+            Promise.all(
+                ids.map((entityId) =>
+                    getFileUrlUseCase.execute({ entityType: ENTITY_TYPE, entityId, field: "avatar" }),
+                ),
+            );
+
+        const batched = (ids: string[]) => {
+            const loader = new FileUrlLoader(getFileUrlUseCase, { entityType: ENTITY_TYPE, field: "avatar" });
+            return loader.loadMany(ids);
+        };
+
+        // Warm up the pool and the plan cache
+        await perRow(userIds.slice(0, 10));
+        await batched(userIds.slice(0, 10));
+
+        for (const pageSize of PAGE_SIZES.filter((size) => size <= USERS)) {
+            console.log(`\nPages of ${pageSize} users (${PAGES} pages, ${CONCURRENCY} concurrent)`);
+
+            for (const [name, resolvePage] of [
+                ["per-row", perRow],
+                ["batched", batched],
+            ] as const) {
+                counter.queries = 0;
+                const line = await measure(name, pageSize, userIds, resolvePage);
+                console.log(`${line}   ${(counter.queries / PAGES).toFixed(0).padStart(4)} queries/page`);
+            }
+        }
+    } finally {
+        await prisma.file.deleteMany({ where: { entityType: ENTITY_TYPE } });
+    }
+}
+
+main().finally(() => prisma.$disconnect());
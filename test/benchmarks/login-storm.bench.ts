@@ -0,0 +1,100 @@
+/**
+ * Fires a burst of concurrent password logins while a probe keeps calling GET /users/:id, and reports
+ * the event loop lag and the probe latency during the storm.
+ *
+ * Compare hashing on the main thread (the previous behavior) with the worker pool:
+ *   PASSWORD_HASH_THREADS=0 npm run bench:login-storm
+ *   npm run bench:login-storm
+ *
+ * Boots the application against the database configured in .env and creates a benchmark user.
+ */
+import { AppModule } from "@/http/app.module";
+import { NestFactory } from "@nestjs/core";
+import { ZodValidationPipe } from "nestjs-zod";
+import { monitorEventLoopDelay } from "perf_hooks";
+
+const LOGINS = Number(process.env.BENCH_LOGINS ?? 200);
+const CONCURRENCY = Number(process.env.BENCH_CONCURRENCY ?? 50);
+const PASSWORD = "benchmark-password";
+
+const percentile = (sorted: number[], p: number) => sorted[Math.min(sorted.length - 1, Math.floor(sorted.length * p))];
+
+async function main() {
+    const app = await NestFactory.create(AppModule, { logger: false });
+    app.useGlobalPipes(new ZodValidationPipe());
+    await app.listen(0);
+
+    const baseUrl = (await app.getUrl()).replace("[::1]", "localhost");
+    const suffix = Date.now().toString(36);
+    const credentials = { email: `bench_${suffix}@example.com`, password: PASSWORD };
+
+    const login = () =>
+        fetch(`${baseUrl}/auth/login`, {
+            method: "POST",
+            headers: { "Content-Type": "application/json" },
+            body: JSON.stringify(credentials),
+        });
+
+    await fetch(`${baseUrl}/users`, {
+        method: "POST",
+        headers: { "Content-Type": "application/json" },
+        body: JSON.stringify({ username: `bench_${suffix}`, ...credentials }),
+    });
+
+    const { user, accessToken } = await (await login()).json();
+
+    const lag = monitorEventLoopDelay({ resolution: 10 });
+    const probeLatencies: number[] = [];
+    const statuses = new Map<number, number>();
+    let storming = true;
+
+    const probe = async () => {
+        while (storming) {
+            const start = performance.now();
+            await fetch(`${baseUrl}/users/${user.id}`, { headers: { Authorization: `Bearer ${accessToken}` } });
+            probeLatencies.push(performance.now() - start);
+        }
+    };
+
+    const storm = async () => {
+        let remaining = LOGINS;
+
+        await Promise.all(
+            Array.from({ length: CONCURRENCY }, async () => {
+                while (remaining-- > 0) {
+                    const response = await login();
+                    await response.arrayBuffer();
+                    statuses.set(response.status, (statuses.get(response.status) ?? 0) + 1);
+                }
+            }),
+        );
+
+        storming = false;
+    };
+
+    lag.enable();
+    const startedAt = performance.now();
+
+    await Promise.all([probe(), storm()]);
+
+    const elapsed = performance.now() - startedAt;
+    lag.disable();
+
+    probeLatencies.sort((a, b) => a - b);
+
+    console.log(`Hashing threads: ${process.env.PASSWORD_HASH_THREADS ?? "available cores"}`);
+    console.log(`Logins: ${LOGINS} (${CONCURRENCY} concurrent) in ${elapsed.toFixed(0)} ms`);
+    console.log("Login responses by status:", Object.fromEntries(statuses));
+    console.log(
+        `Event loop lag: p50 ${(lag.percentile(50) / 1e6).toFixed(1)} ms, ` +
+            `p99 ${(lag.percentile(99) / 1e6).toFixed(1)} ms, max ${(lag.max / 1e6).toFixed(1)} ms`,
+    );
+    console.log(
+        `GET /users/:id (${probeLatencies.length} requests): p50 ${percentile(probeLatencies, 0.5).toFixed(1)} ms, ` +
+            `p99 ${percentile(probeLatencies, 0.99).toFixed(1)} ms`,
+    );
+
+    await app.close();
+}
+
+main();
@@ -0,0 +1,54 @@
+/**
+ * Compares the cost of signing a V4 URL (RSA-SHA256, as GCS does locally with a key file)
+ * with a lookup in the signed URL cache.
+ *
+ * Usage: npm run bench:signed-url
+ */
+import { createSign, generateKeyPairSync } from "crypto";
+import { InMemorySignedUrlCacheProvider } from "@/infra/storage/providers/in-memory-signed-url-cache.provider";
+
+const ITERATIONS = 5_000;
+const PATHS = 1_000;
+
+const { privateKey } = generateKeyPairSync("rsa", { modulusLength: 2048 });
+
+const paths = Array.from({ length: PATHS }, (_, i) => `production/2026/01/user/user-${i}/avatar.webp`);
+
+const sign = (path: string) => {
+    const signer = createSign("RSA-SHA256");
+    signer.update(`GET\n/bucket/${path}\nX-Goog-Expires=3600\nhost:storage.googleapis.com`);
+    return `https://storage.googleapis.com/bucket/${path}?X-Goog-Signature=${signer.sign(privateKey, "hex")}`;
+};
+
+const measure = async (name: string, run: (i: number) => unknown) => {
+    const start = process.hrtime.bigint();
+
+    for (let i = 0; i < ITERATIONS; i++) {
+        await run(i);
+    }
+
+    const elapsedNs = Number(process.hrtime.bigint() - start);
+    const perOpUs = elapsedNs / ITERATIONS / 1000;
+
+    const opsPerSecond = Math.round(1e6 / perOpUs).toLocaleString();
+
+    console.log(`${name.padEnd(12)} ${perOpUs.toFixed(2).padStart(10)} µs/op ${opsPerSecond.padStart(12)} ops/s`);
+};
+
+async function main() {
+    const cache = new InMemorySignedUrlCacheProvider();
+    const expiresAt = new Date(Date.now() + 60 * 60 * 1000);
+    const validUntil = new Date(Date.now() + 30 * 60 * 1000);
+    const keyOf = (i: number) => ({ path: paths[i % PATHS], action: "read" as const, expiresInMinutes: 60 });
+
+    for (let i = 0; i < PATHS; i++) {
+        await cache.set(keyOf(i), { url: sign(paths[i]), expiresAt });
+    }
+
+    await measure("sign", (i) => sign(paths[i % PATHS]));
+    await measure("cache hit", (i) => cache.get(keyOf(i), validUntil));
+
+    console.log(cache.stats());
+}
+
+main();
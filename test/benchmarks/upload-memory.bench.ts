@@ -0,0 +1,109 @@
+/**
+ * Uploads a batch of large images at the same time and reports the peak RSS above the idle baseline,
+ * per upload. Streaming uploads should stay within a few chunks each (plus the image header sample),
+ * whatever the file size; buffered uploads grow with it.
+ *
+ * RSS rarely shrinks back once grown, so run each mode in its own process:
+ *   UPLOAD_MODE=buffer npm run bench:upload-memory
+ *   UPLOAD_MODE=stream npm run bench:upload-memory
+ *
+ * Storage and the files repository are in-memory stand-ins: only the upload pipeline is measured.
+ */
+import { createReadStream } from "fs";
+import { mkdtemp, readFile, rm, stat } from "fs/promises";
+import { tmpdir } from "os";
+import { join } from "path";
+import { randomBytes } from "crypto";
+import sharp from "sharp";
+import { Readable } from "stream";
+import { UploadFileUseCase } from "@/domain/storage/application/use-cases/upload-file.use-case";
+import { FilesRepository } from "@/domain/storage/application/repositories/files.repository";
+import { IStorageProvider } from "@/domain/storage/application/providers/storage.provider";
+import { File } from "@/domain/storage/enterprise/entities/file.entity";
+import { FileValidatorProvider } from "@/infra/storage/providers/file-validator.provider";
+import { SharpImageProcessorProvider } from "@/infra/storage/providers/sharp-image-processor.provider";
+
+const MODE = process.env.UPLOAD_MODE === "buffer" ? "buffer" : "stream";
+const UPLOADS = Number(process.env.BENCH_UPLOADS ?? 20);
+const WIDTH = 3000;
+const HEIGHT = 2000;
+
+const MB = 1024 * 1024;
+
+/** Discards the content, like a remote bucket would from this process' point of view */
+const storageProvider = {
+    uploadStream: async (stream: Readable, { path }: { path: string }) => {
+        let size = 0;
+        for await (const chunk of stream) {
+            size += chunk.length;
+        }
+        return { path, publicUrl: path, size };
+    },
+} as unknown as IStorageProvider;
+
+const filesRepository = {
+    findByEntityAndField: async () => null,
+    create: async (file: File) => file,
+} as unknown as FilesRepository;
+
+async function main() {
+    const dir = await mkdtemp(join(tmpdir(), "upload-memory-"));
+    const imagePath = join(dir, "noise.png");
+
+    try {
+        // Noise barely compresses, so the PNG stays close to its raw size
+        await sharp(randomBytes(WIDTH * HEIGHT * 3), { raw: { width: WIDTH, height: HEIGHT, channels: 3 } })
+            .png({ compressionLevel: 1 })
+            .toFile(imagePath);
+
+        const { size: fileSize } = await stat(imagePath);
+
+        const sut = new UploadFileUseCase(
+            filesRepository,
+            storageProvider,
+            new FileValidatorProvider(),
+            new SharpImageProcessorProvider(),
+        );
+
+        const baseline = process.memoryUsage().rss;
+        let peak = baseline;
+
+        const sampler = setInterval(() => {
+            peak = Math.max(peak, process.memoryUsage().rss);
+        }, 5);
+
+        const start = process.hrtime.bigint();
+
+        const results = await Promise.all(
+            Array.from({ length: UPLOADS }, async (_, i) => {
+                const base = {
+                    entityType: "bench_user",
+                    entityId: `user-${i}`,
+                    field: "photo",
+                    filename: "noise.png",
+                    environment: "benchmark",
+                    validationOptions: { allowedMimeTypes: ["image/png"], maxSizeBytes: 100 * MB },
+                };
+
+                return MODE === "buffer"
+                    ? sut.execute({ ...base, buffer: await readFile(imagePath) })
+                    : sut.execute({ ...base, stream: createReadStream(imagePath) });
+            }),
+        );
+
+        const elapsedMs = Number(process.hrtime.bigint() - start) / 1e6;
+        clearInterval(sampler);
+
+        const failed = results.filter((result) => result.isLeft()).length;
+        const growth = (peak - baseline) / MB;
+        const perUpload = growth / UPLOADS;
+
+        console.log(`mode ${MODE}: ${UPLOADS} concurrent uploads of a ${(fileSize / MB).toFixed(1)}MB PNG`);
+        console.log(`peak RSS above baseline: ${growth.toFixed(1)}MB total, ${perUpload.toFixed(2)}MB per upload`);
+        console.log(`elapsed: ${elapsedMs.toFixed(0)}ms, failed: ${failed}`);
+    } finally {
+        await rm(dir, { recursive: true, force: true });
+    }
+}
+
+main();
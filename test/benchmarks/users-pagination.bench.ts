@@ -0,0 +1,86 @@
+/**
+ * Compares the latency of a deep page of GET /users with offset and keyset (cursor) pagination.
+ * Seeds the users table up to BENCH_USERS rows (default: 1M) the first time it runs.
+ *
+ * Run it against a throwaway database: the seeded users are kept.
+ *
+ * Usage: DATABASE_URL=... npm run bench:users-pagination
+ */
+import { PrismaPg } from "@prisma/adapter-pg";
+import { PrismaClient } from "@prisma/client";
+
+const USERS = Number(process.env.BENCH_USERS ?? 1_000_000);
+const PAGE = 1_000;
+const LIMIT = 10;
+const RUNS = 20;
+const SEED_BATCH = 50_000;
+
+const select = { id: true, username: true, email: true, roles: true, createdAt: true };
+const orderBy = [{ createdAt: "asc" as const }, { id: "asc" as const }];
+
+const prisma = new PrismaClient({ adapter: new PrismaPg({ connectionString: process.env.DATABASE_URL }) });
+
+async function seed() {
+    const existing = await prisma.user.count();
+
+    for (let from = existing; from < USERS; from += SEED_BATCH) {
+        const to = Math.min(from + SEED_BATCH, USERS) - 1;
+
+        await prisma.$executeRaw`
+            INSERT INTO "users" ("id", "username", "email", "roles", "created_at", "updated_at")
+            SELECT gen_random_uuid()::text, 'bench_' || n, 'bench_' || n || '@example.com', ARRAY['USER']::"ROLES"[],
+                   now() - make_interval(secs => ${USERS} - n), now()
+            FROM generate_series(${from}::int, ${to}::int) AS n
+            ON CONFLICT DO NOTHING`;
+
+        console.log(`Seeded ${to + 1}/${USERS} users`);
+    }
+
+    await prisma.$executeRaw`ANALYZE "users"`;
+}
+
+async function measure(name: string, query: () => Promise<unknown>) {
+    // Warm up the connection and the buffer cache
+    await query();
+
+    const timings: number[] = [];
+
+    for (let i = 0; i < RUNS; i++) {
+        const start = process.hrtime.bigint();
+        await query();
+        timings.push(Number(process.hrtime.bigint() - start) / 1e6);
+    }
+
+    timings.sort((a, b) => a - b);
+
+    const p50 = timings[Math.floor(RUNS / 2)];
+    const p95 = timings[Math.floor(RUNS * 0.95)];
+
+    console.log(`${name.padEnd(8)} p50 ${p50.toFixed(2).padStart(8)} ms   p95 ${p95.toFixed(2).padStart(8)} ms`);
+}
+
+async function main() {
+    await seed();
+
+    const skip = (PAGE - 1) * LIMIT;
+
+    // Last user of the previous page: what the client's cursor points at
+    const [last] = await prisma.user.findMany({ select, orderBy, skip: skip - 1, take: 1 });
+
+    console.log(`Page ${PAGE} (${LIMIT} per page) of ${USERS} users`);
+
+    await measure("offset", () => prisma.user.findMany({ select, orderBy, skip, take: LIMIT }));
+    await measure("cursor", () =>
+        prisma.user.findMany({
+            select,
+            where: {
+                createdAt: { gte: last.createdAt },
+                OR: [{ createdAt: { gt: last.createdAt } }, { id: { gt: last.id } }],
+            },
+            orderBy,
+            take: LIMIT,
+        }),
+    );
+}
+
+main().finally(() => prisma.$disconnect());